@@ -0,0 +1,77 @@
+"""Columnar decoding and encoding of 96-bit EPCs compared to one tag at a time.
+
+Run using `python -m benchmarks.columnar`, requires numpy.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from epcpy.epc_schemes import SGTIN
+from epcpy.epc_schemes.sgtin import SGTINFilterValue
+from epcpy.utils.columnar import LAYOUTS_96, decode_96, encode_96, to_hex
+from epcpy.utils.parsers import bytes_to_tag_encodables
+
+
+def random_tags(count: int, seed: int = 0) -> np.ndarray:
+    """Create random 96-bit tags with a header of a supported scheme
+
+    Args:
+        count (int): Number of tags
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        np.ndarray: uint8 array of shape (count, 12)
+    """
+    rng = np.random.default_rng(seed)
+    tags = rng.integers(0, 256, (count, 12), dtype=np.uint8)
+    tags[:, 0] = rng.choice(list(LAYOUTS_96), count)
+
+    return tags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    tags = random_tags(args.count)
+
+    start = time.perf_counter()
+    columns = decode_96(tags)
+    columnar = time.perf_counter() - start
+
+    sample = tags[: min(args.count, 100_000)]
+    start = time.perf_counter()
+    bytes_to_tag_encodables([row.tobytes() for row in sample])
+    scalar = (time.perf_counter() - start) * args.count / len(sample)
+
+    print(f"decode tags:     {args.count} ({int(columns.valid.sum())} valid)")
+    print(f"decode columnar: {columnar:.2f}s ({args.count / columnar:,.0f} tags/s)")
+    print(
+        f"decode scalar:   {scalar:.2f}s ({args.count / scalar:,.0f} tags/s, extrapolated)"
+    )
+
+    serials = np.arange(args.count, dtype=np.uint64)
+
+    start = time.perf_counter()
+    to_hex(encode_96(SGTIN.BinaryCodingScheme.SGTIN_96, 1, 614141, 7, 812345, serials))
+    columnar = time.perf_counter() - start
+
+    sample = serials[: min(args.count, 100_000)]
+    start = time.perf_counter()
+    for serial in sample:
+        SGTIN(f"urn:epc:id:sgtin:0614141.812345.{serial}").hex(
+            SGTIN.BinaryCodingScheme.SGTIN_96, SGTINFilterValue.POS_ITEM
+        )
+    scalar = (time.perf_counter() - start) * args.count / len(sample)
+
+    print(f"encode columnar: {columnar:.2f}s ({args.count / columnar:,.0f} tags/s)")
+    print(
+        f"encode scalar:   {scalar:.2f}s ({args.count / scalar:,.0f} tags/s, extrapolated)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Cost of loading a company prefix table into a trie and of resolving company prefix lengths,
+compared to probing a dict of prefixes for every prefix length, and lookups during a reload.
+
+Run using `python -m benchmarks.company_prefix`.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from epcpy.epc_schemes import SGTIN
+from epcpy.utils.company_prefix import (
+    MAX_COMPANY_PREFIX_LENGTH,
+    CompanyPrefixTable,
+    configure_company_prefixes,
+    read_company_prefixes,
+)
+
+
+def company_prefixes(count: int, seed: int = 0) -> List[Tuple[str, int]]:
+    """Create distinct random company prefixes of 6 up to 11 digits
+
+    Args:
+        count (int): Number of company prefixes
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        List[Tuple[str, int]]: Company prefixes and their lengths
+    """
+    rnd = random.Random(seed)
+    prefixes: Dict[str, int] = {}
+
+    while len(prefixes) < count:
+        length = rnd.randint(6, 11)
+        prefix = str(rnd.randrange(10**length)).zfill(length)
+        prefixes[prefix] = length
+
+    return list(prefixes.items())
+
+
+def dict_lookup(prefixes: Dict[str, int]) -> Callable[[str], Optional[int]]:
+    """Lookup of the longest prefix by probing a dict for every prefix length
+
+    Args:
+        prefixes (Dict[str, int]): Company prefix lengths by prefix
+
+    Returns:
+        Callable[[str], Optional[int]]: Lookup of the company prefix length of digits
+    """
+
+    def lookup(digits: str) -> Optional[int]:
+        for length in range(MAX_COMPANY_PREFIX_LENGTH, 0, -1):
+            result = prefixes.get(digits[:length])
+            if result is not None:
+                return result or None
+
+        return None
+
+    return lookup
+
+
+def microseconds(function: Callable[[str], object], keys: List[str]) -> float:
+    """Average duration of a call over the keys
+
+    Args:
+        function (Callable[[str], object]): Lookup
+        keys (List[str]): Leading digits of GS1 keys
+
+    Returns:
+        float: Average duration in microseconds
+    """
+
+    def call() -> None:
+        for key in keys:
+            function(key)
+
+    return min(timeit.repeat(call, number=1, repeat=5)) / len(keys) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=1_000_000)
+    parser.add_argument("-l", "--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    entries = company_prefixes(args.count)
+    rnd = random.Random(1)
+    hits = [
+        f"{prefix}{rnd.randrange(10**12):012}"[:13]
+        for prefix, _ in rnd.sample(entries, min(args.lookups, len(entries)))
+    ]
+    misses = [f"{rnd.randrange(10**13):013}" for _ in range(len(hits))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "prefixes.csv")
+        with open(path, "w") as f:
+            f.writelines(f"{prefix},{length}\n" for prefix, length in entries)
+
+        start = time.perf_counter()
+        list(read_company_prefixes(path))
+        read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = CompanyPrefixTable(path)
+        load = time.perf_counter() - start
+        trie = table.trie
+
+        start = time.perf_counter()
+        future = table.reload_in_background()
+        latencies = []
+        while not future.done():
+            lookup_start = time.perf_counter()
+            table.lookup(hits[len(latencies) % len(hits)])
+            latencies.append(time.perf_counter() - lookup_start)
+        future.result()
+        reload = time.perf_counter() - start
+
+    prefixes = dict(entries)
+    dict_size = sys.getsizeof(prefixes) + sum(map(sys.getsizeof, prefixes))
+    print(
+        f"entries: {len(trie):,}, trie size: {trie.nbytes / 2**20:.1f} MiB, "
+        f"dict size: {dict_size / 2**20:.1f} MiB"
+    )
+    print(f"read csv: {read:.2f}s, read csv and build trie: {load:.2f}s")
+    print(
+        f"background reload: {reload:.2f}s, {len(latencies):,} lookups during the reload, "
+        f"median {statistics.median(latencies) * 1e6:.2f}us, max {max(latencies) * 1e3:.2f}ms"
+    )
+
+    lookup = dict_lookup(prefixes)
+    for kind, keys in (("hit", hits), ("miss", misses)):
+        before = microseconds(lookup, keys)
+        after = microseconds(trie.lookup, keys)
+        print(
+            f"lookup {kind:<4} dict probing: {before:.2f}us, trie: {after:.2f}us ({before / after:.2f}x)"
+        )
+
+    configure_company_prefixes(trie)
+    element_strings = [
+        f"(01)0{key[:12]}0(21)1" for key in hits[: min(len(hits), 10_000)]
+    ]
+    explicit = microseconds(
+        lambda s: SGTIN.from_gs1_element_string(s, 7), element_strings
+    )
+    resolved = microseconds(SGTIN.from_gs1_element_string, element_strings)
+    print(
+        f"SGTIN.from_gs1_element_string explicit length: {explicit:.2f}us, resolved: {resolved:.2f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Cost of identifying, validating and splitting GS1 element strings by dispatching on their
+application identifiers, compared to probing the regexes of all schemes.
+
+Run using `python -m benchmarks.gs1_element_string`.
+"""
+
+import argparse
+import re
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from epcpy.utils import regex
+from epcpy.utils.common import ConvertException
+from epcpy.utils.parsers import gs1_element_string_to_gs1_element
+from epcpy.utils.tokenizers import (
+    GS1_ELEMENT_STRING_TOKENIZERS,
+    gs1_element_string_identifier,
+)
+
+ELEMENT_STRINGS: Dict[str, str] = {
+    "sgtin": "(01)80614141123458(21)6789",
+    "sscc": "(00)106141412345678908",
+    "grai": "(8003)00614141123452ABC",
+    "cpi": "(8010)061414112-456(8011)123456789",
+    "lgtin": "(01)70614141123451(10)ABC",
+    "invalid": "(01)80614141123458(21)67 89",
+}
+
+GS1_ELEMENT_STRING_PATTERNS = [
+    (identifier, re.compile(getattr(regex, f"{identifier.upper()}_GS1_ELEMENT_STRING")))
+    for identifier in GS1_ELEMENT_STRING_TOKENIZERS
+]
+
+
+AI_SEPARATOR = re.compile(r"\(\d{2,4}\)")
+
+
+def probe(element_string: str) -> Optional[List[str]]:
+    """Identify a GS1 element string by probing the regexes of all schemes, then validate it
+    again and split its element values on the application identifiers
+
+    Args:
+        element_string (str): GS1 element string
+
+    Returns:
+        Optional[List[str]]: Element values, None if the element string is invalid
+    """
+    for _, pattern in GS1_ELEMENT_STRING_PATTERNS:
+        if pattern.fullmatch(element_string):
+            if not pattern.fullmatch(element_string):
+                return None
+
+            return AI_SEPARATOR.split(element_string)[1:]
+
+    return None
+
+
+def tokenize(element_string: str) -> Optional[Tuple[str, ...]]:
+    """Identify a GS1 element string by its application identifiers, then validate it and
+    extract its element values
+
+    Args:
+        element_string (str): GS1 element string
+
+    Returns:
+        Optional[Tuple[str, ...]]: Element values, None if the element string is invalid
+    """
+    identifier = gs1_element_string_identifier(element_string)
+    if identifier is None:
+        return None
+
+    return GS1_ELEMENT_STRING_TOKENIZERS[identifier].tokenize(element_string)
+
+
+def microseconds(function: Callable[[str], object], source: str, number: int) -> float:
+    """Average duration of a call, including raised ConvertExceptions
+
+    Args:
+        function (Callable[[str], object]): Parser
+        source (str): GS1 element string
+        number (int): Number of calls
+
+    Returns:
+        float: Average duration in microseconds
+    """
+
+    def call() -> None:
+        try:
+            function(source)
+        except ConvertException:
+            pass
+
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rows: List[str] = []
+    for kind, source in ELEMENT_STRINGS.items():
+        before = microseconds(probe, source, args.number)
+        after = microseconds(tokenize, source, args.number)
+        parse = microseconds(
+            lambda s: gs1_element_string_to_gs1_element(s, 7), source, args.number
+        )
+        rows.append(
+            f"{kind:<10} {before:>8.2f}us {after:>8.2f}us {before / after:>6.2f}x {parse:>8.2f}us"
+        )
+
+    print(
+        f"{'scheme':<10} {'probing':>10} {'tokenize':>10} {'speedup':>7} {'to scheme':>10}"
+    )
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Cost per kind of source of get_gs1_key, compared to identifying the source by matching
+the alternations of all schemes.
+
+Run using `python -m benchmarks.gs1_key`.
+"""
+
+import argparse
+import timeit
+from typing import Callable, Dict, List, Optional
+
+from epcpy.epc_schemes.base_scheme import GS1Keyed
+from epcpy.utils.common import ConvertException
+from epcpy.utils.parsers import (
+    EPC_URI_REGEX,
+    GS1_ELEMENT_STRING_REGEX,
+    IDPAT_URI_REGEX,
+    TAG_ENCODABLE_BINARY_HEADERS,
+    TAG_ENCODABLE_HEX_HEADERS,
+    TAG_URI_REGEX,
+    _idpat_to_gs1_keyed_scheme,
+    binary_to_tag_encodable,
+    epc_pure_identity_to_scheme,
+    get_gs1_key,
+    gs1_element_string_to_gs1_element,
+    hex_to_tag_encodable,
+    tag_uri_to_tag_encodable,
+)
+
+SOURCES: Dict[str, str] = {
+    "pure identity": "urn:epc:id:sgtin:0614141.812345.6789",
+    "tag uri": "urn:epc:tag:sgtin-96:3.0614141.812345.6789",
+    "idpat": "urn:epc:idpat:sgtin:0614141.812345.*",
+    "gs1 element string": "(01)80614141123458(21)6789",
+    "binary": "001100000111010000100101011110111111011100011001010011100100000000000000000000000001101010000101",
+    "hex": "3074257BF7194E4000001A85",
+    "invalid": "urn:epc:id:sgtin:0614141.812345.67 89",
+}
+
+
+def alternation_get_gs1_key(
+    source: str, company_prefix_length: Optional[int] = None, **kwargs
+) -> str:
+    """get_gs1_key identifying the source by matching the alternations of all schemes
+
+    Args:
+        source (str): Source string
+        company_prefix_length (int, optional): Company prefix length, required for gs1 element strings.
+            Defaults to None.
+
+    Raises:
+        ConvertException: Source could not be converted to GS1 key
+
+    Returns:
+        str: GS1 key of source string
+    """
+    scheme = None
+
+    if EPC_URI_REGEX.fullmatch(source):
+        scheme = epc_pure_identity_to_scheme(source)
+    elif GS1_ELEMENT_STRING_REGEX.fullmatch(source) and company_prefix_length:
+        scheme = gs1_element_string_to_gs1_element(source, company_prefix_length)
+    elif TAG_URI_REGEX.fullmatch(source):
+        scheme = tag_uri_to_tag_encodable(source)
+    elif IDPAT_URI_REGEX.fullmatch(source):
+        scheme = _idpat_to_gs1_keyed_scheme(source)
+    elif source[:8] in TAG_ENCODABLE_BINARY_HEADERS.keys():
+        scheme = binary_to_tag_encodable(source)
+    elif source[:2].upper() in TAG_ENCODABLE_HEX_HEADERS.keys():
+        scheme = hex_to_tag_encodable(source)
+
+    if not isinstance(scheme, GS1Keyed):
+        raise ConvertException(
+            message="Source could not be converted to proper GS1Keyed scheme"
+        )
+
+    return scheme.gs1_key(**kwargs)
+
+
+def microseconds(function: Callable[..., str], source: str, number: int) -> float:
+    """Average duration of a call, including raised ConvertExceptions
+
+    Args:
+        function (Callable[..., str]): get_gs1_key implementation
+        source (str): Source string
+        number (int): Number of calls
+
+    Returns:
+        float: Average duration in microseconds
+    """
+
+    def call() -> None:
+        try:
+            function(source, company_prefix_length=7)
+        except ConvertException:
+            pass
+
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rows: List[str] = []
+    for kind, source in SOURCES.items():
+        before = microseconds(alternation_get_gs1_key, source, args.number)
+        after = microseconds(get_gs1_key, source, args.number)
+        rows.append(
+            f"{kind:<20} {before:>8.2f}us {after:>8.2f}us {before / after:>6.2f}x"
+        )
+
+    print(f"{'source':<20} {'before':>10} {'after':>10} {'speedup':>7}")
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
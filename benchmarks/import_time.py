@@ -0,0 +1,69 @@
+"""Cold start cost of importing epcpy and of the first use of its parsers,
+measured in fresh interpreters.
+
+Run using `python -m benchmarks.import_time`.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+STATEMENTS: Dict[str, str] = {
+    "import epcpy": "import epcpy",
+    "import scheme": "from epcpy.epc_schemes import SGTIN",
+    "import parsers": "import epcpy.utils.parsers",
+    "first decode": "from epcpy import hex_to_tag_encodable; "
+    "hex_to_tag_encodable('3074257BF7194E4000001A85')",
+    "first gs1 key": "from epcpy import get_gs1_key; "
+    "get_gs1_key('urn:epc:id:sgtin:0614141.812345.6789')",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def milliseconds(statement: str, repeat: int) -> List[float]:
+    """Durations of a statement, each executed in a new interpreter
+
+    Args:
+        statement (str): Python statement
+        repeat (int): Number of interpreters
+
+    Returns:
+        List[float]: Durations in milliseconds
+    """
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMER.format(statement=statement)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        * 1e3
+        for _ in range(repeat)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-r", "--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'statement':<16} {'min':>10} {'median':>10}")
+    for name, statement in STATEMENTS.items():
+        durations = milliseconds(statement, args.repeat)
+        print(
+            f"{name:<16} {min(durations):>8.1f}ms {statistics.median(durations):>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
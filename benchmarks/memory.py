@@ -0,0 +1,60 @@
+"""Memory usage per scheme instance.
+
+Run using `python -m benchmarks.memory`.
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import List
+
+from epcpy.epc_schemes.base_scheme import EPCScheme
+from tests.utils.test_data import VALID_TEST_DATA
+
+
+def bytes_per_instance(scheme: type, epc_uri: str, count: int) -> float:
+    """Measure the memory allocated per instance of a scheme
+
+    Args:
+        scheme (type): EPCScheme class to instantiate
+        epc_uri (str): EPC pure identity URI
+        count (int): Number of instances to create
+
+    Returns:
+        float: Allocated bytes per instance
+    """
+    gc.collect()
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+
+    instances: List[EPCScheme] = [scheme(epc_uri) for _ in range(count)]
+
+    stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in stats)
+    del instances
+
+    return size / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'scheme':<8} {'bytes/instance':>15}")
+    seen = set()
+    for epc in VALID_TEST_DATA:
+        scheme = epc["scheme"]
+        if scheme in seen:
+            continue
+        seen.add(scheme)
+
+        size = bytes_per_instance(scheme, epc["uri"], args.count)
+
+        print(f"{scheme.__name__:<8} {size:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
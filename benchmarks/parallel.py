@@ -0,0 +1,95 @@
+"""Scaling of decoding using a pool of worker processes over the number of workers,
+sending the tags to the workers and using shared memory.
+
+Run using `python -m benchmarks.parallel`.
+"""
+
+import argparse
+import operator
+import os
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+
+from epcpy.epc_schemes import SGTIN
+from epcpy.epc_schemes.sgtin import SGTINFilterValue
+from epcpy.utils.parallel import (
+    DEFAULT_RECORD_SIZE,
+    decode_parallel,
+    decode_shared_memory,
+)
+from epcpy.utils.parsers import hex_to_tag_encodables
+
+
+def sgtin_tags(count: int) -> List[str]:
+    """Create hexadecimal SGTIN-96 tags with consecutive serials
+
+    Args:
+        count (int): Number of tags
+
+    Returns:
+        List[str]: Hexadecimal tags
+    """
+    return list(
+        SGTIN("urn:epc:id:sgtin:0614141.812345.1").serial_range(
+            range(1, count + 1),
+            SGTIN.BinaryCodingScheme.SGTIN_96,
+            SGTINFilterValue.POS_ITEM,
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=1_000_000)
+    parser.add_argument("-w", "--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("-c", "--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    tags = sgtin_tags(args.count)
+    gs1_key = operator.methodcaller("gs1_key")
+
+    start = time.perf_counter()
+    [gs1_key(tag) for tag in hex_to_tag_encodables(tags)]
+    baseline = time.perf_counter() - start
+
+    print(f"tags: {args.count}, chunk size: {args.chunk_size}")
+    print(f"in process: {baseline:.2f}s ({args.count / baseline:,.0f} tags/s)")
+
+    tags_memory = SharedMemory(create=True, size=args.count * 12)
+    output_memory = SharedMemory(create=True, size=args.count * DEFAULT_RECORD_SIZE)
+    tags_memory.buf[: args.count * 12] = bytes.fromhex("".join(tags))
+
+    try:
+        for workers in range(1, args.max_workers + 1):
+            start = time.perf_counter()
+            decode_parallel(
+                tags, convert=gs1_key, workers=workers, chunk_size=args.chunk_size
+            )
+            duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            decode_shared_memory(
+                tags_memory,
+                output_memory,
+                args.count,
+                convert=gs1_key,
+                workers=workers,
+                chunk_size=args.chunk_size,
+            )
+            shared = time.perf_counter() - start
+
+            print(
+                f"{workers:>2} workers: {duration:.2f}s ({args.count / duration:,.0f} tags/s, "
+                f"{baseline / duration:.2f}x), shared memory: {shared:.2f}s "
+                f"({args.count / shared:,.0f} tags/s, {baseline / shared:.2f}x)"
+            )
+    finally:
+        tags_memory.close()
+        tags_memory.unlink()
+        output_memory.close()
+        output_memory.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Cost of the seven and six bit string codecs used by alphanumeric serials, compared to
+reading and writing one character at a time, and of decoding alphanumeric tags.
+
+Run using `python -m benchmarks.string_codecs`.
+"""
+
+import argparse
+import re
+import timeit
+from typing import Callable, List
+
+from epcpy.epc_schemes import ADI, SGTIN
+from epcpy.epc_schemes.adi import ADIFilterValue
+from epcpy.epc_schemes.sgtin import SGTINFilterValue
+from epcpy.utils.common import (
+    ESCAPE_CHARACTER_CODES,
+    BitReader,
+    BitWriter,
+    read_string,
+    read_string_six_bits,
+    write_string,
+    write_string_six_bits,
+)
+from epcpy.utils.parsers import _hex_to_tag_encodable
+
+SERIALS = ["ABCdef0123456789xyz", "ABCdef%2F0123456789"]
+SIX_BIT_SERIALS = ["ABC-0123456789XYZ", "%23ABC-0123456789"]
+
+
+def write_string_per_char(writer: BitWriter, string: str, num_bits: int) -> None:
+    """Previous implementation of write_string, writing one character at a time"""
+    start = writer.length
+    for g in re.split("(%[0-9a-fA-F]{2})", string):
+        if len(g) == 0:
+            continue
+        elif g[0] != "%":
+            for s in g:
+                writer.write(ord(s), 7)
+        else:
+            writer.write(int(g[1:], 16), 7)
+
+    padding = num_bits - (writer.length - start)
+    if padding > 0:
+        writer.write(0, padding)
+
+
+def read_string_per_char(reader: BitReader, num_bits: int) -> str:
+    """Previous implementation of read_string, reading one character at a time"""
+    res = []
+    for _ in range(num_bits // 7):
+        code = reader.read(7)
+        if code == 0:
+            continue
+        elif code in ESCAPE_CHARACTER_CODES:
+            res.append(ESCAPE_CHARACTER_CODES[code])
+        else:
+            res.append(chr(code))
+
+    reader.read(num_bits % 7)
+
+    return "".join(res)
+
+
+def write_string_six_bits_per_char(writer: BitWriter, string: str) -> None:
+    """Previous implementation of write_string_six_bits, writing one character at a time"""
+    for g in re.split("(%[0-9a-fA-F]{2}|-)", string):
+        if len(g) == 0:
+            continue
+        elif g == "-":
+            writer.write(0b101101, 6)
+        elif g[0] != "%":
+            for s in g:
+                writer.write(48 + int(s) if s.isnumeric() else ord(s) - 64, 6)
+        else:
+            writer.write(int(g[1:], 16), 6)
+
+    writer.write(0, 6)
+
+
+def read_string_six_bits_per_char(reader: BitReader, max_chars: int) -> str:
+    """Previous implementation of read_string_six_bits, reading one character at a time"""
+    res = []
+    while reader.remaining >= 6:
+        code = reader.read(6)
+        if code == 0:
+            break
+        if len(res) == max_chars:
+            raise ValueError("Too many characters decoded!")
+
+        res.append(chr(code) if code >= 32 else chr(64 + code))
+
+    return "".join(res).replace("#", "%23").replace("/", "%2F")
+
+
+def microseconds(function: Callable[[], object], number: int) -> float:
+    """Average duration of a call
+
+    Args:
+        function (Callable[[], object]): Function to time
+        number (int): Number of calls
+
+    Returns:
+        float: Average duration in microseconds
+    """
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rows: List[str] = []
+    for serial, six_bit_serial in zip(SERIALS, SIX_BIT_SERIALS):
+        writer = BitWriter()
+        write_string(writer, serial, 140)
+        seven_bits = writer.to_binary()
+        writer = BitWriter()
+        write_string_six_bits(writer, six_bit_serial)
+        six_bits = writer.to_binary()
+
+        codecs = {
+            f"write {serial}": (
+                lambda: write_string_per_char(BitWriter(), serial, 140),
+                lambda: write_string(BitWriter(), serial, 140),
+            ),
+            f"read {serial}": (
+                lambda: read_string_per_char(BitReader.from_binary(seven_bits), 140),
+                lambda: read_string(BitReader.from_binary(seven_bits), 140),
+            ),
+            f"write {six_bit_serial}": (
+                lambda: write_string_six_bits_per_char(BitWriter(), six_bit_serial),
+                lambda: write_string_six_bits(BitWriter(), six_bit_serial),
+            ),
+            f"read {six_bit_serial}": (
+                lambda: read_string_six_bits_per_char(
+                    BitReader.from_binary(six_bits), 30
+                ),
+                lambda: read_string_six_bits(BitReader.from_binary(six_bits), 30),
+            ),
+        }
+
+        for kind, (before, after) in codecs.items():
+            before_us = microseconds(before, args.number)
+            after_us = microseconds(after, args.number)
+            rows.append(
+                f"{kind:<26} {before_us:>8.2f}us {after_us:>8.2f}us {before_us / after_us:>6.2f}x"
+            )
+
+    print(f"{'codec':<26} {'per char':>10} {'tables':>10} {'speedup':>7}")
+    print("\n".join(rows))
+
+    tags = {
+        "sgtin-96": SGTIN("urn:epc:id:sgtin:0614141.812345.6789").hex(
+            binary_coding_scheme=SGTIN.BinaryCodingScheme.SGTIN_96,
+            filter_value=SGTINFilterValue.POS_ITEM,
+        ),
+        "sgtin-198": SGTIN(f"urn:epc:id:sgtin:0614141.812345.{SERIALS[0]}").hex(
+            binary_coding_scheme=SGTIN.BinaryCodingScheme.SGTIN_198,
+            filter_value=SGTINFilterValue.POS_ITEM,
+        ),
+        "adi-var": ADI(f"urn:epc:id:adi:2S194.ABC.{SIX_BIT_SERIALS[0]}").hex(
+            binary_coding_scheme=ADI.BinaryCodingScheme.ADI_VAR,
+            filter_value=ADIFilterValue.ITEM_OTHER,
+        ),
+    }
+    for kind, tag in tags.items():
+        decode = microseconds(lambda: _hex_to_tag_encodable(tag), args.number)
+        print(f"decode {kind:<10} {decode:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cost of decoding encoded tags into plain fields, compared to decoding them into schemes and
+splitting their EPC pure identity URIs.
+
+Run using `python -m benchmarks.tag_fields`.
+"""
+
+import argparse
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from epcpy.utils.parsers import _hex_to_tag_encodable, hex_to_tag_fields
+
+TAGS: Dict[str, str] = {
+    "sgtin-96": "3074257BF7194E4000001A85",
+    "sscc-96": "3174257BF4499602D2000000",
+    "gid-96": "3500AF40C0003039000ADF45",
+    "sgtin-198": "36500001DB011169E5E5A70EC000000000000000000000000000",
+}
+
+
+def scheme_fields(hex_string: str) -> Tuple[str, ...]:
+    """Fields of an encoded tag by decoding it into a scheme and splitting its EPC URI
+
+    Args:
+        hex_string (str): Hexadecimal string
+
+    Returns:
+        Tuple[str, ...]: Scheme identifier and EPC pure identity URI components
+    """
+    _, _, _, identifier, value = _hex_to_tag_encodable(hex_string).epc_uri.split(":")
+
+    return (identifier, *value.split("."))
+
+
+def microseconds(function: Callable[[str], object], source: str, number: int) -> float:
+    """Average duration of a call
+
+    Args:
+        function (Callable[[str], object]): Decoder
+        source (str): Hexadecimal string
+        number (int): Number of calls
+
+    Returns:
+        float: Average duration in microseconds
+    """
+    return (
+        min(timeit.repeat(lambda: function(source), number=number, repeat=5))
+        / number
+        * 1e6
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rows: List[str] = []
+    for kind, source in TAGS.items():
+        before = microseconds(scheme_fields, source, args.number)
+        after = microseconds(hex_to_tag_fields, source, args.number)
+        rows.append(
+            f"{kind:<10} {before:>8.2f}us {after:>8.2f}us {before / after:>6.2f}x"
+        )
+
+    print(f"{'scheme':<10} {'scheme':>10} {'fields':>10} {'speedup':>7}")
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
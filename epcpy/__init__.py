@@ -1,15 +1,106 @@
-from .utils.parsers import (
-    base64_to_tag_encodable,
-    binary_to_tag_encodable,
-    epc_pure_identity_to_gs1_element,
-    epc_pure_identity_to_gs1_element_string,
-    epc_pure_identity_to_gs1_key,
-    epc_pure_identity_to_gs1_keyed,
-    epc_pure_identity_to_scheme,
-    epc_pure_identity_to_tag_encodable,
-    get_gs1_key,
-    hex_to_tag_encodable,
-    tag_uri_to_tag_encodable,
-)
-
-from .utils.common import ConvertException
+"""epcpy, the modules providing the exported functions are imported on first access"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .utils.common import ConvertException
+    from .utils.company_prefix import configure_company_prefixes, load_company_prefixes
+    from .utils.parallel import (
+        decode_parallel,
+        decode_shared_memory,
+        iter_decode_parallel,
+        read_shared_records,
+    )
+    from .utils.parsers import (
+        base64_to_tag_encodable,
+        base64_to_tag_encodables,
+        base64_to_tag_fields,
+        binary_to_tag_encodable,
+        binary_to_tag_encodables,
+        binary_to_tag_fields,
+        bytes_to_tag_encodable,
+        bytes_to_tag_encodables,
+        bytes_to_tag_fields,
+        clear_decode_cache,
+        configure_decode_cache,
+        decode_cache_info,
+        epc_pure_identity_to_gs1_element,
+        epc_pure_identity_to_gs1_element_string,
+        epc_pure_identity_to_gs1_key,
+        epc_pure_identity_to_gs1_keyed,
+        epc_pure_identity_to_scheme,
+        epc_pure_identity_to_tag_encodable,
+        get_gs1_key,
+        hex_to_tag_encodable,
+        hex_to_tag_encodables,
+        hex_to_tag_fields,
+        tag_uri_to_tag_encodable,
+    )
+    from .utils.streaming import decode_stream
+
+EXPORT_MODULES = {
+    "ConvertException": ".utils.common",
+    "configure_company_prefixes": ".utils.company_prefix",
+    "load_company_prefixes": ".utils.company_prefix",
+    "base64_to_tag_encodable": ".utils.parsers",
+    "base64_to_tag_encodables": ".utils.parsers",
+    "base64_to_tag_fields": ".utils.parsers",
+    "binary_to_tag_encodable": ".utils.parsers",
+    "binary_to_tag_encodables": ".utils.parsers",
+    "binary_to_tag_fields": ".utils.parsers",
+    "bytes_to_tag_encodable": ".utils.parsers",
+    "bytes_to_tag_encodables": ".utils.parsers",
+    "bytes_to_tag_fields": ".utils.parsers",
+    "clear_decode_cache": ".utils.parsers",
+    "configure_decode_cache": ".utils.parsers",
+    "decode_cache_info": ".utils.parsers",
+    "epc_pure_identity_to_gs1_element": ".utils.parsers",
+    "epc_pure_identity_to_gs1_element_string": ".utils.parsers",
+    "epc_pure_identity_to_gs1_key": ".utils.parsers",
+    "epc_pure_identity_to_gs1_keyed": ".utils.parsers",
+    "epc_pure_identity_to_scheme": ".utils.parsers",
+    "epc_pure_identity_to_tag_encodable": ".utils.parsers",
+    "get_gs1_key": ".utils.parsers",
+    "hex_to_tag_encodable": ".utils.parsers",
+    "hex_to_tag_encodables": ".utils.parsers",
+    "hex_to_tag_fields": ".utils.parsers",
+    "tag_uri_to_tag_encodable": ".utils.parsers",
+    "decode_parallel": ".utils.parallel",
+    "decode_shared_memory": ".utils.parallel",
+    "iter_decode_parallel": ".utils.parallel",
+    "read_shared_records": ".utils.parallel",
+    "decode_stream": ".utils.streaming",
+}
+
+SUBPACKAGES = ("epc_schemes", "utils")
+
+__all__ = list(EXPORT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of an exported function or a subpackage on first access
+
+    Args:
+        name (str): Attribute name
+
+    Raises:
+        AttributeError: Unknown attribute
+
+    Returns:
+        Any: Exported function, class or subpackage
+    """
+    if name in SUBPACKAGES:
+        return import_module(f".{name}", __name__)
+
+    if name not in EXPORT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    export = getattr(import_module(EXPORT_MODULES[name], __name__), name)
+    globals()[name] = export
+
+    return export
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+import sys
+
+from epcpy.cli import main
+
+sys.exit(main())
@@ -0,0 +1,496 @@
+"""Command line converter for newline-delimited EPC representations.
+
+Run `epcpy --help` for usage.
+"""
+
+import argparse
+import base64
+import itertools
+import string
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from epcpy.epc_schemes.base_scheme import EPCScheme, GS1Element, GS1Keyed, TagEncodable
+from epcpy.utils.common import BitReader, ConvertException, base64_to_bytes
+from epcpy.utils.company_prefix import load_company_prefixes
+from epcpy.utils.layout import Layout
+from epcpy.utils.parsers import (
+    TAG_ENCODABLE_CLASSES,
+    TAG_ENCODABLE_HEADER_TABLE,
+    epc_pure_identity_to_scheme,
+    gs1_element_string_to_gs1_element,
+    tag_uri_to_tag_encodable,
+)
+
+SOURCES = [
+    "auto",
+    "hex",
+    "base64",
+    "binary",
+    "tag-uri",
+    "epc-uri",
+    "gs1-element-string",
+]
+TARGETS = [
+    "epc-uri",
+    "gs1-key",
+    "gs1-element-string",
+    "tag-uri",
+    "hex",
+    "base64",
+    "binary",
+]
+TAG_TARGETS = ["tag-uri", "hex", "base64", "binary"]
+
+CODING_SCHEME_LAYOUTS: Dict[str, Layout] = {
+    layout.coding_scheme.value: layout
+    for cls in TAG_ENCODABLE_CLASSES
+    for layout in cls.binary_layouts
+}
+
+MAX_FILTER_BITS = max(layout.filter_bits for layout in CODING_SCHEME_LAYOUTS.values())
+
+HEX_CHARACTERS = set(string.hexdigits)
+BINARY_CHARACTERS = set("01")
+
+Tag = Tuple[Layout, Optional[int], List[str]]
+
+
+def detect_source(line: str) -> str:
+    """Detect the representation of a line
+
+    Args:
+        line (str): EPC representation
+
+    Returns:
+        str: One of the sources, excluding auto
+    """
+    if line.startswith("urn:epc:tag:"):
+        return "tag-uri"
+    if line.startswith("urn:epc:"):
+        return "epc-uri"
+    if line.startswith("("):
+        return "gs1-element-string"
+
+    characters = set(line)
+    if characters <= BINARY_CHARACTERS and len(line) >= 64:
+        return "binary"
+    if characters <= HEX_CHARACTERS:
+        return "hex"
+
+    return "base64"
+
+
+def _decode_bits(reader: BitReader) -> Tuple[TagEncodable, Tag]:
+    """Decode the bits of an encoded tag
+
+    Args:
+        reader (BitReader): Reader positioned at the start of the header
+
+    Raises:
+        ConvertException: Unknown header
+
+    Returns:
+        Tuple[TagEncodable, Tag]: Scheme and tag of the bits
+    """
+    entry = TAG_ENCODABLE_HEADER_TABLE[reader.read(8)]
+
+    if entry is None:
+        raise ConvertException(message="Unknown header")
+
+    layout = entry.layout
+    filter_value, components = layout.decode(reader)
+
+    return entry.scheme._from_layout_components(layout, components), (
+        layout,
+        filter_value,
+        components,
+    )
+
+
+def _tag_from_components(
+    coding_scheme: str, filter_value: Optional[str], value: str
+) -> Tag:
+    """Create a tag from the components of a tag URI
+
+    Args:
+        coding_scheme (str): Binary coding scheme, e.g. sgtin-96
+        filter_value (Optional[str]): Filter value, None if absent
+        value (str): URI components, separated by dots
+
+    Raises:
+        ConvertException: Unknown coding scheme
+        ConvertException: Components can not be encoded using the coding scheme
+
+    Returns:
+        Tag: Tag of the components
+    """
+    try:
+        layout = CODING_SCHEME_LAYOUTS[coding_scheme]
+    except KeyError:
+        raise ConvertException(message=f"Unknown binary coding scheme {coding_scheme}")
+
+    num_components = sum(field.components for field in layout.fields)
+    components = value.split(".", num_components - 1)
+
+    if layout.filter_bits and filter_value is None:
+        raise ConvertException(message=f"{coding_scheme} requires a filter value")
+
+    try:
+        filter_int = int(filter_value) if layout.filter_bits else None
+        writer = layout.encode(components, filter_value)
+        reader = BitReader(writer.value, writer.length, position=8)
+        valid = layout.decode(reader) == (filter_int, components)
+    except (ConvertException, IndexError, KeyError, ValueError):
+        valid = False
+
+    if not valid:
+        raise ConvertException(
+            message=f"URI can not be encoded using the {coding_scheme} coding scheme"
+        )
+
+    return layout, filter_int, components
+
+
+def _parse_tag_uri(line: str) -> Tuple[TagEncodable, Tag]:
+    """Parse an EPC tag URI
+
+    Args:
+        line (str): EPC tag URI
+
+    Returns:
+        Tuple[TagEncodable, Tag]: Scheme and tag of the tag URI
+    """
+    scheme = tag_uri_to_tag_encodable(line)
+    coding_scheme, value = line[len(TagEncodable.TAG_URI_PREFIX) :].split(":", 1)
+
+    filter_value = None
+    if CODING_SCHEME_LAYOUTS[coding_scheme].filter_bits:
+        filter_value, value = value.split(".", 1)
+
+    return scheme, _tag_from_components(coding_scheme, filter_value, value)
+
+
+class Converter:
+    """Converter of single lines from a source into a target representation
+
+    Args:
+        source (str): Source representation, auto to detect the representation of every line
+        target (str): Target representation
+        company_prefix_length (Optional[int], optional): Company prefix length of GS1 element strings.
+            Defaults to the length resolved using the configured company prefixes.
+        coding_scheme (Optional[str], optional): Binary coding scheme for encoding pure identities.
+            Defaults to None.
+        filter_value (Optional[str], optional): Filter value for encoding pure identities. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        company_prefix_length: Optional[int] = None,
+        coding_scheme: Optional[str] = None,
+        filter_value: Optional[str] = None,
+    ) -> None:
+        self.source = source
+        self.target = target
+        self.company_prefix_length = company_prefix_length
+        self.coding_scheme = coding_scheme
+        self.filter_value = filter_value
+
+        self._parsers: Dict[str, Callable[[str], Tuple[EPCScheme, Optional[Tag]]]] = {
+            "hex": lambda line: _decode_bits(BitReader.from_hex(line)),
+            "base64": lambda line: _decode_bits(
+                BitReader.from_bytes(base64_to_bytes(line))
+            ),
+            "binary": lambda line: _decode_bits(BitReader.from_binary(line)),
+            "tag-uri": _parse_tag_uri,
+            "epc-uri": lambda line: (epc_pure_identity_to_scheme(line), None),
+            "gs1-element-string": self._parse_gs1_element_string,
+        }
+
+    def _parse_gs1_element_string(self, line: str) -> Tuple[EPCScheme, None]:
+        return gs1_element_string_to_gs1_element(line, self.company_prefix_length), None
+
+    def _tag(self, scheme: EPCScheme) -> Tag:
+        """Tag of a scheme, using the coding scheme and filter value of the converter"""
+        if not self.coding_scheme:
+            raise ConvertException(
+                message=f"A binary coding scheme is required to encode {scheme.epc_uri}"
+            )
+
+        prefix, value = scheme.epc_uri.split(":", 4)[3:]
+        if not self.coding_scheme.startswith(f"{prefix}-"):
+            raise ConvertException(
+                message=f"Binary coding scheme {self.coding_scheme} does not match {scheme.epc_uri}"
+            )
+
+        return _tag_from_components(self.coding_scheme, self.filter_value, value)
+
+    def convert(self, line: str) -> str:
+        """Convert a line into the target representation
+
+        Args:
+            line (str): Source representation
+
+        Raises:
+            ConvertException: Line can not be converted
+
+        Returns:
+            str: Target representation
+        """
+        try:
+            return self._convert(line)
+        except (IndexError, KeyError, ValueError) as e:
+            # Raised by the parsers for some malformed input, e.g. binascii.Error for invalid base64
+            raise ConvertException(message=f"Invalid input: {e}") from e
+
+    def _convert(self, line: str) -> str:
+        """Convert a line into the target representation, see convert"""
+        source = detect_source(line) if self.source == "auto" else self.source
+        scheme, tag = self._parsers[source](line)
+
+        if self.target == "epc-uri":
+            return scheme.epc_uri
+        if self.target == "gs1-key":
+            if not isinstance(scheme, GS1Keyed):
+                raise ConvertException(message=f"{scheme.epc_uri} has no GS1 key")
+            return scheme.gs1_key()
+        if self.target == "gs1-element-string":
+            if not isinstance(scheme, GS1Element):
+                raise ConvertException(
+                    message=f"{scheme.epc_uri} has no GS1 element string"
+                )
+            return scheme.gs1_element_string()
+
+        layout, filter_value, components = tag if tag else self._tag(scheme)
+
+        if self.target == "tag-uri":
+            filter_string = "" if filter_value is None else f"{filter_value}."
+            return f"{TagEncodable.TAG_URI_PREFIX}{layout.coding_scheme.value}:{filter_string}{'.'.join(components)}"
+
+        writer = layout.encode(components, filter_value)
+
+        if self.target == "hex":
+            return writer.to_hex()
+        if self.target == "base64":
+            return base64.b64encode(writer.to_bytes()).decode()
+
+        return writer.to_binary()
+
+
+class Summary:
+    """Statistics of a conversion
+
+    Attributes:
+        lines (int): Number of converted lines
+        errors (int): Number of lines that could not be converted
+        seconds (float): Duration of the conversion
+    """
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    def __str__(self) -> str:
+        rate = self.lines / self.seconds if self.seconds else 0
+        return f"{self.lines} lines ({self.errors} invalid) in {self.seconds:.2f}s, {rate:,.0f} lines/s"
+
+
+def _read_lines(files: Iterable[TextIO]) -> Iterator[str]:
+    """Non-empty stripped lines of all files"""
+    for file in files:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def convert_stream(
+    lines: Iterable[str],
+    output: TextIO,
+    converter: Converter,
+    chunk_size: int = 10_000,
+    on_error: str = "empty",
+    errors: Optional[TextIO] = None,
+) -> Summary:
+    """Convert lines and write the results to the output in chunks, only a single chunk is kept in memory.
+
+    Args:
+        lines (Iterable[str]): Source lines
+        output (TextIO): Output of the target representations, one per line
+        converter (Converter): Converter of the lines
+        chunk_size (int, optional): Number of lines per chunk. Defaults to 10_000.
+        on_error (str, optional): Behaviour for invalid lines, write an empty line, skip the line
+            or fail. Defaults to "empty".
+        errors (Optional[TextIO], optional): Output of error messages. Defaults to None.
+
+    Raises:
+        ValueError: Chunk size is not positive
+        ConvertException: Invalid line while failing on errors, after writing the lines converted before it
+
+    Returns:
+        Summary: Statistics of the conversion
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive")
+
+    summary = Summary()
+    start = time.perf_counter()
+    lines = iter(lines)
+
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+
+        results = []
+        for line in chunk:
+            try:
+                results.append(converter.convert(line))
+            except ConvertException as e:
+                if on_error == "fail":
+                    output.write("".join(f"{result}\n" for result in results))
+                    output.flush()
+                    raise
+                if errors:
+                    errors.write(f"{line}: {e}\n")
+                if on_error == "empty":
+                    results.append("")
+                summary.errors += 1
+
+        summary.lines += len(chunk)
+        output.write("".join(f"{result}\n" for result in results))
+        output.flush()
+
+    summary.seconds = time.perf_counter() - start
+
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="epcpy",
+        description="Convert newline-delimited EPC representations, read from files or stdin",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        type=argparse.FileType("r"),
+        default=[sys.stdin],
+        help="Input files, - for stdin. Defaults to stdin",
+    )
+    parser.add_argument(
+        "-f",
+        "--from",
+        dest="source",
+        choices=SOURCES,
+        default="auto",
+        help="Source representation. Defaults to auto",
+    )
+    parser.add_argument(
+        "-t",
+        "--to",
+        dest="target",
+        choices=TARGETS,
+        default="epc-uri",
+        help="Target representation. Defaults to epc-uri",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="Output file. Defaults to stdout",
+    )
+    parser.add_argument(
+        "--company-prefix-length",
+        type=int,
+        help="Company prefix length of GS1 element strings",
+    )
+    parser.add_argument(
+        "--company-prefixes",
+        help="GS1 Company Prefix format list (xml or json) or csv file of prefixes and lengths, "
+        "resolving the company prefix length of GS1 element strings",
+    )
+    parser.add_argument(
+        "--coding-scheme",
+        help="Binary coding scheme to encode pure identities and GS1 element strings, e.g. sgtin-96",
+    )
+    parser.add_argument(
+        "--filter", dest="filter_value", help="Filter value to encode pure identities"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10_000,
+        help="Number of lines converted and written at once. Defaults to 10000",
+    )
+    parser.add_argument(
+        "--on-error",
+        choices=["empty", "skip", "fail"],
+        default="empty",
+        help="Write an empty line for invalid input, skip it or fail. Defaults to empty",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report errors and summary"
+    )
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1:
+        parser.error(f"Invalid chunk size {args.chunk_size}, must be positive")
+    if (
+        args.coding_scheme is not None
+        and args.coding_scheme not in CODING_SCHEME_LAYOUTS
+    ):
+        parser.error(f"Unknown binary coding scheme {args.coding_scheme}")
+    if args.filter_value is not None:
+        filter_bits = (
+            CODING_SCHEME_LAYOUTS[args.coding_scheme].filter_bits
+            if args.coding_scheme
+            else MAX_FILTER_BITS
+        )
+        if not (
+            args.filter_value.isdigit()
+            and args.filter_value.isascii()
+            and int(args.filter_value) < 1 << filter_bits
+        ):
+            parser.error(f"Invalid filter value {args.filter_value}")
+
+    if args.company_prefixes:
+        try:
+            load_company_prefixes(args.company_prefixes)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not load company prefixes: {e}")
+
+    converter = Converter(
+        args.source,
+        args.target,
+        company_prefix_length=args.company_prefix_length,
+        coding_scheme=args.coding_scheme,
+        filter_value=args.filter_value,
+    )
+
+    try:
+        summary = convert_stream(
+            _read_lines(args.files),
+            args.output,
+            converter,
+            chunk_size=args.chunk_size,
+            on_error=args.on_error,
+            errors=None if args.quiet else sys.stderr,
+        )
+    except ConvertException as e:
+        print(f"epcpy: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(summary, file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
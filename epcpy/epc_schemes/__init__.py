@@ -1,21 +1,78 @@
-from .adi import ADI
-from .bic import BIC
-from .cpi import CPI
-from .gdti import GDTI
-from .giai import GIAI
-from .gid import GID
-from .ginc import GINC
-from .grai import GRAI
-from .gsin import GSIN
-from .gsrn import GSRN
-from .gsrnp import GSRNP
-from .imovn import IMOVN
-from .itip import ITIP
-from .lgtin import LGTIN
-from .pgln import PGLN
-from .sgcn import SGCN
-from .sgln import SGLN
-from .sgtin import SGTIN
-from .sscc import SSCC
-from .upui import UPUI
-from .usdod import USDOD
+"""EPC schemes, the module of a scheme is imported when its class is first accessed"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .adi import ADI
+    from .bic import BIC
+    from .cpi import CPI
+    from .gdti import GDTI
+    from .giai import GIAI
+    from .gid import GID
+    from .ginc import GINC
+    from .grai import GRAI
+    from .gsin import GSIN
+    from .gsrn import GSRN
+    from .gsrnp import GSRNP
+    from .imovn import IMOVN
+    from .itip import ITIP
+    from .lgtin import LGTIN
+    from .pgln import PGLN
+    from .sgcn import SGCN
+    from .sgln import SGLN
+    from .sgtin import SGTIN
+    from .sscc import SSCC
+    from .upui import UPUI
+    from .usdod import USDOD
+
+SCHEME_MODULES = {
+    "ADI": ".adi",
+    "BIC": ".bic",
+    "CPI": ".cpi",
+    "GDTI": ".gdti",
+    "GIAI": ".giai",
+    "GID": ".gid",
+    "GINC": ".ginc",
+    "GRAI": ".grai",
+    "GSIN": ".gsin",
+    "GSRN": ".gsrn",
+    "GSRNP": ".gsrnp",
+    "IMOVN": ".imovn",
+    "ITIP": ".itip",
+    "LGTIN": ".lgtin",
+    "PGLN": ".pgln",
+    "SGCN": ".sgcn",
+    "SGLN": ".sgln",
+    "SGTIN": ".sgtin",
+    "SSCC": ".sscc",
+    "UPUI": ".upui",
+    "USDOD": ".usdod",
+}
+
+__all__ = list(SCHEME_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of a scheme class on first access
+
+    Args:
+        name (str): Attribute name
+
+    Raises:
+        AttributeError: Unknown attribute
+
+    Returns:
+        Any: Scheme class
+    """
+    if name not in SCHEME_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    scheme = getattr(import_module(SCHEME_MODULES[name], __name__), name)
+    globals()[name] = scheme
+
+    return scheme
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Sequence
 
 from epcpy.epc_schemes.base_scheme import TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
-    decode_cage_code_six_bits,
-    decode_string_six_bits,
-    encode_cage_code_six_bits,
-    encode_string_six_bits,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import ADI_URI
-
-ADI_URI_REGEX = re.compile(ADI_URI)
+from epcpy.utils.layout import (
+    Layout,
+    SixBitCageCode,
+    SixBitString,
+)
+from epcpy.utils.tokenizers import (
+    ADI_URI_TOKENIZER,
+    is_adi_part_number,
+    is_adi_serial,
+)
 
 
 class ADIFilterValue(Enum):
@@ -106,21 +107,35 @@ class ADI(TagEncodable):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_cage_dodaac", "_part_number", "_serial")
+
     class BinaryCodingScheme(Enum):
         ADI_VAR = "adi-var"
 
     class BinaryHeader(Enum):
         ADI_VAR = "00111011"
 
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.ADI_VAR,
+            BinaryHeader.ADI_VAR,
+            [
+                SixBitCageCode(),
+                SixBitString(32, is_adi_part_number, terminated=True),
+                SixBitString(30, is_adi_serial),
+            ],
+            filter_bits=6,
+        ),
+    )
+
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not ADI_URI_REGEX.fullmatch(epc_uri):
+        components = ADI_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid ADI URI {epc_uri}")
 
-        self._cage_dodaac, self._part_number, self._serial = epc_uri.split(":")[
-            4
-        ].split(".")
+        self._cage_dodaac, self._part_number, self._serial = components
 
         if not (0 <= len(self._part_number.replace("%2F", "/")) <= 32):
             raise ConvertException(
@@ -132,7 +147,22 @@ class ADI(TagEncodable):
                 message=f"Invalid number of characters in serial: {len(self._serial.replace('%2F', '/').replace('%23', '#'))}"
             )
 
-        self.epc_uri = epc_uri
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> ADI:
+        """Create an ADI instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): CAGE/DoDAAC, part number and serial
+
+        Returns:
+            ADI: ADI instance
+        """
+        adi = cls.__new__(cls)
+        super(ADI, adi).__init__(f"urn:epc:id:adi:{'.'.join(components)}")
+
+        adi._cage_dodaac, adi._part_number, adi._serial = components
+
+        return adi
 
     def tag_uri(
         self,
@@ -150,72 +180,20 @@ class ADI(TagEncodable):
         """
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._cage_dodaac}.{self._part_number}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         filter_value: ADIFilterValue,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.ADI_VAR,
-    ) -> str:
-        """Return the binary representation belonging to this ADI with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this ADI with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (ADIFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        header = ADI.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 6)
-        cage_code_binary = encode_cage_code_six_bits(self._cage_dodaac)
-        part_number_binary = encode_string_six_bits(self._part_number)
-        serial_binary = encode_string_six_bits(self._serial)
-
-        _binary = (
-            header
-            + filter_binary
-            + cage_code_binary
-            + part_number_binary
-            + serial_binary
-        )
-        return _binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> ADI:
-        """Create an ADI instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an ADI
-
-        Raises:
-            ConvertException: Missing 6-bit terminators in binary representation
-
-        Returns:
-            ADI: ADI instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:14]
-        cage_code_binary = truncated_binary[14:50]
-
-        if not re.match(".*([0]{6})+.*", truncated_binary[50:]):
-            raise ConvertException(
-                message="Invalid binary for ADI, missing 6-bit terminators"
-            )
-
-        part_number_binary, _, *serial_binary = re.split(
-            "([0]{6})", truncated_binary[50:]
-        )
-        serial_binary_trimmed = "".join(serial_binary)[:-6]
-
-        filter_string = binary_to_int(filter_binary)
-        cage_code_string = decode_cage_code_six_bits(cage_code_binary)
-        part_number_string = decode_string_six_bits(part_number_binary, 32)
-
-        serial_string = decode_string_six_bits(serial_binary_trimmed, 30)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{cage_code_string}.{part_number_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._cage_dodaac, self._part_number, self._serial], filter_value.value
         )
@@ -1,27 +1,118 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
-from typing import Dict, Optional, Type, TypeVar
-
-from epcpy.utils.common import ConvertException, base64_to_hex, hex_to_base64, hex_to_binary
-from epcpy.utils.regex import TAG_URI
+from functools import wraps
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from epcpy.utils.common import (
+    BitReader,
+    BitWriter,
+    ConvertException,
+    base64_to_bytes,
+    hex_to_base64,
+)
+from epcpy.utils.layout import Layout
+from epcpy.utils.regex import TAG_URI, TAG_URI_BODIES, LazyRegex
+from epcpy.utils.tokenizers import ElementStringTokenizer
 
 T_EPCScheme = TypeVar("T_EPCScheme", bound="EPCScheme")
 T_GS1Element = TypeVar("T_GS1Element", bound="GS1Element")
 T_TagEncodable = TypeVar("T_TagEncodable", bound="TagEncodable")
 
 
+TAG_URI_REGEXES = {
+    identifier: LazyRegex(f"urn:epc:tag:{body}")
+    for identifier, body in TAG_URI_BODIES.items()
+}
+
+
+def _memoize_encoding(encode: Callable[..., str]) -> Callable[..., str]:
+    """Memoize an encoded representation of a TagEncodable per instance.
+    Encodings are keyed by their name and arguments, i.e. the binary coding scheme and filter value.
+
+    Args:
+        encode (Callable[..., str]): Method returning an encoded representation
+
+    Returns:
+        Callable[..., str]: Memoized method
+    """
+    name = encode.__name__
+
+    @wraps(encode)
+    def memoized(self: TagEncodable, *args, **kwargs) -> str:
+        key = (name, args, *kwargs.items())
+
+        encodings = self._encodings
+        if encodings is None:
+            encodings = self._encodings = {}
+        elif key in encodings:
+            return encodings[key]
+
+        encoded = encodings[key] = encode(self, *args, **kwargs)
+
+        return encoded
+
+    return memoized
+
+
 class EPCScheme:
     """Base class for EPC schemes
 
+    Instances are hashable by their EPC URI. Instances are not protected against modification,
+    but must be treated as read-only, as instances are shared by the decode cache.
+
     Attributes:
         epc_uri (str): The EPC pure identity URI
     """
 
+    __slots__ = ("_epc_uri",)
+
     def __init__(self, epc_uri: str) -> None:
         super().__init__()
-        self.epc_uri = epc_uri
+        self._epc_uri = epc_uri
+
+    @property
+    def epc_uri(self) -> str:
+        """The EPC pure identity URI"""
+        return self._epc_uri
+
+    def __hash__(self) -> int:
+        # Not stored on the instance, the hash of a string is cached by the string itself
+        return hash(self._epc_uri)
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Attributes of the instance used for pickling
+
+        Returns:
+            Dict[str, object]: Attribute names and values
+        """
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore a pickled instance
+
+        Args:
+            state (Dict[str, object]): Attribute names and values
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def __eq__(self, other: object) -> bool:
         """Verify equality of two classes by validing if its an EPCScheme and whether the EPC URIs are equal.
@@ -32,10 +123,13 @@ class EPCScheme:
         Returns:
             bool: Whether the other object is equal to this object
         """
+        if self is other:
+            return True
+
         if not isinstance(other, EPCScheme):
             return False
 
-        return self.epc_uri == other.epc_uri
+        return self._epc_uri == other._epc_uri
 
     @classmethod
     def from_epc_uri(cls: Type[T_EPCScheme], epc_uri: str) -> EPCScheme:
@@ -53,13 +147,19 @@ class EPCScheme:
 class TagEncodable(EPCScheme):
     """Base class for tag encodable EPCSchemes
 
+    Encoded representations are memoized per instance, keyed by the binary coding scheme and filter value.
+
     Attributes:
         tag_uri (str): The EPC tag URI
+        bits (BitWriter): Encoded bits of the EPC tag URI
         binary (str): Binary representation of the EPC tag URI
         hex (str): Hexadecimal representation of the EPC tag URI
         base64 (str): Base64 representation of the EPC tag URI
+        binary_layouts (Tuple[Layout, ...]): Binary layout of every binary coding scheme
     """
 
+    __slots__ = ("_encodings",)
+
     class BinaryCodingScheme(Enum):
         """Binary coding schemes for tag encodable EPC schemes"""
 
@@ -70,16 +170,39 @@ class TagEncodable(EPCScheme):
 
         pass
 
-    TAG_URI_REGEX = re.compile(TAG_URI)
+    TAG_URI_REGEX = LazyRegex(TAG_URI)
     TAG_URI_PREFIX = "urn:epc:tag:"
 
+    binary_layouts: Tuple[Layout, ...] = ()
+    _layouts: Dict[Enum, Layout] = {}
+    _header_layouts: Dict[int, Layout] = {}
+    _header_schemes: Mapping[str, Enum] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "binary_layouts" in cls.__dict__:
+            cls._layouts = {
+                layout.coding_scheme: layout for layout in cls.binary_layouts
+            }
+            cls._header_layouts = {
+                layout.header: layout for layout in cls.binary_layouts
+            }
+
+        if "BinaryHeader" in cls.__dict__:
+            cls._header_schemes = MappingProxyType(
+                {
+                    binary_header.value: cls.BinaryCodingScheme[binary_header.name]
+                    for binary_header in cls.BinaryHeader
+                }
+            )
+
+        if "tag_uri" in cls.__dict__:
+            cls.tag_uri = _memoize_encoding(cls.__dict__["tag_uri"])
+
     def __init__(self, epc_uri: str) -> None:
         super().__init__(epc_uri)
-
-        self._base64: Optional[str] = None
-        self._binary: Optional[str] = None
-        self._hex: Optional[str] = None
-        self._tag_uri: Optional[str] = None
+        self._encodings: Optional[Dict[tuple, str]] = None
 
     def tag_uri(self, *args, **kwargs) -> str:
         """Return the tag URI of the tag encodable
@@ -92,40 +215,197 @@ class TagEncodable(EPCScheme):
         """
         raise NotImplementedError
 
-    def binary(self, *args, **kwargs) -> str:
-        """Return the binary representation of the tag encodable
+    def bits(self, *args, **kwargs) -> BitWriter:
+        """Return the encoded bits of the tag encodable
 
         Raises:
             NotImplementedError: Method not implemented by default.
 
         Returns:
-            str: The binary representation.
+            BitWriter: The encoded bits.
         """
         raise NotImplementedError
 
+    @_memoize_encoding
+    def binary(self, *args, **kwargs) -> str:
+        """Return the binary representation of the tag encodable
+
+        Returns:
+            str: The binary representation.
+        """
+        return self.bits(*args, **kwargs).to_binary()
+
+    @_memoize_encoding
     def hex(self, *args, **kwargs) -> str:
         """Return the hexadecimal representation of the tag encodable
 
         Returns:
             str: The hexadecimal representation.
         """
-        binary = self.binary(**kwargs)
-
-        padding = (16 - (len(binary) % 16)) % 16
-        padded_binary = f"{binary:<0{len(binary) + padding}}"
-
-        return f"{int(padded_binary, 2):X}"
+        return self.bits(*args, **kwargs).to_hex()
 
+    @_memoize_encoding
     def base64(self, *args, **kwargs) -> str:
         """Return the base64 representation of the tag encodable
 
         Returns:
             str: The base64 representation.
         """
-        hex_string = self.hex(**kwargs)
+        hex_string = self.hex(*args, **kwargs)
 
         return hex_to_base64(hex_string)
 
+    def serial_range(
+        self, serials: range, *args, as_bytes: bool = False, **kwargs
+    ) -> Iterator[Union[str, bytes]]:
+        """Encode a range of consecutive serials, the last URI component of this instance is replaced
+        by every serial of the range. Only the first and last serial are validated and encoded,
+        all other tags are created lazily by adding to the serial field of the encoded value.
+        Supported by coding schemes that encode the last URI component as an integer, such as
+        SGTIN-96, SSCC-96, GIAI-96 and GID-96.
+
+        Args:
+            serials (range): Range of serials
+            *args, **kwargs: Arguments of bits, i.e. the binary coding scheme and filter value
+            as_bytes (bool, optional): Yield raw bytes instead of hexadecimal strings. Defaults to False.
+
+        Raises:
+            ConvertException: Serial is not encoded as an integer by this coding scheme
+            ConvertException: First or last serial invalid
+
+        Returns:
+            Iterator[Union[str, bytes]]: Hexadecimal strings or raw bytes of the encoded tags
+        """
+        base = self.bits(*args, **kwargs)
+        layout = self._header_layouts[base.value >> (base.length - 8)]
+        index = sum(field.components for field in layout.fields) - 1
+        shift, padded = layout.integer_shift(index)
+
+        if not serials:
+            return iter(())
+
+        components = self.epc_uri[len(layout.epc_uri_prefix) :].split(".", index)
+        width = len(components[index]) if padded else 0
+        prefix = f"{layout.epc_uri_prefix}{'.'.join(components[:index])}."
+
+        first, last = (
+            type(self)(f"{prefix}{serial:0{width}}").bits(*args, **kwargs)
+            for serial in (serials[0], serials[-1])
+        )
+
+        padding = (16 - (first.length % 16)) % 16
+
+        return self._serial_range(
+            first.value << padding,
+            serials.step << (shift + padding),
+            len(serials),
+            (first.length + padding) // 8,
+            as_bytes,
+        )
+
+    @staticmethod
+    def _serial_range(
+        value: int, step: int, count: int, num_bytes: int, as_bytes: bool
+    ) -> Iterator[Union[str, bytes]]:
+        """Yield count encoded tags, starting at value and incremented by step
+
+        Args:
+            value (int): Padded value of the first tag
+            step (int): Increment of the padded value
+            count (int): Number of tags
+            num_bytes (int): Number of bytes of a tag
+            as_bytes (bool): Yield raw bytes instead of hexadecimal strings
+
+        Returns:
+            Iterator[Union[str, bytes]]: Hexadecimal strings or raw bytes of the encoded tags
+        """
+        hex_format = f"0{num_bytes * 2}X"
+
+        for _ in range(count):
+            yield (
+                value.to_bytes(num_bytes, "big")
+                if as_bytes
+                else format(value, hex_format)
+            )
+            value += step
+
+    @classmethod
+    def _from_components(
+        cls: Type[T_TagEncodable], components: Sequence[str]
+    ) -> T_TagEncodable:
+        """Instantiate a TagEncodable class from URI components that are known to be valid.
+        No validation is performed, use the constructor for untrusted input.
+
+        Args:
+            components (Sequence[str]): Components of the EPC pure identity URI
+
+        Raises:
+            NotImplementedError: Method not implemented by default.
+
+        Returns:
+            TagEncodable: Instance of TagEncodable class
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_bits(cls: Type[T_TagEncodable], reader: BitReader) -> T_TagEncodable:
+        """Instantiate a TagEncodable class from the bits of an encoded tag.
+        The EPC pure identity URI is composed directly from the decoded fields, no tag URI is created.
+
+        Args:
+            reader (BitReader): Reader positioned at the start of the header.
+
+        Raises:
+            ConvertException: Invalid binary header
+
+        Returns:
+            TagEncodable: Instance of TagEncodable class
+        """
+        header = reader.read(8)
+
+        try:
+            layout = cls._header_layouts[header]
+        except KeyError:
+            raise ConvertException(message=f"{header:08b} is not a valid header")
+
+        return cls._from_layout_bits(layout, reader)
+
+    @classmethod
+    def _from_layout_bits(
+        cls: Type[T_TagEncodable], layout: Layout, reader: BitReader
+    ) -> T_TagEncodable:
+        """Instantiate a TagEncodable class from the bits following the header of a layout
+
+        Args:
+            layout (Layout): Layout identified by the header
+            reader (BitReader): Reader positioned directly after the header
+
+        Returns:
+            TagEncodable: Instance of TagEncodable class
+        """
+        _, components = layout.decode(reader)
+
+        return cls._from_layout_components(layout, components)
+
+    @classmethod
+    def _from_layout_components(
+        cls: Type[T_TagEncodable], layout: Layout, components: Sequence[str]
+    ) -> T_TagEncodable:
+        """Instantiate a TagEncodable class from the components decoded using a layout.
+        Layouts that can only decode valid components skip validation of the URI.
+
+        Args:
+            layout (Layout): Layout used to decode the components
+            components (Sequence[str]): Decoded URI components
+
+        Returns:
+            TagEncodable: Instance of TagEncodable class
+        """
+        if layout.validated:
+            return cls._from_components(components)
+
+        return cls(f"{layout.epc_uri_prefix}{'.'.join(components)}")
+
     @classmethod
     def from_binary(
         cls: Type[T_TagEncodable], tag_binary_string: str
@@ -138,7 +418,7 @@ class TagEncodable(EPCScheme):
         Returns:
             TagEncodable: Instance of TagEncodable class
         """
-        raise NotImplementedError
+        return cls.from_bits(BitReader.from_binary(tag_binary_string))
 
     @classmethod
     def from_hex(cls: Type[T_TagEncodable], tag_hex_string: str) -> T_TagEncodable:
@@ -150,7 +430,19 @@ class TagEncodable(EPCScheme):
         Returns:
             TagEncodable: Instance of TagEncodable class
         """
-        return cls.from_binary(hex_to_binary(tag_hex_string))
+        return cls.from_bits(BitReader.from_hex(tag_hex_string))
+
+    @classmethod
+    def from_bytes(cls: Type[T_TagEncodable], tag_bytes: bytes) -> T_TagEncodable:
+        """Instantiate a TagEncodable class from raw bytes.
+
+        Args:
+            tag_bytes (bytes): Raw bytes of an encoded tag.
+
+        Returns:
+            TagEncodable: Instance of TagEncodable class
+        """
+        return cls.from_bits(BitReader.from_bytes(tag_bytes))
 
     @classmethod
     def from_base64(
@@ -164,7 +456,7 @@ class TagEncodable(EPCScheme):
         Returns:
             TagEncodable: Instance of TagEncodable class
         """
-        return cls.from_hex(base64_to_hex(tag_base64_string))
+        return cls.from_bytes(base64_to_bytes(tag_base64_string))
 
     @classmethod
     def from_tag_uri(
@@ -183,7 +475,11 @@ class TagEncodable(EPCScheme):
         Returns:
             TagEncodable: Instance of TagEncodable class
         """
-        if not TagEncodable.TAG_URI_REGEX.match(epc_tag_uri):
+        identifier = epc_tag_uri[len(cls.TAG_URI_PREFIX) :].split("-", 1)[0]
+
+        if identifier not in TAG_URI_REGEXES or not TAG_URI_REGEXES[identifier].match(
+            epc_tag_uri
+        ):
             raise ConvertException(message=f"Invalid EPC tag URI {epc_tag_uri}")
 
         epc_scheme = epc_tag_uri.split(":")[3]
@@ -196,20 +492,19 @@ class TagEncodable(EPCScheme):
         return cls(f"urn:epc:id:{epc_scheme.split('-')[0]}:{value}")
 
     @classmethod
-    def header_to_schemes(cls: Type[T_TagEncodable]) -> Dict[str, Enum]:
-        """Create dictionary of binary header -> binary coding scheme
+    def header_to_schemes(cls: Type[T_TagEncodable]) -> Mapping[str, Enum]:
+        """Mapping of binary header -> binary coding scheme, created once per class
 
         Returns:
-            Dict[str, Any]: Dictionary mapping of binary header -> binary coding scheme
+            Mapping[str, Enum]: Read-only mapping of binary header -> binary coding scheme
         """
-        return {
-            binary_header.value: cls.BinaryCodingScheme[binary_header.name]
-            for binary_header in cls.BinaryHeader
-        }
+        return cls._header_schemes
 
 
 class GS1Element(EPCScheme):
-    gs1_element_string_regex: re.Pattern
+    __slots__ = ()
+
+    gs1_element_string_tokenizer: ElementStringTokenizer
 
     def __init__(self, epc_uri: str) -> None:
         super().__init__(epc_uri)
@@ -227,13 +522,18 @@ class GS1Element(EPCScheme):
 
     @classmethod
     def from_gs1_element_string(
-        cls: Type[T_GS1Element], gs1_element_string: str, company_prefix_length: int
+        cls: Type[T_GS1Element],
+        gs1_element_string: str,
+        company_prefix_length: Optional[int] = None,
     ) -> T_GS1Element:
         """Create a GS1Element instance from a GS1 element string and company prefix length.
+        When no company prefix length is given, it is resolved using the configured company
+        prefixes, see epcpy.utils.company_prefix.
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
             NotImplementedError: Base class does not implement any scheme
@@ -245,6 +545,8 @@ class GS1Element(EPCScheme):
 
 
 class GS1Keyed(GS1Element):
+    __slots__ = ()
+
     def __init__(self, epc_uri: str) -> None:
         super().__init__(epc_uri)
 
@@ -1,10 +1,6 @@
-import re
-
 from epcpy.epc_schemes.base_scheme import EPCScheme
 from epcpy.utils.common import ConvertException
-from epcpy.utils.regex import BIC_URI
-
-BIC_URI_REGEX = re.compile(BIC_URI)
+from epcpy.utils.tokenizers import BIC_URI_TOKENIZER
 
 
 class BIC(EPCScheme):
@@ -19,15 +15,22 @@ class BIC(EPCScheme):
     This class can be created using EPC pure identities via its constructor
     """
 
+    __slots__ = (
+        "_owner_code",
+        "_equipment_category_identifier",
+        "_serial",
+        "_check_digit",
+        "_container_code",
+    )
+
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not BIC_URI_REGEX.fullmatch(epc_uri):
+        components = BIC_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid BIC URI {epc_uri}")
 
-        self.epc_uri = epc_uri
-
-        container_code = epc_uri.split(":")[4]
+        (container_code,) = components
         self._container_code = container_code
 
         self._owner_code = container_code[0:3]
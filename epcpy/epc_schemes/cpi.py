@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Element, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
-    decode_partition_table,
-    encode_partition_table,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import CPI_GS1_ELEMENT_STRING, CPI_URI
-
-CPI_URI_REGEX = re.compile(CPI_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Integer,
+    Layout,
+    Partition,
+    TrailingInteger,
+)
+from epcpy.utils.tokenizers import CPI_GS1_ELEMENT_STRING_TOKENIZER, CPI_URI_TOKENIZER
 
 PARTITION_TABLE_P_96 = {
     0: {
@@ -190,6 +191,8 @@ class CPI(GS1Element, TagEncodable):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_cp_ref", "_serial")
+
     class BinaryCodingScheme(Enum):
         CPI_96 = "cpi-96"
         CPI_VAR = "cpi-var"
@@ -198,17 +201,42 @@ class CPI(GS1Element, TagEncodable):
         CPI_96 = "00111100"
         CPI_VAR = "00111101"
 
-    gs1_element_string_regex = re.compile(CPI_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.CPI_96,
+            BinaryHeader.CPI_96,
+            [
+                Partition(
+                    PARTITION_TABLE_P_96, PARTITION_TABLE_L_96, unpadded_partition=True
+                ),
+                Integer(31),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.CPI_VAR,
+            BinaryHeader.CPI_VAR,
+            [
+                Partition(
+                    PARTITION_TABLE_P_VAR,
+                    PARTITION_TABLE_L_VAR,
+                    six_bit_variable_partition=True,
+                    max_length=30,
+                ),
+                TrailingInteger(40, max_digits=12),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = CPI_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not CPI_URI_REGEX.fullmatch(epc_uri):
+        components = CPI_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid CPI URI {epc_uri}")
 
-        self._company_pref, self._cp_ref, self._serial = epc_uri.split(":")[4].split(
-            "."
-        )
+        self._company_pref, self._cp_ref, self._serial = components
 
         if (
             len("".join([self._company_pref, self._cp_ref])) > 30
@@ -217,7 +245,22 @@ class CPI(GS1Element, TagEncodable):
         ):
             raise ConvertException(message=f"Invalid CPI URI {epc_uri}")
 
-        self.epc_uri = epc_uri
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> CPI:
+        """Create an CPI instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, component/part reference and serial
+
+        Returns:
+            CPI: CPI instance
+        """
+        cpi = cls.__new__(cls)
+        super(CPI, cpi).__init__(f"urn:epc:id:cpi:{'.'.join(components)}")
+
+        cpi._company_pref, cpi._cp_ref, cpi._serial = components
+
+        return cpi
 
     def gs1_element_string(self) -> str:
         """Returns the GS1 element string
@@ -231,26 +274,30 @@ class CPI(GS1Element, TagEncodable):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> CPI:
         """Create a CPI instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: CPI GS1 element string invalid
+            ConvertException: CPI GS1 element string invalid or company prefix unknown
 
         Returns:
             CPI: CPI scheme
         """
-        if not CPI.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = CPI_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid CPI GS1 element string {gs1_element_string}"
             )
 
-        _, digits, serial_digits = re.split(f"\(.{{4}}\)", gs1_element_string)
+        digits, serial_digits = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
         chars = revert_cpi_escapes(digits[company_prefix_length:])
 
         return cls(
@@ -286,89 +333,22 @@ class CPI(GS1Element, TagEncodable):
         ):
             raise ConvertException(message=f"Invalid serial value {self._serial}")
 
-        self._tag_uri = f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._company_pref}.{self._cp_ref}.{self._serial}"
+        return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._company_pref}.{self._cp_ref}.{self._serial}"
 
-        return self._tag_uri
-
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme,
         filter_value: CPIFilterValue,
-    ) -> str:
-        """Return the binary representation belonging to this CPI with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this CPI with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (CPIFilterValue): Filter value
 
         Returns:
-            str: binary representation
-        """
-        parts = [self._company_pref, self._cp_ref]
-        serial = self._serial
-
-        header = CPI.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        cpi_binary = (
-            encode_partition_table(parts, PARTITION_TABLE_L_96)
-            if binary_coding_scheme == CPI.BinaryCodingScheme.CPI_96
-            else encode_partition_table(
-                parts, PARTITION_TABLE_L_VAR, six_bit_variable_partition=True
-            )
-        )
-        serial_binary = str_to_binary(
-            serial, 31 if binary_coding_scheme == CPI.BinaryCodingScheme.CPI_96 else 40
-        )
-
-        _binary = header + filter_binary + cpi_binary + serial_binary
-
-        return _binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> CPI:
-        """Create an CPI instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an CPI
-
-        Returns:
-            CPI: CPI instance
+            BitWriter: encoded bits
         """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-        filter_binary = truncated_binary[8:11]
-
-        if binary_coding_scheme == CPI.BinaryCodingScheme.CPI_96:
-            cpi_binary = truncated_binary[11:65]
-            serial_binary = truncated_binary[65:]
-            cpi_string = decode_partition_table(
-                cpi_binary, PARTITION_TABLE_P_96, unpadded_partition=True
-            )
-        else:
-            cpi_binary = truncated_binary[11:]
-
-            cpi_string = decode_partition_table(
-                cpi_binary, PARTITION_TABLE_P_VAR, six_bit_variable_partition=True
-            )
-
-            partition = PARTITION_TABLE_P_VAR[binary_to_int(cpi_binary[:3])]
-            possible_serial_binary = truncated_binary[(11 + 3 + partition["M"]) :]
-
-            serial_binary = ""
-            is_serial = False
-            for g in re.split("([0-1]{6})", possible_serial_binary):
-                if is_serial:
-                    serial_binary += g
-                if g == "000000":
-                    is_serial = True
-
-            serial_binary = serial_binary[:40] if len(serial_binary) > 0 else "0"
-
-        filter_string = binary_to_int(filter_binary)
-        serial_string = binary_to_int(serial_binary)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{cpi_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._cp_ref, self._serial], filter_value.value
         )
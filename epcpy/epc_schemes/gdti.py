@@ -1,26 +1,25 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    decode_string,
-    encode_partition_table,
-    encode_string,
-    parse_header_and_truncate_binary,
     replace_uri_escapes,
     revert_uri_escapes,
-    str_to_binary,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import GDTI_GS1_ELEMENT_STRING, GDTI_URI
-
-GDTI_URI_REGEX = re.compile(GDTI_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Integer,
+    Layout,
+    Partition,
+    String,
+)
+from epcpy.utils.tokenizers import GDTI_GS1_ELEMENT_STRING_TOKENIZER, GDTI_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -119,6 +118,8 @@ class GDTI(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_doc_type", "_serial", "_gdti")
+
     class BinaryCodingScheme(Enum):
         GDTI_96 = "gdti-96"
         GDTI_174 = "gdti-174"
@@ -127,19 +128,37 @@ class GDTI(TagEncodable, GS1Keyed):
         GDTI_96 = "00101100"
         GDTI_174 = "00111110"
 
-    gs1_element_string_regex = re.compile(GDTI_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.GDTI_96,
+            BinaryHeader.GDTI_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Integer(41),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.GDTI_174,
+            BinaryHeader.GDTI_174,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                String(119, max_length=17),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = GDTI_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GDTI_URI_REGEX.fullmatch(epc_uri):
+        components = GDTI_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GDTI URI {epc_uri}")
 
-        self._serial = ".".join(":".join(epc_uri.split(":")[4:]).split(".")[2:])
+        self._company_pref, self._doc_type, self._serial = components
         verify_gs3a3_component(self._serial)
 
-        self._company_pref, self._doc_type = epc_uri.split(":")[4].split(".")[:2]
-
         if (
             len(f"{self._company_pref}{self._doc_type}") != 12
             or len(self._serial) > 17
@@ -149,11 +168,30 @@ class GDTI(TagEncodable, GS1Keyed):
                 message=f"Invalid GDTI URI {epc_uri} | Company prefix + document type must be 12 digits"
             )
 
-        self.epc_uri = epc_uri
         check_digit = calculate_checksum(f"{self._company_pref}{self._doc_type}")
 
         self._gdti = f"{self._company_pref}{self._doc_type}{check_digit}{replace_uri_escapes(self._serial)}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> GDTI:
+        """Create an GDTI instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, document type and serial
+
+        Returns:
+            GDTI: GDTI instance
+        """
+        gdti = cls.__new__(cls)
+        super(GDTI, gdti).__init__(f"urn:epc:id:gdti:{'.'.join(components)}")
+
+        gdti._company_pref, gdti._doc_type, gdti._serial = components
+
+        check_digit = calculate_checksum(f"{gdti._company_pref}{gdti._doc_type}")
+        gdti._gdti = f"{gdti._company_pref}{gdti._doc_type}{check_digit}{replace_uri_escapes(gdti._serial)}"
+
+        return gdti
+
     def gs1_key(self) -> str:
         """GS1 key belonging to this GDTI instance
 
@@ -172,27 +210,32 @@ class GDTI(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GDTI:
         """Create a GDTI instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GDTI GS1 element string invalid
+            ConvertException: GDTI GS1 element string invalid or company prefix unknown
 
         Returns:
             GDTI: GDTI scheme
         """
-        if not GDTI.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GDTI_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GDTI GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[5:18]
-        chars = gs1_element_string[18:]
+        (value,) = values
+        digits = value[:13]
+        chars = value[13:]
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
         chars = revert_uri_escapes(chars)
 
         return cls(
@@ -234,61 +277,20 @@ class GDTI(TagEncodable, GS1Keyed):
 
         return f"{self.TAG_URI_PREFIX}{scheme}:{filter_val}.{self._company_pref}.{self._doc_type}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme,
         filter_value: GDTIFilterValue,
-    ) -> str:
-        """Return the binary representation belonging to this GDTI with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this GDTI with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (GDTIFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        parts = [self._company_pref, self._doc_type]
-
-        header = GDTI.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        gdti_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-        serial_binary = (
-            str_to_binary(self._serial, 41)
-            if binary_coding_scheme == GDTI.BinaryCodingScheme.GDTI_96
-            else encode_string(self._serial, 119)
-        )
-
-        _binary = header + filter_binary + gdti_binary + serial_binary
-        return _binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> GDTI:
-        """Create an GDTI instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an GDTI
-
-        Returns:
-            GDTI: GDTI instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        gdti_binary = truncated_binary[11:55]
-        serial_binary = truncated_binary[55:]
-
-        filter_string = binary_to_int(filter_binary)
-        gdti_string = decode_partition_table(gdti_binary, PARTITION_TABLE_P)
-
-        serial_string = (
-            binary_to_int(serial_binary)
-            if binary_coding_scheme == GDTI.BinaryCodingScheme.GDTI_96
-            else decode_string(serial_binary)
-        )
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{gdti_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._doc_type, self._serial], filter_value.value
         )
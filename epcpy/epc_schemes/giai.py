@@ -1,23 +1,22 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
-    decode_partition_table,
-    encode_partition_table,
-    parse_header_and_truncate_binary,
     replace_uri_escapes,
     revert_uri_escapes,
-    str_to_binary,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import GIAI_GS1_ELEMENT_STRING, GIAI_URI
-
-GIAI_URI_REGEX = re.compile(GIAI_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Layout,
+    Partition,
+)
+from epcpy.utils.tokenizers import GIAI_GS1_ELEMENT_STRING_TOKENIZER, GIAI_URI_TOKENIZER
 
 PARTITION_TABLE_P_96 = {
     0: {
@@ -178,6 +177,8 @@ class GIAI(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_asset_ref", "_giai")
+
     class BinaryCodingScheme(Enum):
         GIAI_96 = "giai-96"
         GIAI_202 = "giai-202"
@@ -186,16 +187,40 @@ class GIAI(TagEncodable, GS1Keyed):
         GIAI_96 = "00110100"
         GIAI_202 = "00111000"
 
-    gs1_element_string_regex = re.compile(GIAI_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.GIAI_96,
+            BinaryHeader.GIAI_96,
+            [
+                Partition(
+                    PARTITION_TABLE_P_96, PARTITION_TABLE_L_96, unpadded_partition=True
+                ),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.GIAI_202,
+            BinaryHeader.GIAI_202,
+            [
+                Partition(
+                    PARTITION_TABLE_P_202,
+                    PARTITION_TABLE_L_202,
+                    string_partition=True,
+                    max_length=30,
+                ),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = GIAI_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GIAI_URI_REGEX.fullmatch(epc_uri):
+        components = GIAI_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GIAI URI {epc_uri}")
 
-        company_prefix, *asset_reference = epc_uri.split(":")[4].split(".")
-        asset_reference = ".".join(asset_reference)
+        company_prefix, asset_reference = components
 
         if (
             not (6 <= len(company_prefix) <= 12)
@@ -207,12 +232,29 @@ class GIAI(TagEncodable, GS1Keyed):
 
         verify_gs3a3_component(asset_reference)
 
-        self.epc_uri = epc_uri
-
         self._company_pref = company_prefix
         self._asset_ref = asset_reference
         self._giai = f"{company_prefix}{replace_uri_escapes(asset_reference)}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> GIAI:
+        """Create an GIAI instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix and asset reference
+
+        Returns:
+            GIAI: GIAI instance
+        """
+        giai = cls.__new__(cls)
+        super(GIAI, giai).__init__(f"urn:epc:id:giai:{'.'.join(components)}")
+
+        giai._company_pref, giai._asset_ref = components
+
+        giai._giai = f"{giai._company_pref}{replace_uri_escapes(giai._asset_ref)}"
+
+        return giai
+
     def gs1_key(self) -> str:
         """GS1 key belonging to this GIAI instance
 
@@ -231,27 +273,32 @@ class GIAI(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GIAI:
         """Create a GIAI instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GIAI GS1 element string invalid
+            ConvertException: GIAI GS1 element string invalid or company prefix unknown
 
         Returns:
             GIAI: GIAI scheme
         """
-        if not GIAI.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GIAI_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GIAI GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[6 : 6 + company_prefix_length]
-        chars = gs1_element_string[6 + company_prefix_length :]
+        (value,) = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(value)
+        digits = value[:company_prefix_length]
+        chars = value[company_prefix_length:]
         chars = revert_uri_escapes(chars)
 
         return cls(f"urn:epc:id:giai:{digits}.{chars}")
@@ -294,66 +341,20 @@ class GIAI(TagEncodable, GS1Keyed):
 
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_val}.{self._company_pref}.{self._asset_ref}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme,
         filter_value: GIAIFilterValue,
-    ) -> str:
-        """Return the binary representation belonging to this GIAI with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this GIAI with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (GIAIFilterValue): Filter value
 
         Returns:
-            str: binary representation
-        """
-        header = GIAI.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        parts = [self._company_pref, self._asset_ref]
-
-        giai_binary = (
-            encode_partition_table(parts, PARTITION_TABLE_L_96)
-            if binary_coding_scheme == GIAI.BinaryCodingScheme.GIAI_96
-            else encode_partition_table(
-                parts,
-                PARTITION_TABLE_L_202,
-                string_partition=True,
-            )
-        )
-
-        _binary = header + filter_binary + giai_binary
-        return _binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> GIAI:
-        """Create an GIAI instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an GIAI
-
-        Returns:
-            GIAI: GIAI instance
+            BitWriter: encoded bits
         """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-        filter_binary = truncated_binary[8:11]
-        giai_binary = truncated_binary[11:]
-
-        filter_string = binary_to_int(filter_binary)
-
-        giai_string = (
-            decode_partition_table(
-                giai_binary, PARTITION_TABLE_P_96, unpadded_partition=True
-            )
-            if binary_coding_scheme == GIAI.BinaryCodingScheme.GIAI_96
-            else decode_partition_table(
-                giai_binary, PARTITION_TABLE_P_202, string_partition=True
-            )
-        )
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{giai_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._asset_ref], filter_value.value
         )
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Sequence
 
 from epcpy.epc_schemes.base_scheme import TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import GID_URI
-
-GID_URI_REGEX = re.compile(GID_URI)
+from epcpy.utils.layout import (
+    Integer,
+    Layout,
+)
+from epcpy.utils.tokenizers import GID_URI_TOKENIZER
 
 
 class GID(TagEncodable):
@@ -35,19 +35,35 @@ class GID(TagEncodable):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_manager", "_object", "_serial")
+
     class BinaryCodingScheme(Enum):
         GID_96 = "gid-96"
 
     class BinaryHeader(Enum):
         GID_96 = "00110101"
 
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.GID_96,
+            BinaryHeader.GID_96,
+            [
+                Integer(28),
+                Integer(24),
+                Integer(36),
+            ],
+            filter_bits=0,
+        ),
+    )
+
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GID_URI_REGEX.fullmatch(epc_uri):
+        components = GID_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GID URI {epc_uri}")
 
-        self._manager, self._object, self._serial = epc_uri.split(":")[4].split(".")
+        self._manager, self._object, self._serial = components
 
         if int(self._manager) >= pow(2, 28):
             raise ConvertException(message=f"Manager out of range: (max: {pow(2, 28)})")
@@ -60,7 +76,22 @@ class GID(TagEncodable):
         ):
             raise ConvertException(message=f"Serial out of range: (max: {pow(2, 36)})")
 
-        self.epc_uri = epc_uri
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> GID:
+        """Create an GID instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): General manager number, object class and serial
+
+        Returns:
+            GID: GID instance
+        """
+        gid = cls.__new__(cls)
+        super(GID, gid).__init__(f"urn:epc:id:gid:{'.'.join(components)}")
+
+        gid._manager, gid._object, gid._serial = components
+
+        return gid
 
     def tag_uri(
         self,
@@ -77,26 +108,22 @@ class GID(TagEncodable):
         """
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{self._manager}.{self._object}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.GID_96,
-    ) -> str:
-        """Return the binary representation belonging to this GID with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this GID with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (GIDFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        header = GID.BinaryHeader[binary_coding_scheme.name].value
-        manager_binary = str_to_binary(self._manager, 28)
-        object_binary = str_to_binary(self._object, 24)
-        serial_binary = str_to_binary(self._serial, 36)
-
-        _binary = header + manager_binary + object_binary + serial_binary
-        return _binary
+        return self._layouts[binary_coding_scheme].encode(
+            [self._manager, self._object, self._serial]
+        )
 
     @classmethod
     def from_tag_uri(cls, epc_tag_uri: str, includes_filter=False):
@@ -113,31 +140,3 @@ class GID(TagEncodable):
         return super(GID, cls).from_tag_uri(
             epc_tag_uri, includes_filter=includes_filter
         )
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> GID:
-        """Create an GID instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an GID
-
-        Returns:
-            GID: GID instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        manager_binary = truncated_binary[8:36]
-        object_binary = truncated_binary[36:60]
-        serial_binary = truncated_binary[60:]
-
-        manager_string = binary_to_int(manager_binary)
-        object_string = binary_to_int(object_binary)
-        serial_string = binary_to_int(serial_binary)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{manager_string}.{object_string}.{serial_string}",
-            includes_filter=False,
-        )
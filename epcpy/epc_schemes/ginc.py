@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+from typing import Optional
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed
 from epcpy.utils.common import (
@@ -9,9 +9,8 @@ from epcpy.utils.common import (
     revert_uri_escapes,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import GINC_GS1_ELEMENT_STRING, GINC_URI
-
-GINC_URI_REGEX = re.compile(GINC_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.tokenizers import GINC_GS1_ELEMENT_STRING_TOKENIZER, GINC_URI_TOKENIZER
 
 
 class GINC(GS1Keyed):
@@ -31,19 +30,18 @@ class GINC(GS1Keyed):
         gs1_element_string (str): GS1 element string
     """
 
-    gs1_element_string_regex = re.compile(GINC_GS1_ELEMENT_STRING)
+    __slots__ = ("_ginc",)
+
+    gs1_element_string_tokenizer = GINC_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GINC_URI_REGEX.fullmatch(epc_uri):
+        components = GINC_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GINC URI {epc_uri}")
 
-        company_prefix, *consignment_reference_components = ":".join(
-            epc_uri.split(":")[4:]
-        ).split(".")
-
-        consignment_reference = ".".join(consignment_reference_components)
+        company_prefix, consignment_reference = components
         verify_gs3a3_component(consignment_reference)
         consignment_reference = replace_uri_escapes(consignment_reference)
 
@@ -58,7 +56,6 @@ class GINC(GS1Keyed):
         if len(f"{company_prefix}{consignment_reference}") > 30:
             raise ConvertException(message=f"Complete component length too large (>30)")
 
-        self.epc_uri = epc_uri
         self._ginc = f"{company_prefix}{consignment_reference}"
 
     def gs1_key(self) -> str:
@@ -79,27 +76,32 @@ class GINC(GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GINC:
         """Create a GINC instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GINC GS1 element string invalid
+            ConvertException: GINC GS1 element string invalid or company prefix unknown
 
         Returns:
             GINC: GINC scheme
         """
-        if not GINC.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GINC_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GINC GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[5 : 5 + company_prefix_length]
-        chars = gs1_element_string[5 + company_prefix_length :]
+        (value,) = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(value)
+        digits = value[:company_prefix_length]
+        chars = value[company_prefix_length:]
         chars = revert_uri_escapes(chars)
 
         return cls(f"urn:epc:id:ginc:{digits}.{chars}")
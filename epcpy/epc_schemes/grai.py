@@ -1,26 +1,25 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    decode_string,
-    encode_partition_table,
-    encode_string,
-    parse_header_and_truncate_binary,
     replace_uri_escapes,
     revert_uri_escapes,
-    str_to_binary,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import GRAI_GS1_ELEMENT_STRING, GRAI_URI
-
-GRAI_URI_REGEX = re.compile(GRAI_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Integer,
+    Layout,
+    Partition,
+    String,
+)
+from epcpy.utils.tokenizers import GRAI_GS1_ELEMENT_STRING_TOKENIZER, GRAI_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -119,6 +118,8 @@ class GRAI(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_asset_type", "_serial", "_grai")
+
     class BinaryCodingScheme(Enum):
         GRAI_96 = "grai-96"
         GRAI_170 = "grai-170"
@@ -127,19 +128,37 @@ class GRAI(TagEncodable, GS1Keyed):
         GRAI_96 = "00110011"
         GRAI_170 = "00110111"
 
-    gs1_element_string_regex = re.compile(GRAI_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.GRAI_96,
+            BinaryHeader.GRAI_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Integer(38),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.GRAI_170,
+            BinaryHeader.GRAI_170,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                String(112, max_length=16),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = GRAI_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GRAI_URI_REGEX.fullmatch(epc_uri):
+        components = GRAI_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GRAI URI {epc_uri}")
 
-        self._serial = ".".join(":".join(epc_uri.split(":")[4:]).split(".")[2:])
+        self._company_pref, self._asset_type, self._serial = components
         verify_gs3a3_component(self._serial)
 
-        self._company_pref, self._asset_type = epc_uri.split(":")[4].split(".")[:2]
-
         if (
             len(f"{self._company_pref}{self._asset_type}") != 12
             or not (6 <= len(self._company_pref) <= 12)
@@ -147,11 +166,29 @@ class GRAI(TagEncodable, GS1Keyed):
         ):
             raise ConvertException(message=f"Invalid EPC URI {epc_uri}")
 
-        self.epc_uri = epc_uri
-
         check_digit = calculate_checksum(f"{self._company_pref}{self._asset_type}")
         self._grai = f"{self._company_pref}{self._asset_type}{check_digit}{replace_uri_escapes(self._serial)}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> GRAI:
+        """Create an GRAI instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, asset type and serial
+
+        Returns:
+            GRAI: GRAI instance
+        """
+        grai = cls.__new__(cls)
+        super(GRAI, grai).__init__(f"urn:epc:id:grai:{'.'.join(components)}")
+
+        grai._company_pref, grai._asset_type, grai._serial = components
+
+        check_digit = calculate_checksum(f"{grai._company_pref}{grai._asset_type}")
+        grai._grai = f"{grai._company_pref}{grai._asset_type}{check_digit}{replace_uri_escapes(grai._serial)}"
+
+        return grai
+
     def gs1_key(self) -> str:
         """GS1 key belonging to this GRAI instance
 
@@ -170,27 +207,32 @@ class GRAI(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GRAI:
         """Create a GRAI instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GRAI GS1 element string invalid
+            ConvertException: GRAI GS1 element string invalid or company prefix unknown
 
         Returns:
             GRAI: GRAI scheme
         """
-        if not GRAI.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GRAI_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GRAI GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[7:20]
-        chars = gs1_element_string[20:]
+        (value,) = values
+        digits = value[1:14]
+        chars = value[14:]
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
         chars = revert_uri_escapes(chars)
 
         return cls(
@@ -229,62 +271,20 @@ class GRAI(TagEncodable, GS1Keyed):
 
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_val}.{self._company_pref}.{self._asset_type}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme,
         filter_value: GRAIFilterValue,
-    ) -> str:
-        """Return the binary representation belonging to this GRAI with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this GRAI with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (GRAIFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        parts = [self._company_pref, self._asset_type]
-
-        header = GRAI.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        grai_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-        serial_binary = (
-            str_to_binary(self._serial, 38)
-            if binary_coding_scheme == GRAI.BinaryCodingScheme.GRAI_96
-            else encode_string(self._serial, 112)
-        )
-
-        _binary = header + filter_binary + grai_binary + serial_binary
-        return _binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> GRAI:
-        """Create an GRAI instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an GRAI
-
-        Returns:
-            GRAI: GRAI instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        grai_binary = truncated_binary[11:58]
-        serial_binary = truncated_binary[58:]
-
-        filter_string = binary_to_int(filter_binary)
-        grai_string = decode_partition_table(grai_binary, PARTITION_TABLE_P)
-
-        serial_string = (
-            binary_to_int(serial_binary)
-            if binary_coding_scheme == GRAI.BinaryCodingScheme.GRAI_96
-            else decode_string(serial_binary)
-        )
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{grai_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._asset_type, self._serial], filter_value.value
         )
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import re
+from typing import Optional
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed
 from epcpy.utils.common import ConvertException
-from epcpy.utils.regex import GSIN_GS1_ELEMENT_STRING, GSIN_URI
-
-GSIN_URI_REGEX = re.compile(GSIN_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.tokenizers import GSIN_GS1_ELEMENT_STRING_TOKENIZER, GSIN_URI_TOKENIZER
 
 
 def calculate_checksum(digits: str) -> int:
@@ -46,15 +45,18 @@ class GSIN(GS1Keyed):
         gs1_element_string (str): GS1 element string
     """
 
-    gs1_element_string_regex = re.compile(GSIN_GS1_ELEMENT_STRING)
+    __slots__ = ("_company_prefix", "_shipper_ref", "_gsin")
+
+    gs1_element_string_tokenizer = GSIN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GSIN_URI_REGEX.fullmatch(epc_uri):
+        components = GSIN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GSIN URI {epc_uri}")
 
-        self._company_prefix, self._shipper_ref = epc_uri.split(":")[4].split(".")
+        self._company_prefix, self._shipper_ref = components
 
         if len(f"{self._company_prefix}{self._shipper_ref}") != 16 or not (
             6 <= len(self._company_prefix) <= 12
@@ -63,7 +65,6 @@ class GSIN(GS1Keyed):
                 message=f"Invalid component length {len(epc_uri.split(':')[4].replace('.', ''))}"
             )
 
-        self.epc_uri = epc_uri
         check_digit = calculate_checksum(f"{self._company_prefix}{self._shipper_ref}")
 
         self._gsin = f"{self._company_prefix}{self._shipper_ref}{check_digit}"
@@ -86,26 +87,30 @@ class GSIN(GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GSIN:
         """Create a GSIN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GSIN GS1 element string invalid
+            ConvertException: GSIN GS1 element string invalid or company prefix unknown
 
         Returns:
             GSIN: GSIN scheme
         """
-        if not GSIN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GSIN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GSIN GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[5:-1]
+        digits = values[0][:-1]
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
 
         return cls(
             f"urn:epc:id:gsin:{digits[:company_prefix_length]}.{digits[company_prefix_length:]}"
@@ -1,22 +1,21 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    encode_partition_table,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import GSRN_GS1_ELEMENT_STRING, GSRN_URI
-
-GSRN_URI_REGEX = re.compile(GSRN_URI)
-
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Layout,
+    Partition,
+    Reserved,
+)
+from epcpy.utils.tokenizers import GSRN_GS1_ELEMENT_STRING_TOKENIZER, GSRN_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -115,21 +114,35 @@ class GSRN(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_service_ref", "_gsrn")
+
     class BinaryCodingScheme(Enum):
         GSRN_96 = "gsrn-96"
 
     class BinaryHeader(Enum):
         GSRN_96 = "00101101"
 
-    gs1_element_string_regex = re.compile(GSRN_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.GSRN_96,
+            BinaryHeader.GSRN_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Reserved(24),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = GSRN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GSRN_URI_REGEX.fullmatch(epc_uri):
+        components = GSRN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GSRN URI {epc_uri}")
 
-        self._company_pref, self._service_ref = epc_uri.split(":")[4].split(".")
+        self._company_pref, self._service_ref = components
 
         if len(f"{self._company_pref}{self._service_ref}") != 17 or not (
             6 <= len(self._company_pref) <= 12
@@ -138,12 +151,30 @@ class GSRN(TagEncodable, GS1Keyed):
                 message=f"Invalid EPC URI {epc_uri} | wrong number of digits"
             )
 
-        self.epc_uri = epc_uri
-
         check_digit = calculate_checksum(f"{self._company_pref}{self._service_ref}")
 
         self._gsrn = f"{self._company_pref}{self._service_ref}{check_digit}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> GSRN:
+        """Create an GSRN instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix and service reference
+
+        Returns:
+            GSRN: GSRN instance
+        """
+        gsrn = cls.__new__(cls)
+        super(GSRN, gsrn).__init__(f"urn:epc:id:gsrn:{'.'.join(components)}")
+
+        gsrn._company_pref, gsrn._service_ref = components
+
+        check_digit = calculate_checksum(f"{gsrn._company_pref}{gsrn._service_ref}")
+        gsrn._gsrn = f"{gsrn._company_pref}{gsrn._service_ref}{check_digit}"
+
+        return gsrn
+
     def gs1_key(self) -> str:
         """GS1 key belonging to this GSRN instance
 
@@ -162,26 +193,30 @@ class GSRN(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GSRN:
         """Create a GSRN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GSRN GS1 element string invalid
+            ConvertException: GSRN GS1 element string invalid or company prefix unknown
 
         Returns:
             GSRN: GSRN scheme
         """
-        if not GSRN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GSRN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GSRN GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[6:]
+        (digits,) = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
 
         return cls(
             f"urn:epc:id:gsrn:{digits[:company_prefix_length]}.{digits[company_prefix_length:-1]}"
@@ -203,49 +238,20 @@ class GSRN(TagEncodable, GS1Keyed):
         """
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._company_pref}.{self._service_ref}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.GSRN_96,
         filter_value: GSRNFilterValue = GSRNFilterValue.ALL_OTHERS,
-    ) -> str:
-        """Return the binary representation belonging to this GSRN with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this GSRN with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (GSRNFilterValue): Filter value
 
         Returns:
-            str: binary representation
-        """
-        parts = [self._company_pref, self._service_ref]
-
-        header = GSRN.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        gsrn_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-
-        return header + filter_binary + gsrn_binary + "0" * 24
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> GSRN:
-        """Create an GSRN instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an GSRN
-
-        Returns:
-            GSRN: GSRN instance
+            BitWriter: encoded bits
         """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        gsrn_binary = truncated_binary[11:72]
-
-        filter_string = binary_to_int(filter_binary)
-        gsrn_string = decode_partition_table(gsrn_binary, PARTITION_TABLE_P)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{gsrn_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._service_ref], filter_value.value
         )
@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    encode_partition_table,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import GSRNP_GS1_ELEMENT_STRING, GSRNP_URI
-
-GSRNP_URI_REGEX = re.compile(GSRNP_URI)
-
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Layout,
+    Partition,
+    Reserved,
+)
+from epcpy.utils.tokenizers import (
+    GSRNP_GS1_ELEMENT_STRING_TOKENIZER,
+    GSRNP_URI_TOKENIZER,
+)
 
 PARTITION_TABLE_P = {
     0: {
@@ -115,21 +117,35 @@ class GSRNP(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_service_ref", "_gsrnp")
+
     class BinaryCodingScheme(Enum):
         GSRNP_96 = "gsrnp-96"
 
     class BinaryHeader(Enum):
         GSRNP_96 = "00101110"
 
-    gs1_element_string_regex = re.compile(GSRNP_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.GSRNP_96,
+            BinaryHeader.GSRNP_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Reserved(24),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = GSRNP_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not GSRNP_URI_REGEX.fullmatch(epc_uri):
+        components = GSRNP_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid GSRNP URI {epc_uri}")
 
-        self._company_pref, self._service_ref = epc_uri.split(":")[4].split(".")
+        self._company_pref, self._service_ref = components
 
         if len(f"{self._company_pref}{self._service_ref}") != 17 or not (
             6 <= len(self._company_pref) <= 12
@@ -138,12 +154,30 @@ class GSRNP(TagEncodable, GS1Keyed):
                 message=f"Invalid EPC URI {epc_uri} | wrong number of digits"
             )
 
-        self.epc_uri = epc_uri
-
         check_digit = calculate_checksum(f"{self._company_pref}{self._service_ref}")
 
         self._gsrnp = f"{self._company_pref}{self._service_ref}{check_digit}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> GSRNP:
+        """Create an GSRNP instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix and service reference
+
+        Returns:
+            GSRNP: GSRNP instance
+        """
+        gsrnp = cls.__new__(cls)
+        super(GSRNP, gsrnp).__init__(f"urn:epc:id:gsrnp:{'.'.join(components)}")
+
+        gsrnp._company_pref, gsrnp._service_ref = components
+
+        check_digit = calculate_checksum(f"{gsrnp._company_pref}{gsrnp._service_ref}")
+        gsrnp._gsrnp = f"{gsrnp._company_pref}{gsrnp._service_ref}{check_digit}"
+
+        return gsrnp
+
     def gs1_key(self) -> str:
         """GS1 key belonging to this GSRNP instance
 
@@ -162,26 +196,30 @@ class GSRNP(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> GSRNP:
         """Create a GSRNP instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: GSRNP GS1 element string invalid
+            ConvertException: GSRNP GS1 element string invalid or company prefix unknown
 
         Returns:
             GSRNP: GSRNP scheme
         """
-        if not GSRNP.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = GSRNP_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid GSRNP GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[6:]
+        (digits,) = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
 
         return cls(
             f"urn:epc:id:gsrnp:{digits[:company_prefix_length]}.{digits[company_prefix_length:-1]}"
@@ -205,49 +243,20 @@ class GSRNP(TagEncodable, GS1Keyed):
 
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_val}.{self._company_pref}.{self._service_ref}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.GSRNP_96,
         filter_value: GSRNPFilterValue = GSRNPFilterValue.ALL_OTHERS,
-    ) -> str:
-        """Return the binary representation belonging to this GSRNP with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this GSRNP with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (GSRNPFilterValue): Filter value
 
         Returns:
-            str: binary representation
-        """
-        parts = [self._company_pref, self._service_ref]
-
-        header = GSRNP.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        gsrnp_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-
-        return header + filter_binary + gsrnp_binary + "0" * 24
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> GSRNP:
-        """Create an GSRNP instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an GSRNP
-
-        Returns:
-            GSRNP: GSRNP instance
+            BitWriter: encoded bits
         """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        gsrnp_binary = truncated_binary[11:72]
-
-        filter_string = binary_to_int(filter_binary)
-        gsrnp_string = decode_partition_table(gsrnp_binary, PARTITION_TABLE_P)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{gsrnp_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._service_ref], filter_value.value
         )
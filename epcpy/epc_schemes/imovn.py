@@ -1,10 +1,6 @@
-import re
-
 from epcpy.epc_schemes.base_scheme import EPCScheme
 from epcpy.utils.common import ConvertException
-from epcpy.utils.regex import IMOVN_URI
-
-IMOVN_URI_REGEX = re.compile(IMOVN_URI)
+from epcpy.utils.tokenizers import IMOVN_URI_TOKENIZER
 
 
 class IMOVN(EPCScheme):
@@ -19,12 +15,13 @@ class IMOVN(EPCScheme):
     This class can be created using EPC pure identities via its constructor
     """
 
+    __slots__ = ("_vessel_number",)
+
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not IMOVN_URI_REGEX.fullmatch(epc_uri):
+        components = IMOVN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid IMOVN URI {epc_uri}")
 
-        self.epc_uri = epc_uri
-
-        self._vessel_number = epc_uri.split(":")[4]
+        (self._vessel_number,) = components
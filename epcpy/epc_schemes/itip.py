@@ -1,28 +1,26 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Element, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_fixed_width_integer,
-    decode_partition_table,
-    decode_string,
-    encode_fixed_width_integer,
-    encode_partition_table,
-    encode_string,
-    parse_header_and_truncate_binary,
     replace_uri_escapes,
     revert_uri_escapes,
-    str_to_binary,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import ITIP_GS1_ELEMENT_STRING, ITIP_URI
-
-ITIP_URI_REGEX = re.compile(ITIP_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    FixedWidthInteger,
+    Integer,
+    Layout,
+    Partition,
+    String,
+)
+from epcpy.utils.tokenizers import ITIP_GS1_ELEMENT_STRING_TOKENIZER, ITIP_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -120,6 +118,8 @@ class ITIP(GS1Element, TagEncodable):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_item_ref", "_piece", "_total", "_serial")
+
     class BinaryCodingScheme(Enum):
         ITIP_110 = "itip-110"
         ITIP_212 = "itip-212"
@@ -128,12 +128,36 @@ class ITIP(GS1Element, TagEncodable):
         ITIP_110 = "01000000"
         ITIP_212 = "01000001"
 
-    gs1_element_string_regex = re.compile(ITIP_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.ITIP_110,
+            BinaryHeader.ITIP_110,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                FixedWidthInteger(7),
+                FixedWidthInteger(7),
+                Integer(38),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.ITIP_212,
+            BinaryHeader.ITIP_212,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                FixedWidthInteger(7),
+                FixedWidthInteger(7),
+                String(140),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = ITIP_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not ITIP_URI_REGEX.fullmatch(epc_uri):
+        components = ITIP_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid ITIP URI {epc_uri}")
 
         (
@@ -141,10 +165,8 @@ class ITIP(GS1Element, TagEncodable):
             self._item_ref,
             self._piece,
             self._total,
-            *serial,
-        ) = ":".join(epc_uri.split(":")[4:]).split(".")
-
-        self._serial = ".".join(serial)
+            self._serial,
+        ) = components
         verify_gs3a3_component(self._serial)
 
         if (
@@ -154,7 +176,28 @@ class ITIP(GS1Element, TagEncodable):
         ):
             raise ConvertException(message=f"Invalid ITIP URI {epc_uri}")
 
-        self.epc_uri = epc_uri
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> ITIP:
+        """Create an ITIP instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, item reference, piece, total and serial
+
+        Returns:
+            ITIP: ITIP instance
+        """
+        itip = cls.__new__(cls)
+        super(ITIP, itip).__init__(f"urn:epc:id:itip:{'.'.join(components)}")
+
+        (
+            itip._company_pref,
+            itip._item_ref,
+            itip._piece,
+            itip._total,
+            itip._serial,
+        ) = components
+
+        return itip
 
     def gs1_element_string(self) -> str:
         """Returns the GS1 element string
@@ -171,27 +214,30 @@ class ITIP(GS1Element, TagEncodable):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> ITIP:
         """Create a ITIP instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: ITIP GS1 element string invalid
+            ConvertException: ITIP GS1 element string invalid or company prefix unknown
 
         Returns:
             ITIP: ITIP scheme
         """
-        if not ITIP.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = ITIP_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid ITIP GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[6:24]
-        chars = gs1_element_string[28:]
+        digits, chars = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits[1:])
         chars = revert_uri_escapes(chars)
 
         return cls(
@@ -230,73 +276,27 @@ class ITIP(GS1Element, TagEncodable):
 
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_val}.{self._company_pref}.{self._item_ref}.{self._piece}.{self._total}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         filter_value: ITIPFilterValue,
         binary_coding_scheme: BinaryCodingScheme,
-    ) -> str:
-        """Return the binary representation belonging to this ITIP with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this ITIP with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (ITIPFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        parts = [self._company_pref, self._item_ref]
-
-        header = ITIP.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        gtin_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-        piece_binary = encode_fixed_width_integer(self._piece, 7)
-        total_binary = encode_fixed_width_integer(self._total, 7)
-        serial_binary = (
-            str_to_binary(self._serial, 38)
-            if binary_coding_scheme == ITIP.BinaryCodingScheme.ITIP_110
-            else encode_string(self._serial, 140)
-        )
-
-        return (
-            header
-            + filter_binary
-            + gtin_binary
-            + piece_binary
-            + total_binary
-            + serial_binary
-        )
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> ITIP:
-        """Create an ITIP instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an ITIP
-
-        Returns:
-            ITIP: ITIP instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        gtin_binary = truncated_binary[11:58]
-        piece_binary = truncated_binary[58:65]
-        total_binary = truncated_binary[65:72]
-        serial_binary = truncated_binary[72:]
-
-        filter_string = binary_to_int(filter_binary)
-        gtin_string = decode_partition_table(gtin_binary, PARTITION_TABLE_P)
-        piece_string = decode_fixed_width_integer(piece_binary)
-        total_string = decode_fixed_width_integer(total_binary)
-        serial_string = (
-            binary_to_int(serial_binary)
-            if binary_coding_scheme == ITIP.BinaryCodingScheme.ITIP_110
-            else decode_string(serial_binary)
-        )
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{gtin_string}.{piece_string}.{total_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [
+                self._company_pref,
+                self._item_ref,
+                self._piece,
+                self._total,
+                self._serial,
+            ],
+            filter_value.value,
         )
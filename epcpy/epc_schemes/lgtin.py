@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import re
 from enum import IntEnum
+from typing import Optional
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed
 from epcpy.utils.common import (
@@ -11,9 +11,11 @@ from epcpy.utils.common import (
     revert_uri_escapes,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import LGTIN_CLASS, LGTIN_GS1_ELEMENT_STRING
-
-LGTIN_CLASS_REGEX = re.compile(LGTIN_CLASS)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.tokenizers import (
+    LGTIN_CLASS_TOKENIZER,
+    LGTIN_GS1_ELEMENT_STRING_TOKENIZER,
+)
 
 
 class GTIN_TYPE(IntEnum):
@@ -40,21 +42,20 @@ class LGTIN(GS1Keyed):
         gs1_element_string (str): GS1 element string
     """
 
-    gs1_element_string_regex = re.compile(LGTIN_GS1_ELEMENT_STRING)
+    __slots__ = ("_company_pref", "_item_ref", "_lot", "_gtin")
+
+    gs1_element_string_tokenizer = LGTIN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_class) -> None:
         super().__init__(epc_class)
 
-        if not LGTIN_CLASS_REGEX.fullmatch(epc_class):
+        components = LGTIN_CLASS_TOKENIZER.tokenize(epc_class)
+        if components is None:
             raise ConvertException(message=f"Invalid LGTIN CLASS {epc_class}")
 
-        self._company_pref, self._item_ref, *lot = ":".join(
-            epc_class.split(":")[4:]
-        ).split(".")
-
-        self._lot = ".".join(lot)
-        verify_gs3a3_component(self._lot)
-        self._lot = replace_uri_escapes(self._lot)
+        self._company_pref, self._item_ref, lot = components
+        verify_gs3a3_component(lot)
+        self._lot = replace_uri_escapes(lot)
 
         if not (6 <= len(self._company_pref) <= 12):
             raise ConvertException(
@@ -69,8 +70,6 @@ class LGTIN(GS1Keyed):
         if not (1 <= len(self._lot) <= 20):
             raise ConvertException(message="Invalid lot length")
 
-        self.epc_uri = epc_class
-
         check_digit = calculate_checksum(
             f"{self._item_ref[0]}{self._company_pref}{self._item_ref[1:]}"
         )
@@ -122,26 +121,30 @@ class LGTIN(GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> LGTIN:
         """Create a LGTIN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: LGTIN GS1 element string invalid
+            ConvertException: LGTIN GS1 element string invalid or company prefix unknown
 
         Returns:
             LGTIN: LGTIN scheme
         """
-        if not LGTIN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = LGTIN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid LGTIN GS1 element string {gs1_element_string}"
             )
 
-        _, digits, chars = re.split(f"\(.{{2}}\)", gs1_element_string)
+        digits, chars = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits[1:])
         chars = revert_uri_escapes(chars)
 
         return cls(
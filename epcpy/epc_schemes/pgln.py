@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import re
+from typing import Optional
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed
 from epcpy.utils.common import ConvertException, calculate_checksum
-from epcpy.utils.regex import PGLN_GS1_ELEMENT_STRING, PGLN_URI
-
-PGLN_URI_REGEX = re.compile(PGLN_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.tokenizers import PGLN_GS1_ELEMENT_STRING_TOKENIZER, PGLN_URI_TOKENIZER
 
 
 class PGLN(GS1Keyed):
@@ -26,23 +25,24 @@ class PGLN(GS1Keyed):
         gs1_element_string (str): GS1 element string
     """
 
-    gs1_element_string_regex = re.compile(PGLN_GS1_ELEMENT_STRING)
+    __slots__ = ("_company_pref", "_party_ref", "_pgln")
+
+    gs1_element_string_tokenizer = PGLN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not PGLN_URI_REGEX.fullmatch(epc_uri):
+        components = PGLN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid PGLN URI {epc_uri}")
 
-        self._company_pref, self._party_ref = epc_uri.split(":")[4].split(".")
+        self._company_pref, self._party_ref = components
 
         if len(f"{self._company_pref}{self._party_ref}") != 12 or not (
             6 <= len(self._company_pref) <= 12
         ):
             raise ConvertException(message=f"Invalid EPC_URI")
 
-        self.epc_uri = epc_uri
-
         check_digit = calculate_checksum(f"{self._company_pref}{self._party_ref}")
 
         self._pgln = f"{self._company_pref}{self._party_ref}{check_digit}"
@@ -65,26 +65,30 @@ class PGLN(GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> PGLN:
         """Create a PGLN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: PGLN GS1 element string invalid
+            ConvertException: PGLN GS1 element string invalid or company prefix unknown
 
         Returns:
             PGLN: PGLN scheme
         """
-        if not PGLN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = PGLN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid PGLN GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[5:]
+        (digits,) = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
 
         return cls(
             f"urn:epc:id:pgln:{digits[:company_prefix_length]}.{digits[company_prefix_length:-1]}"
@@ -1,25 +1,22 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_numeric_string,
-    decode_partition_table,
-    encode_numeric_string,
-    encode_partition_table,
-    parse_header_and_truncate_binary,
     revert_uri_escapes,
-    str_to_binary,
 )
-from epcpy.utils.regex import SGCN_GS1_ELEMENT_STRING, SGCN_URI
-
-SGCN_URI_REGEX = re.compile(SGCN_URI)
-
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Layout,
+    NumericString,
+    Partition,
+)
+from epcpy.utils.tokenizers import SGCN_GS1_ELEMENT_STRING_TOKENIZER, SGCN_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -118,23 +115,35 @@ class SGCN(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_coupon_ref", "_serial", "_gcn")
+
     class BinaryCodingScheme(Enum):
         SGCN_96 = "sgcn-96"
 
     class BinaryHeader(Enum):
         SGCN_96 = "00111111"
 
-    gs1_element_string_regex = re.compile(SGCN_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.SGCN_96,
+            BinaryHeader.SGCN_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                NumericString(41),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = SGCN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not SGCN_URI_REGEX.fullmatch(epc_uri):
+        components = SGCN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid SGCN URI {epc_uri}")
 
-        self._company_pref, self._coupon_ref, self._serial = epc_uri.split(":")[
-            4
-        ].split(".")
+        self._company_pref, self._coupon_ref, self._serial = components
 
         if (
             len(f"{self._company_pref}{self._coupon_ref}") != 12
@@ -145,11 +154,29 @@ class SGCN(TagEncodable, GS1Keyed):
                 message=f"Invalid SGCN URI {epc_uri} | wrong number of digits"
             )
 
-        self.epc_uri = epc_uri
-
         check_digit = calculate_checksum(f"{self._company_pref}{self._coupon_ref}")
         self._gcn = f"{self._company_pref}{self._coupon_ref}{check_digit}{self._serial}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> SGCN:
+        """Create an SGCN instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, coupon reference and serial
+
+        Returns:
+            SGCN: SGCN instance
+        """
+        sgcn = cls.__new__(cls)
+        super(SGCN, sgcn).__init__(f"urn:epc:id:sgcn:{'.'.join(components)}")
+
+        sgcn._company_pref, sgcn._coupon_ref, sgcn._serial = components
+
+        check_digit = calculate_checksum(f"{sgcn._company_pref}{sgcn._coupon_ref}")
+        sgcn._gcn = f"{sgcn._company_pref}{sgcn._coupon_ref}{check_digit}{sgcn._serial}"
+
+        return sgcn
+
     def gs1_key(self) -> str:
         """Returns the GS1 key
 
@@ -168,27 +195,32 @@ class SGCN(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> SGCN:
         """Create a SGCN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: SGCN GS1 element string invalid
+            ConvertException: SGCN GS1 element string invalid or company prefix unknown
 
         Returns:
             SGCN: SGCN scheme
         """
-        if not SGCN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = SGCN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid SGCN GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[5:18]
-        chars = gs1_element_string[18:]
+        (value,) = values
+        digits = value[:13]
+        chars = value[13:]
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
         chars = revert_uri_escapes(chars)
 
         return cls(
@@ -212,12 +244,12 @@ class SGCN(TagEncodable, GS1Keyed):
         """
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._company_pref}.{self._coupon_ref}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         filter_value: SGCNFilterValue,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.SGCN_96,
-    ) -> str:
-        """Return the binary representation belonging to this SGCN with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this SGCN with the provided binary coding scheme and filter value.
 
         Args:
             filter_value (SGCNFilterValue): Filter value
@@ -225,40 +257,8 @@ class SGCN(TagEncodable, GS1Keyed):
                 Defaults to BinaryCodingScheme.SGCN_96
 
         Returns:
-            str: binary representation
-        """
-        parts = [self._company_pref, self._coupon_ref]
-
-        header = SGCN.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        sgcn_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-        serial_binary = encode_numeric_string(self._serial, 41)
-
-        return header + filter_binary + sgcn_binary + serial_binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> SGCN:
-        """Create an SGCN instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an SGCN
-
-        Returns:
-            SGCN: SGCN instance
+            BitWriter: encoded bits
         """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        sgcn_binary = truncated_binary[11:55]
-        serial_binary = truncated_binary[55:]
-
-        filter_string = binary_to_int(filter_binary)
-        sgcn_string = decode_partition_table(sgcn_binary, PARTITION_TABLE_P)
-        serial_string = decode_numeric_string(serial_binary)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{sgcn_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._coupon_ref, self._serial], filter_value.value
         )
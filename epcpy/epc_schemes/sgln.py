@@ -1,26 +1,25 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    decode_string,
-    encode_partition_table,
-    encode_string,
-    parse_header_and_truncate_binary,
     replace_uri_escapes,
     revert_uri_escapes,
-    str_to_binary,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import SGLN_GS1_ELEMENT_STRING, SGLN_URI
-
-SGLN_URI_REGEX = re.compile(SGLN_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Integer,
+    Layout,
+    Partition,
+    String,
+)
+from epcpy.utils.tokenizers import SGLN_GS1_ELEMENT_STRING_TOKENIZER, SGLN_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -119,6 +118,8 @@ class SGLN(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_location_ref", "_serial", "_gln")
+
     class BinaryCodingScheme(Enum):
         SGLN_96 = "sgln-96"
         SGLN_195 = "sgln-195"
@@ -127,16 +128,35 @@ class SGLN(TagEncodable, GS1Keyed):
         SGLN_96 = "00110010"
         SGLN_195 = "00111001"
 
-    gs1_element_string_regex = re.compile(SGLN_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.SGLN_96,
+            BinaryHeader.SGLN_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Integer(41),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.SGLN_195,
+            BinaryHeader.SGLN_195,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                String(140),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = SGLN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not SGLN_URI_REGEX.fullmatch(epc_uri):
+        components = SGLN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid SGLN URI {epc_uri}")
 
-        self._company_pref, self._location_ref = epc_uri.split(":")[4].split(".")[:2]
-        self._serial = ".".join(":".join(epc_uri.split(":")[4:]).split(".")[2:])
+        self._company_pref, self._location_ref, self._serial = components
 
         if (
             len(f"{self._company_pref}{self._location_ref}") != 12
@@ -149,11 +169,29 @@ class SGLN(TagEncodable, GS1Keyed):
 
         verify_gs3a3_component(self._serial)
 
-        self.epc_uri = epc_uri
-
         check_digit = calculate_checksum(f"{self._company_pref}{self._location_ref}")
         self._gln = f"{self._company_pref}{self._location_ref}{check_digit}"
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> SGLN:
+        """Create an SGLN instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, location reference and extension
+
+        Returns:
+            SGLN: SGLN instance
+        """
+        sgln = cls.__new__(cls)
+        super(SGLN, sgln).__init__(f"urn:epc:id:sgln:{'.'.join(components)}")
+
+        sgln._company_pref, sgln._location_ref, sgln._serial = components
+
+        check_digit = calculate_checksum(f"{sgln._company_pref}{sgln._location_ref}")
+        sgln._gln = f"{sgln._company_pref}{sgln._location_ref}{check_digit}"
+
+        return sgln
+
     def gs1_key(self) -> str:
         """Returns the GS1 key
 
@@ -173,26 +211,30 @@ class SGLN(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> SGLN:
         """Create a SGLN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: SGLN GS1 element string invalid
+            ConvertException: SGLN GS1 element string invalid or company prefix unknown
 
         Returns:
             SGLN: SGLN scheme
         """
-        if not SGLN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = SGLN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid SGLN GS1 element string {gs1_element_string}"
             )
 
-        _, digits, chars = re.split(f"\(.{{3}}\)", gs1_element_string)
+        digits, chars = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits)
         chars = revert_uri_escapes(chars)
 
         return cls(
@@ -229,60 +271,20 @@ class SGLN(TagEncodable, GS1Keyed):
 
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._company_pref}.{self._location_ref}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme,
         filter_value: SGLNFilterValue,
-    ) -> str:
-        """Return the binary representation belonging to this SGLN with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this SGLN with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (SGLNFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        parts = [self._company_pref, self._location_ref]
-
-        header = SGLN.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        gln_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-        serial_binary = (
-            str_to_binary(self._serial, 41)
-            if binary_coding_scheme == SGLN.BinaryCodingScheme.SGLN_96
-            else encode_string(self._serial, 140)
-        )
-
-        return header + filter_binary + gln_binary + serial_binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> SGLN:
-        """Create an SGLN instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an SGLN
-
-        Returns:
-            SGLN: SGLN instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        gln_binary = truncated_binary[11:55]
-        serial_binary = truncated_binary[55:]
-
-        filter_string = binary_to_int(filter_binary)
-        gln_string = decode_partition_table(gln_binary, PARTITION_TABLE_P)
-        serial_string = (
-            binary_to_int(serial_binary)
-            if binary_coding_scheme == SGLN.BinaryCodingScheme.SGLN_96
-            else decode_string(serial_binary)
-        )
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{gln_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._location_ref, self._serial], filter_value.value
         )
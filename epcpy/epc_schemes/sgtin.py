@@ -1,26 +1,28 @@
 from __future__ import annotations
 
-import re
 from enum import Enum, IntEnum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    decode_string,
-    encode_partition_table,
-    encode_string,
-    parse_header_and_truncate_binary,
     replace_uri_escapes,
     revert_uri_escapes,
-    str_to_binary,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import SGTIN_GS1_ELEMENT_STRING, SGTIN_URI
-
-SGTIN_REGEX = re.compile(SGTIN_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Integer,
+    Layout,
+    Partition,
+    String,
+)
+from epcpy.utils.tokenizers import (
+    SGTIN_GS1_ELEMENT_STRING_TOKENIZER,
+    SGTIN_URI_TOKENIZER,
+)
 
 PARTITION_TABLE_P = {
     0: {
@@ -128,6 +130,8 @@ class SGTIN(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_item_ref", "_serial", "_gtin")
+
     class BinaryCodingScheme(Enum):
         SGTIN_96 = "sgtin-96"
         SGTIN_198 = "sgtin-198"
@@ -136,20 +140,35 @@ class SGTIN(TagEncodable, GS1Keyed):
         SGTIN_96 = "00110000"
         SGTIN_198 = "00110110"
 
-    gs1_element_string_regex = re.compile(SGTIN_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.SGTIN_96,
+            BinaryHeader.SGTIN_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Integer(38),
+            ],
+        ),
+        Layout(
+            BinaryCodingScheme.SGTIN_198,
+            BinaryHeader.SGTIN_198,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                String(140),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = SGTIN_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not SGTIN_REGEX.fullmatch(epc_uri):
+        components = SGTIN_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid SGTIN URI {epc_uri}")
 
-        self.epc_uri = epc_uri
-
-        value = self.epc_uri.split(":")[4]
-        self._company_pref = value.split(".")[0]
-        self._item_ref = value.split(".")[1]
-        self._serial = ".".join(":".join(epc_uri.split(":")[4:]).split(".")[2:])
+        self._company_pref, self._item_ref, self._serial = components
 
         if len(f"{self._company_pref}{self._item_ref}") != 13 or not (
             6 <= len(self._company_pref) <= 12
@@ -173,21 +192,52 @@ class SGTIN(TagEncodable, GS1Keyed):
             14
         )
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> SGTIN:
+        """Create an SGTIN instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix, item reference and serial
+
+        Returns:
+            SGTIN: SGTIN instance
+        """
+        sgtin = cls.__new__(cls)
+        super(SGTIN, sgtin).__init__(f"urn:epc:id:sgtin:{'.'.join(components)}")
+
+        sgtin._company_pref, sgtin._item_ref, sgtin._serial = components
+
+        check_digit = calculate_checksum(
+            f"{sgtin._item_ref[0]}{sgtin._company_pref}{sgtin._item_ref[1:]}"
+        )
+        sgtin._gtin = f"{sgtin._item_ref[0]}{sgtin._company_pref}{sgtin._item_ref[1:]}{check_digit}".zfill(
+            14
+        )
+
+        return sgtin
+
     @classmethod
     def from_gtin_plus_serial(
-        cls, gtin: str, serial: str, company_prefix_length: int
+        cls, gtin: str, serial: str, company_prefix_length: Optional[int] = None
     ) -> SGTIN:
         """Create an SGTIN class from a gtin, serial and company prefix length
 
         Args:
             gtin (str): GTIN
             serial (str): Serial value
-            company_prefix_length (int): Length of company prefix
+            company_prefix_length (Optional[int], optional): Length of company prefix. Defaults to
+                the length resolved using the configured company prefixes.
+
+        Raises:
+            ConvertException: Company prefix unknown
 
         Returns:
             SGTIN: Instance of SGTIN class based on the provided data
         """
         gtin = gtin.zfill(14)
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(gtin[1:])
+
         return cls(
             f"urn:epc:id:sgtin:{gtin[1:1 + company_prefix_length]}.{gtin[0]}{gtin[1 + company_prefix_length:-1]}.{str(serial)}"
         )
@@ -236,26 +286,30 @@ class SGTIN(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> SGTIN:
         """Create a SGTIN instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: SGTIN GS1 element string invalid
+            ConvertException: SGTIN GS1 element string invalid or company prefix unknown
 
         Returns:
             SGTIN: SGTIN scheme
         """
-        if not SGTIN.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = SGTIN_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid SGTIN GS1 element string {gs1_element_string}"
             )
 
-        _, digits, chars = re.split(f"\(.{{2}}\)", gs1_element_string)
+        digits, chars = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits[1:])
         chars = revert_uri_escapes(chars)
 
         return cls(
@@ -293,62 +347,20 @@ class SGTIN(TagEncodable, GS1Keyed):
 
         return f"{self.TAG_URI_PREFIX}{scheme}:{filter_val}.{self._company_pref}.{self._item_ref}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         binary_coding_scheme: BinaryCodingScheme,
         filter_value: SGTINFilterValue,
-    ) -> str:
-        """Return the binary representation belonging to this SGTIN with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this SGTIN with the provided binary coding scheme and filter value.
 
         Args:
             binary_coding_scheme (BinaryCodingScheme): Coding scheme
             filter_value (SGTINFilterValue): Filter value
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        parts = [self._company_pref, self._item_ref]
-
-        header = SGTIN.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        gtin_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-
-        serial_binary = (
-            str_to_binary(self._serial, 38)
-            if binary_coding_scheme == SGTIN.BinaryCodingScheme.SGTIN_96
-            else encode_string(self._serial, 140)
-        )
-
-        return header + filter_binary + gtin_binary + serial_binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> SGTIN:
-        """Create an SGTIN instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an SGTIN
-
-        Returns:
-            SGTIN: SGTIN instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        gtin_binary = truncated_binary[11:58]
-        serial_binary = truncated_binary[58:]
-
-        filter_string = binary_to_int(filter_binary)
-        gtin_string = decode_partition_table(gtin_binary, PARTITION_TABLE_P)
-
-        serial_string = (
-            binary_to_int(serial_binary)
-            if binary_coding_scheme == SGTIN.BinaryCodingScheme.SGTIN_96
-            else decode_string(serial_binary)
-        )
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{gtin_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._item_ref, self._serial], filter_value.value
         )
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Optional, Sequence
 
 from epcpy.epc_schemes.base_scheme import GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
     calculate_checksum,
-    decode_partition_table,
-    encode_partition_table,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import SSCC_GS1_ELEMENT_STRING, SSCC_URI
-
-SSCC_URI_REGEX = re.compile(SSCC_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.layout import (
+    Layout,
+    Partition,
+    Reserved,
+)
+from epcpy.utils.tokenizers import SSCC_GS1_ELEMENT_STRING_TOKENIZER, SSCC_URI_TOKENIZER
 
 PARTITION_TABLE_P = {
     0: {
@@ -114,23 +114,35 @@ class SSCC(TagEncodable, GS1Keyed):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_company_pref", "_serial", "_sscc")
+
     class BinaryCodingScheme(Enum):
         SSCC_96 = "sscc-96"
 
     class BinaryHeader(Enum):
         SSCC_96 = "00110001"
 
-    gs1_element_string_regex = re.compile(SSCC_GS1_ELEMENT_STRING)
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.SSCC_96,
+            BinaryHeader.SSCC_96,
+            [
+                Partition(PARTITION_TABLE_P, PARTITION_TABLE_L),
+                Reserved(24),
+            ],
+        ),
+    )
+
+    gs1_element_string_tokenizer = SSCC_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not SSCC_URI_REGEX.fullmatch(epc_uri):
+        components = SSCC_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid SSCC URI {epc_uri}")
 
-        self.epc_uri = epc_uri
-
-        self._company_pref, self._serial = self.epc_uri.split(":")[-1].split(".")
+        self._company_pref, self._serial = components
 
         if len(f"{self._company_pref}{self._serial}") != 17 or not (
             6 <= len(self._company_pref) <= 12
@@ -147,6 +159,30 @@ class SSCC(TagEncodable, GS1Keyed):
             f"{self._serial[0]}{self._company_pref}{self._serial[1:]}{check_digit}"
         )
 
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> SSCC:
+        """Create an SSCC instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): Company prefix and serial reference
+
+        Returns:
+            SSCC: SSCC instance
+        """
+        sscc = cls.__new__(cls)
+        super(SSCC, sscc).__init__(f"urn:epc:id:sscc:{'.'.join(components)}")
+
+        sscc._company_pref, sscc._serial = components
+
+        check_digit = calculate_checksum(
+            f"{sscc._serial[0]}{sscc._company_pref}{sscc._serial[1:]}"
+        )
+        sscc._sscc = (
+            f"{sscc._serial[0]}{sscc._company_pref}{sscc._serial[1:]}{check_digit}"
+        )
+
+        return sscc
+
     def gs1_key(self) -> str:
         """GS1 key belonging to this SSCC instance
 
@@ -165,26 +201,30 @@ class SSCC(TagEncodable, GS1Keyed):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> SSCC:
         """Create a SSCC instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: SSCC GS1 element string invalid
+            ConvertException: SSCC GS1 element string invalid or company prefix unknown
 
         Returns:
             SSCC: SSCC scheme
         """
-        if not SSCC.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = SSCC_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid SSCC GS1 element string {gs1_element_string}"
             )
 
-        _, digits = re.split(f"\(.{{2}}\)", gs1_element_string)
+        (digits,) = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits[1:])
 
         return cls(
             f"urn:epc:id:sscc:{digits[1:company_prefix_length+1]}.{digits[0]}{digits[1+company_prefix_length:-1]}"
@@ -207,12 +247,12 @@ class SSCC(TagEncodable, GS1Keyed):
         """
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._company_pref}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         filter_value: SSCCFilterValue,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.SSCC_96,
-    ) -> str:
-        """Return the binary representation belonging to this SSCC with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this SSCC with the provided binary coding scheme and filter value.
 
         Args:
             filter_value (SSCCFilterValue): Filter value
@@ -220,37 +260,8 @@ class SSCC(TagEncodable, GS1Keyed):
                 Defaults to BinaryCodingScheme.SSCC_96
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        parts = [self._company_pref, self._serial]
-
-        header = SSCC.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 3)
-        sscc_binary = encode_partition_table(parts, PARTITION_TABLE_L)
-
-        return header + filter_binary + sscc_binary + "0" * 24
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> SSCC:
-        """Create an SSCC instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an SSCC
-
-        Returns:
-            SSCC: SSCC instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:11]
-        sscc_binary = truncated_binary[11:72]
-
-        filter_string = binary_to_int(filter_binary)
-        sscc_string = decode_partition_table(sscc_binary, PARTITION_TABLE_P)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{sscc_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._company_pref, self._serial], filter_value.value
         )
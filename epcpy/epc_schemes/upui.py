@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import re
+from typing import Optional
 
 from epcpy.epc_schemes.base_scheme import GS1Element
 from epcpy.utils.common import (
@@ -10,9 +10,8 @@ from epcpy.utils.common import (
     revert_uri_escapes,
     verify_gs3a3_component,
 )
-from epcpy.utils.regex import UPUI_GS1_ELEMENT_STRING, UPUI_URI
-
-UPUI_URI_REGEX = re.compile(UPUI_URI)
+from epcpy.utils.company_prefix import resolve_company_prefix_length
+from epcpy.utils.tokenizers import UPUI_GS1_ELEMENT_STRING_TOKENIZER, UPUI_URI_TOKENIZER
 
 
 class UPUI(GS1Element):
@@ -31,19 +30,18 @@ class UPUI(GS1Element):
         gs1_element_string (str): GS1 element string
     """
 
-    gs1_element_string_regex = re.compile(UPUI_GS1_ELEMENT_STRING)
+    __slots__ = ("_company_pref", "_item_ref", "_tpx")
+
+    gs1_element_string_tokenizer = UPUI_GS1_ELEMENT_STRING_TOKENIZER
 
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not UPUI_URI_REGEX.fullmatch(epc_uri):
+        components = UPUI_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid UPUI URI {epc_uri}")
 
-        self._company_pref, self._item_ref, *tpx_components = ":".join(
-            epc_uri.split(":")[4:]
-        ).split(".")
-
-        tpx = ".".join(tpx_components)
+        self._company_pref, self._item_ref, tpx = components
         verify_gs3a3_component(tpx)
         self._tpx = replace_uri_escapes(tpx)
 
@@ -55,8 +53,6 @@ class UPUI(GS1Element):
                 message=f"Wrong company prefix + item ref size (!=13)"
             )
 
-        self.epc_uri = epc_uri
-
     def gs1_element_string(self) -> str:
         """Returns the GS1 element string
 
@@ -70,27 +66,30 @@ class UPUI(GS1Element):
 
     @classmethod
     def from_gs1_element_string(
-        cls, gs1_element_string: str, company_prefix_length: int
+        cls, gs1_element_string: str, company_prefix_length: Optional[int] = None
     ) -> UPUI:
         """Create a UPUI instance from a GS1 element string and company prefix
 
         Args:
             gs1_element_string (str): GS1 element string
-            company_prefix_length (int): Company prefix length
+            company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+                the length resolved using the configured company prefixes.
 
         Raises:
-            ConvertException: UPUI GS1 element string invalid
+            ConvertException: UPUI GS1 element string invalid or company prefix unknown
 
         Returns:
             UPUI: UPUI scheme
         """
-        if not UPUI.gs1_element_string_regex.fullmatch(gs1_element_string):
+        values = UPUI_GS1_ELEMENT_STRING_TOKENIZER.tokenize(gs1_element_string)
+        if values is None:
             raise ConvertException(
                 message=f"Invalid UPUI GS1 element string {gs1_element_string}"
             )
 
-        digits = gs1_element_string[4:18]
-        chars = gs1_element_string[23:]
+        digits, chars = values
+        if company_prefix_length is None:
+            company_prefix_length = resolve_company_prefix_length(digits[1:])
         chars = revert_uri_escapes(chars)
 
         return cls(
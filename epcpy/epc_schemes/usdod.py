@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
+from typing import Sequence
 
 from epcpy.epc_schemes.base_scheme import TagEncodable
 from epcpy.utils.common import (
+    BitWriter,
     ConvertException,
-    binary_to_int,
-    decode_cage_code,
-    encode_cage_code,
-    parse_header_and_truncate_binary,
-    str_to_binary,
 )
-from epcpy.utils.regex import USDOD_URI
-
-USDOD_URI_REGEX = re.compile(USDOD_URI)
+from epcpy.utils.layout import (
+    CageCode,
+    Integer,
+    Layout,
+)
+from epcpy.utils.tokenizers import USDOD_URI_TOKENIZER
 
 
 class USDODFilterValue(Enum):
@@ -56,26 +55,56 @@ class USDOD(TagEncodable):
         binary (str): Binary representation
     """
 
+    __slots__ = ("_cage_dodaac", "_serial")
+
     class BinaryCodingScheme(Enum):
         USDOD_96 = "usdod-96"
 
     class BinaryHeader(Enum):
         USDOD_96 = "00101111"
 
+    binary_layouts = (
+        Layout(
+            BinaryCodingScheme.USDOD_96,
+            BinaryHeader.USDOD_96,
+            [
+                CageCode(),
+                Integer(36),
+            ],
+            filter_bits=4,
+        ),
+    )
+
     def __init__(self, epc_uri) -> None:
         super().__init__(epc_uri)
 
-        if not USDOD_URI_REGEX.fullmatch(epc_uri):
+        components = USDOD_URI_TOKENIZER.tokenize(epc_uri)
+        if components is None:
             raise ConvertException(message=f"Invalid USDOD URI {epc_uri}")
 
-        self._cage_dodaac, self._serial = epc_uri.split(":")[4].split(".")
+        self._cage_dodaac, self._serial = components
 
         if int(self._serial) >= pow(2, 36) or (
             len(self._serial) > 1 and self._serial[0] == "0"
         ):
             raise ConvertException(message=f"Serial out of range: (max: {pow(2, 36)})")
 
-        self.epc_uri = epc_uri
+    @classmethod
+    def _from_components(cls, components: Sequence[str]) -> USDOD:
+        """Create an USDOD instance from URI components that are known to be valid, skipping validation
+
+        Args:
+            components (Sequence[str]): CAGE/DoDAAC and serial
+
+        Returns:
+            USDOD: USDOD instance
+        """
+        usdod = cls.__new__(cls)
+        super(USDOD, usdod).__init__(f"urn:epc:id:usdod:{'.'.join(components)}")
+
+        usdod._cage_dodaac, usdod._serial = components
+
+        return usdod
 
     def tag_uri(
         self,
@@ -94,12 +123,12 @@ class USDOD(TagEncodable):
         """
         return f"{self.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_value.value}.{self._cage_dodaac}.{self._serial}"
 
-    def binary(
+    def bits(
         self,
         filter_value: USDODFilterValue,
         binary_coding_scheme: BinaryCodingScheme = BinaryCodingScheme.USDOD_96,
-    ) -> str:
-        """Return the binary representation belonging to this USDOD with the provided binary coding scheme and filter value.
+    ) -> BitWriter:
+        """Return the encoded bits belonging to this USDOD with the provided binary coding scheme and filter value.
 
         Args:
             filter_value (USDODFilterValue): Filter value
@@ -107,38 +136,8 @@ class USDOD(TagEncodable):
                 Defaults to BinaryCodingScheme.USDOD_96
 
         Returns:
-            str: binary representation
+            BitWriter: encoded bits
         """
-        header = USDOD.BinaryHeader[binary_coding_scheme.name].value
-        filter_binary = str_to_binary(filter_value.value, 4)
-        cage_code_binary = encode_cage_code(f"{self._cage_dodaac:>6}")
-        serial_binary = str_to_binary(self._serial, 36)
-
-        return header + filter_binary + cage_code_binary + serial_binary
-
-    @classmethod
-    def from_binary(cls, binary_string: str) -> USDOD:
-        """Create an USDOD instance from a binary string
-
-        Args:
-            binary_string (str): binary representation of an USDOD
-
-        Returns:
-            USDOD: USDOD instance
-        """
-        binary_coding_scheme, truncated_binary = parse_header_and_truncate_binary(
-            binary_string,
-            cls.header_to_schemes(),
-        )
-
-        filter_binary = truncated_binary[8:12]
-        cage_code_binary = truncated_binary[12:60]
-        serial_binary = truncated_binary[60:]
-
-        filter_string = binary_to_int(filter_binary)
-        cage_code_string = decode_cage_code(cage_code_binary)
-        serial_string = binary_to_int(serial_binary)
-
-        return cls.from_tag_uri(
-            f"{cls.TAG_URI_PREFIX}{binary_coding_scheme.value}:{filter_string}.{cage_code_string}.{serial_string}"
+        return self._layouts[binary_coding_scheme].encode(
+            [self._cage_dodaac, self._serial], filter_value.value
         )
@@ -0,0 +1,401 @@
+"""Columnar decoding and encoding of 96-bit EPCs using NumPy.
+
+Requires the optional numpy dependency, install using `pip install epcpy[numpy]`.
+"""
+
+from enum import Enum
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from epcpy.epc_schemes import GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN, SSCC
+from epcpy.utils.common import ConvertException
+from epcpy.utils.layout import Integer, Layout, Partition, Reserved
+
+COLUMNAR_SCHEMES = [GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN, SSCC]
+
+LAYOUTS_96: Dict[int, Layout] = {
+    layout.header: layout
+    for cls in COLUMNAR_SCHEMES
+    for layout in cls.binary_layouts
+    if layout.size == 96
+}
+CODING_SCHEME_LAYOUTS_96: Dict[Enum, Layout] = {
+    layout.coding_scheme: layout for layout in LAYOUTS_96.values()
+}
+
+HEX_CHARACTERS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+
+ArrayLike = Union[np.ndarray, Sequence[int], int]
+
+
+class Columns(NamedTuple):
+    """Decoded fields of 96-bit EPCs, one array per field
+
+    The company prefix and item reference are the two values of the partition, e.g. the serial reference
+    for SSCC or the individual asset reference for GIAI. GID uses the general manager number as company prefix,
+    the object class as item reference and has no filter or partition.
+    Values of fields absent in a scheme are 0, invalid rows are marked in valid.
+
+    Attributes:
+        header (np.ndarray): uint8 binary header
+        filter (np.ndarray): uint8 filter value
+        partition (np.ndarray): uint8 partition value
+        company_prefix (np.ndarray): uint64 company prefix
+        item_reference (np.ndarray): uint64 item reference
+        serial (np.ndarray): uint64 serial
+        valid (np.ndarray): bool whether the row contains a valid EPC of a supported scheme
+    """
+
+    header: np.ndarray
+    filter: np.ndarray
+    partition: np.ndarray
+    company_prefix: np.ndarray
+    item_reference: np.ndarray
+    serial: np.ndarray
+    valid: np.ndarray
+
+
+def to_words(tags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split 96-bit EPCs into the upper 32 and lower 64 bits
+
+    Args:
+        tags (np.ndarray): uint8 array of shape (N, 12) or uint64 array of shape (N, 2)
+
+    Raises:
+        ConvertException: Unsupported shape or data type
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: uint64 arrays of the upper and lower bits
+    """
+    if tags.ndim == 2 and tags.shape[1] == 12 and tags.dtype == np.uint8:
+        padded = np.zeros((tags.shape[0], 16), dtype=np.uint8)
+        padded[:, 4:] = tags
+        words = padded.view(">u8").astype(np.uint64)
+    elif tags.ndim == 2 and tags.shape[1] == 2 and tags.dtype == np.uint64:
+        words = tags
+    else:
+        raise ConvertException(
+            message=f"Invalid array of shape {tags.shape} and type {tags.dtype}, expected (N, 12) uint8 or (N, 2) uint64"
+        )
+
+    return words[:, 0], words[:, 1]
+
+
+def from_words(hi: np.ndarray, lo: np.ndarray) -> np.ndarray:
+    """Join the upper 32 and lower 64 bits of 96-bit EPCs into 12-byte records
+
+    Args:
+        hi (np.ndarray): uint64 upper 32 bits
+        lo (np.ndarray): uint64 lower 64 bits
+
+    Returns:
+        np.ndarray: uint8 array of shape (N, 12)
+    """
+    words = np.stack((hi, lo), axis=1).astype(">u8")
+
+    return np.ascontiguousarray(words.view(np.uint8)[:, 4:])
+
+
+def from_hex(hex_strings: Sequence[str]) -> np.ndarray:
+    """Convert 24 character hexadecimal strings into 12-byte records
+
+    Args:
+        hex_strings (Sequence[str]): Hexadecimal strings of 96-bit EPCs
+
+    Raises:
+        ConvertException: Invalid hexadecimal string
+
+    Returns:
+        np.ndarray: uint8 array of shape (N, 12)
+    """
+    try:
+        data = bytes.fromhex("".join(hex_strings))
+    except ValueError:
+        raise ConvertException(message="Invalid hexadecimal string")
+
+    if len(data) != 12 * len(hex_strings):
+        raise ConvertException(message="Hexadecimal strings must be 24 characters")
+
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, 12)
+
+
+def to_hex(tags: np.ndarray) -> np.ndarray:
+    """Convert 96-bit EPCs into 24 character hexadecimal strings
+
+    Args:
+        tags (np.ndarray): uint8 array of shape (N, 12) or uint64 array of shape (N, 2)
+
+    Returns:
+        np.ndarray: Array of shape (N,) of hexadecimal strings
+    """
+    if tags.dtype != np.uint8:
+        tags = from_words(*to_words(tags))
+
+    characters = np.empty((tags.shape[0], 24), dtype=np.uint8)
+    characters[:, 0::2] = HEX_CHARACTERS[tags >> 4]
+    characters[:, 1::2] = HEX_CHARACTERS[tags & 0x0F]
+
+    return characters.view("S24")[:, 0].astype(str)
+
+
+def _read(hi: np.ndarray, lo: np.ndarray, offset: int, num_bits: int) -> np.ndarray:
+    """Read a field of every 96-bit EPC
+
+    Args:
+        hi (np.ndarray): Upper 32 bits
+        lo (np.ndarray): Lower 64 bits
+        offset (int): Offset of the field, from the most significant bit
+        num_bits (int): Number of bits of the field
+
+    Returns:
+        np.ndarray: uint64 values of the field
+    """
+    shift = 96 - offset - num_bits
+    mask = np.uint64((1 << num_bits) - 1)
+
+    if shift >= 64:
+        return (hi >> np.uint64(shift - 64)) & mask
+    if shift + num_bits <= 64:
+        return (lo >> np.uint64(shift)) & mask
+
+    return ((hi << np.uint64(64 - shift)) | (lo >> np.uint64(shift))) & mask
+
+
+def _read_partition(
+    hi: np.ndarray, lo: np.ndarray, offset: int, field: Partition
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Read a partition value, company prefix and reference of every 96-bit EPC
+
+    Args:
+        hi (np.ndarray): Upper 32 bits
+        lo (np.ndarray): Lower 64 bits
+        offset (int): Offset of the partition value, from the most significant bit
+        field (Partition): Partition field of the layout
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Partition value, company prefix, reference
+            and whether the values are valid
+    """
+    partition = _read(hi, lo, offset, 3)
+    company_prefix = np.zeros_like(hi)
+    reference = np.zeros_like(hi)
+    valid = np.zeros(hi.shape, dtype=bool)
+
+    for partition_value, entry in field.partition_table_p.items():
+        rows = partition == partition_value
+        if not rows.any():
+            continue
+
+        h, l = hi[rows], lo[rows]
+        C = _read(h, l, offset + 3, entry["M"])
+        D = _read(h, l, offset + 3 + entry["M"], entry["N"])
+
+        rows_valid = C < np.uint64(pow(10, entry["L"]))
+        if entry["K"] == 0:
+            D[:] = 0
+        elif not field.unpadded_partition:
+            rows_valid &= D < np.uint64(pow(10, entry["K"]))
+
+        company_prefix[rows] = C
+        reference[rows] = D
+        valid[rows] = rows_valid
+
+    return partition.astype(np.uint8), company_prefix, reference, valid
+
+
+def decode_96(tags: np.ndarray) -> Columns:
+    """Decode 96-bit EPCs of the GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN and SSCC schemes into columns.
+    Rows of other schemes, an invalid partition or a too large company prefix or reference are marked invalid.
+
+    Args:
+        tags (np.ndarray): uint8 array of shape (N, 12) or uint64 array of shape (N, 2) with the upper 32
+            and lower 64 bits
+
+    Returns:
+        Columns: Decoded fields
+    """
+    hi, lo = to_words(tags)
+    size = hi.shape[0]
+
+    header = (hi >> np.uint64(24)).astype(np.uint8)
+    columns = Columns(
+        header=header,
+        filter=np.zeros(size, dtype=np.uint8),
+        partition=np.zeros(size, dtype=np.uint8),
+        company_prefix=np.zeros(size, dtype=np.uint64),
+        item_reference=np.zeros(size, dtype=np.uint64),
+        serial=np.zeros(size, dtype=np.uint64),
+        valid=np.zeros(size, dtype=bool),
+    )
+
+    for header_value, layout in LAYOUTS_96.items():
+        rows = np.flatnonzero(header == header_value)
+        if not rows.size:
+            continue
+
+        h, l = hi[rows], lo[rows]
+        offset = 8
+
+        if layout.filter_bits:
+            columns.filter[rows] = _read(h, l, offset, layout.filter_bits)
+            offset += layout.filter_bits
+
+        values: List[np.ndarray] = []
+        valid = np.ones(rows.size, dtype=bool)
+
+        for field in layout.fields:
+            if isinstance(field, Partition):
+                partition, company_prefix, reference, valid = _read_partition(
+                    h, l, offset, field
+                )
+                columns.partition[rows] = partition
+                values.extend((company_prefix, reference))
+                entry = field.partition_table_p[0]
+                offset += 3 + entry["M"] + entry["N"]
+            elif isinstance(field, Integer):
+                values.append(_read(h, l, offset, field.num_bits))
+                offset += field.num_bits
+            elif isinstance(field, Reserved):
+                offset += field.num_bits
+
+        for column, value in zip(
+            (columns.company_prefix, columns.item_reference, columns.serial), values
+        ):
+            column[rows] = value
+
+        columns.valid[rows] = valid
+
+    return columns
+
+
+def _write(
+    hi: np.ndarray, lo: np.ndarray, values: np.ndarray, offset: int, num_bits: int
+) -> None:
+    """Write a field of every 96-bit EPC
+
+    Args:
+        hi (np.ndarray): Upper 32 bits, updated in place
+        lo (np.ndarray): Lower 64 bits, updated in place
+        values (np.ndarray): uint64 values of the field
+        offset (int): Offset of the field, from the most significant bit
+        num_bits (int): Number of bits of the field
+    """
+    shift = 96 - offset - num_bits
+
+    if shift >= 64:
+        hi |= values << np.uint64(shift - 64)
+    elif shift + num_bits <= 64:
+        lo |= values << np.uint64(shift)
+    else:
+        hi |= values >> np.uint64(64 - shift)
+        lo |= values << np.uint64(shift)
+
+
+def _verify_range(values: np.ndarray, limit: int, name: str) -> None:
+    """Verify all values are smaller than the limit
+
+    Args:
+        values (np.ndarray): uint64 values
+        limit (int): Exclusive upper bound
+        name (str): Name of the values used in the error message
+
+    Raises:
+        ConvertException: Value out of range
+    """
+    if limit <= np.iinfo(np.uint64).max and (values >= np.uint64(limit)).any():
+        raise ConvertException(message=f"Invalid {name}, must be smaller than {limit}")
+
+
+def encode_96(
+    binary_coding_scheme: Enum,
+    filter_value: ArrayLike,
+    company_prefix: ArrayLike,
+    company_prefix_length: ArrayLike,
+    item_reference: ArrayLike,
+    serial: ArrayLike = 0,
+) -> np.ndarray:
+    """Encode columns into 96-bit EPCs of the given binary coding scheme, e.g. SGTIN.BinaryCodingScheme.SGTIN_96.
+    Supported are the 96-bit coding schemes of GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN and SSCC.
+    The partition is derived from the company prefix length, arrays are broadcast against each other.
+    The item reference is the second value of the partition, e.g. the serial reference for SSCC.
+    GID uses the general manager number as company prefix, the object class as item reference
+    and ignores the filter value and company prefix length.
+
+    Args:
+        binary_coding_scheme (Enum): 96-bit binary coding scheme
+        filter_value (ArrayLike): Filter values
+        company_prefix (ArrayLike): Company prefixes
+        company_prefix_length (ArrayLike): Number of digits of the company prefixes
+        item_reference (ArrayLike): Item references
+        serial (ArrayLike, optional): Serials, ignored for schemes without serial. Defaults to 0.
+
+    Raises:
+        ConvertException: Unsupported binary coding scheme
+        ConvertException: Invalid company prefix length
+        ConvertException: Value does not fit its field
+
+    Returns:
+        np.ndarray: uint8 array of shape (N, 12)
+    """
+    try:
+        layout = CODING_SCHEME_LAYOUTS_96[binary_coding_scheme]
+    except KeyError:
+        raise ConvertException(
+            message=f"Unsupported binary coding scheme {binary_coding_scheme}"
+        )
+
+    filter_value, company_prefix, company_prefix_length, item_reference, serial = (
+        np.atleast_1d(array).astype(np.uint64)
+        for array in np.broadcast_arrays(
+            filter_value, company_prefix, company_prefix_length, item_reference, serial
+        )
+    )
+    values = [company_prefix, item_reference, serial]
+
+    hi = np.full(company_prefix.shape, np.uint64(layout.header) << np.uint64(24))
+    lo = np.zeros_like(hi)
+    offset = 8
+
+    if layout.filter_bits:
+        _verify_range(filter_value, pow(2, layout.filter_bits), "filter value")
+        _write(hi, lo, filter_value, offset, layout.filter_bits)
+        offset += layout.filter_bits
+
+    for field in layout.fields:
+        if isinstance(field, Partition):
+            C, D = values.pop(0), values.pop(0)
+
+            unknown = ~np.isin(company_prefix_length, list(field.partition_table_l))
+            if unknown.any():
+                raise ConvertException(
+                    message=f"Invalid company prefix length {company_prefix_length[unknown][0]}"
+                )
+
+            for length, entry in field.partition_table_l.items():
+                rows = np.flatnonzero(company_prefix_length == length)
+                if not rows.size:
+                    continue
+
+                h, l = hi[rows], lo[rows]
+                _verify_range(C[rows], pow(10, entry["L"]), "company prefix")
+                _verify_range(D[rows], pow(2, entry["N"]), "item reference")
+                if not field.unpadded_partition:
+                    _verify_range(D[rows], pow(10, entry["K"]), "item reference")
+
+                _write(h, l, np.uint64(entry["P"]), offset, 3)
+                _write(h, l, C[rows], offset + 3, entry["M"])
+                _write(h, l, D[rows], offset + 3 + entry["M"], entry["N"])
+                hi[rows], lo[rows] = h, l
+
+            entry = field.partition_table_p[0]
+            offset += 3 + entry["M"] + entry["N"]
+        elif isinstance(field, Integer):
+            value = values.pop(0)
+            _verify_range(value, pow(2, field.num_bits), "value")
+            _write(hi, lo, value, offset, field.num_bits)
+            offset += field.num_bits
+        elif isinstance(field, Reserved):
+            offset += field.num_bits
+
+    return from_words(hi, lo)
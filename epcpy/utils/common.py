@@ -1,10 +1,13 @@
+from __future__ import annotations
+
 import base64
 import re
 from enum import Enum
+from functools import lru_cache
 from math import log
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
-from epcpy.utils.regex import VERIFY_GS3A3_CHARS
+from epcpy.utils.regex import VERIFY_GS3A3_CHARS, LazyRegex
 
 ESCAPE_CHARACTERS = {
     "0100010": "%22",
@@ -15,9 +18,36 @@ ESCAPE_CHARACTERS = {
     "0111110": "%3E",
     "0111111": "%3F",
 }
+ESCAPE_CHARACTER_CODES = {
+    int(code, 2): char for code, char in ESCAPE_CHARACTERS.items()
+}
+
+
+VERIFY_GS3A3_CHARS_REGEX = LazyRegex(VERIFY_GS3A3_CHARS)
+
+# URI escapes are encoded as a single character, a dash is split off for six bit strings
+SEVEN_BIT_ESCAPE_SPLIT_REGEX = LazyRegex("(%[0-9a-fA-F]{2})")
+SIX_BIT_ESCAPE_SPLIT_REGEX = LazyRegex("(%[0-9a-fA-F]{2}|-)")
+
+# Decoded (URI escaped) character by seven bit code, padding decodes to nothing
+SEVEN_BIT_CHARS = tuple(
+    ESCAPE_CHARACTER_CODES.get(code, chr(code)) if code else "" for code in range(128)
+)
+
+# ASCII character by six bit code, for translating decoded codes at once
+SIX_BIT_ASCII = bytes(code if code >= 32 else 64 + code for code in range(64)).ljust(
+    256, b"\0"
+)
 
+# Six bit code by ASCII character
+SIX_BIT_CODES = {chr(64 + code): code for code in range(64)}
+SIX_BIT_CODES.update((char, ord(char)) for char in "0123456789-")
 
-VERIFY_GS3A3_CHARS_REGEX = re.compile(VERIFY_GS3A3_CHARS)
+# Six bit code by ASCII byte, for translating encoded strings at once
+INVALID_SIX_BIT_CODE = 0xFF
+SIX_BIT_CODE_TRANSLATION = bytes(
+    SIX_BIT_CODES.get(chr(i), INVALID_SIX_BIT_CODE) for i in range(256)
+)
 
 
 class ConvertException(Exception):
@@ -28,6 +58,190 @@ class ConvertException(Exception):
         super().__init__(self.message, *args)
 
 
+class BitReader:
+    """Sequential reader over a sequence of bits stored in a Python integer.
+    The most significant bit of the integer is the first bit of the sequence.
+
+    Attributes:
+        value (int): Integer holding the bits
+        length (int): Number of bits in the sequence
+        position (int): Number of bits consumed so far
+    """
+
+    __slots__ = ("value", "length", "position")
+
+    def __init__(self, value: int, length: int, position: int = 0) -> None:
+        self.value = value
+        self.length = length
+        self.position = position
+
+    @classmethod
+    def from_binary(cls, binary_string: str) -> BitReader:
+        """Create a BitReader from a binary string
+
+        Args:
+            binary_string (str): Binary string
+
+        Raises:
+            ConvertException: Binary string contains invalid characters
+
+        Returns:
+            BitReader: Reader positioned at the first bit
+        """
+        if not binary_string:
+            return cls(0, 0)
+
+        try:
+            return cls(int(binary_string, 2), len(binary_string))
+        except ValueError:
+            raise ConvertException(message=f"Invalid binary string {binary_string}")
+
+    @classmethod
+    def from_hex(cls, hex_string: str) -> BitReader:
+        """Create a BitReader from a hexadecimal string
+
+        Args:
+            hex_string (str): Hexadecimal string
+
+        Raises:
+            ConvertException: Hexadecimal string contains invalid characters
+
+        Returns:
+            BitReader: Reader positioned at the first bit
+        """
+        if not hex_string:
+            return cls(0, 0)
+
+        try:
+            return cls(int(hex_string, 16), len(hex_string) * 4)
+        except ValueError:
+            raise ConvertException(message=f"Invalid hexadecimal string {hex_string}")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> BitReader:
+        """Create a BitReader from raw bytes
+
+        Args:
+            data (bytes): Raw bytes
+
+        Returns:
+            BitReader: Reader positioned at the first bit
+        """
+        return cls(int.from_bytes(data, "big"), len(data) * 8)
+
+    @property
+    def remaining(self) -> int:
+        """Number of bits that have not been read yet"""
+        return self.length - self.position
+
+    def read(self, num_bits: int) -> int:
+        """Read the next bits as an unsigned integer
+
+        Args:
+            num_bits (int): Number of bits to read
+
+        Raises:
+            ConvertException: Not enough bits left
+
+        Returns:
+            int: Integer value of the bits read
+        """
+        end = self.position + num_bits
+        if end > self.length:
+            raise ConvertException(
+                message=f"Invalid binary size, expected (>=): {end} actual: {self.length}"
+            )
+
+        self.position = end
+        return (self.value >> (self.length - end)) & ((1 << num_bits) - 1)
+
+    def peek(self, num_bits: int) -> int:
+        """Read the next bits as an unsigned integer without consuming them
+
+        Args:
+            num_bits (int): Number of bits to read
+
+        Returns:
+            int: Integer value of the bits read
+        """
+        position = self.position
+        value = self.read(num_bits)
+        self.position = position
+
+        return value
+
+    def truncate(self, length: int) -> None:
+        """Drop all bits beyond the given length
+
+        Args:
+            length (int): New length of the bit sequence
+        """
+        if length < self.length:
+            self.value >>= self.length - length
+            self.length = length
+
+
+class BitWriter:
+    """Builder for a sequence of bits stored in a Python integer.
+
+    Attributes:
+        value (int): Integer holding the bits written so far
+        length (int): Number of bits written so far
+    """
+
+    __slots__ = ("value", "length")
+
+    def __init__(self) -> None:
+        self.value = 0
+        self.length = 0
+
+    def write(self, value: int, num_bits: int) -> None:
+        """Append an unsigned integer using a fixed amount of bits
+
+        Args:
+            value (int): Integer to append
+            num_bits (int): Number of bits to use
+
+        Raises:
+            ConvertException: Integer does not fit in the given amount of bits
+        """
+        if value < 0 or value >> num_bits:
+            raise ConvertException(
+                message=f"Value {value} does not fit in {num_bits} bits"
+            )
+
+        self.value = (self.value << num_bits) | value
+        self.length += num_bits
+
+    def to_binary(self) -> str:
+        """Binary string of the bits written
+
+        Returns:
+            str: Binary string
+        """
+        return f"{self.value:0{self.length}b}" if self.length else ""
+
+    def to_hex(self) -> str:
+        """Hexadecimal string of the bits written, padded to a multiple of 16 bits
+
+        Returns:
+            str: Uppercase hexadecimal string
+        """
+        padding = (16 - (self.length % 16)) % 16
+
+        return f"{self.value << padding:0{(self.length + padding) // 4}X}"
+
+    def to_bytes(self) -> bytes:
+        """Raw bytes of the bits written, padded to a multiple of 16 bits
+
+        Returns:
+            bytes: Big endian bytes
+        """
+        padding = (16 - (self.length % 16)) % 16
+
+        return (self.value << padding).to_bytes((self.length + padding) // 8, "big")
+
+
 def replace_uri_escapes(uri: str) -> str:
     """Replace the escaped characters in a EPC pure identity URI
 
@@ -119,6 +333,26 @@ def base64_to_hex(base64_string: str) -> str:
     return base64.b64decode(f"{base64_string}==").hex()
 
 
+def base64_to_bytes(base64_string: str) -> bytes:
+    """Convert base64 string to bytes
+
+    Args:
+        base64_string (str): Base64 string
+
+    Raises:
+        ConvertException: Base64 string is invalid
+
+    Returns:
+        bytes: Decoded bytes
+    """
+    # Add padding to ensure valid padding
+    try:
+        return base64.b64decode(f"{base64_string}==")
+    except ValueError:
+        # binascii.Error is a subclass of ValueError
+        raise ConvertException(message=f"Invalid base64 string {base64_string}")
+
+
 def hex_to_base64(hex_string: str) -> str:
     """Convert a hexadecimal string into base64 string
 
@@ -156,6 +390,506 @@ def binary_to_hex(binary_string: str) -> str:
     return f"{int(binary_string, 2):x}".upper()
 
 
+def _check_codes(codes: List[int], bits: int) -> bytes:
+    """Verify that character codes fit in a fixed amount of bits
+
+    Args:
+        codes (List[int]): Character codes
+        bits (int): Number of bits per code
+
+    Raises:
+        ConvertException: Code does not fit in the given amount of bits
+
+    Returns:
+        bytes: Verified character codes
+    """
+    for code in codes:
+        if code < 0 or code >> bits:
+            raise ConvertException(message=f"Value {code} does not fit in {bits} bits")
+
+    return bytes(codes)
+
+
+def _half_lane_masks(lane_bits: int, half_bits: int) -> Tuple[int, int]:
+    """Masks selecting the lower and upper half of every lane of a packed string
+
+    Args:
+        lane_bits (int): Number of bits per lane
+        half_bits (int): Number of bits per half, starting at the least significant bit of a lane
+
+    Returns:
+        Tuple[int, int]: Masks of the lower and upper halves
+    """
+    half = (1 << half_bits) - 1
+    lower = sum(half << i for i in range(0, MAX_PACKED_CHARS * 8, lane_bits))
+
+    return lower, lower << half_bits
+
+
+def _lane_steps(bits: int, unpack: bool) -> Tuple[Tuple[int, int, int], ...]:
+    """Masks and shifts per step of merging every pair of neighbouring lanes of 2**step
+    characters. Packing squeezes the upper lane onto the lower one, unpacking takes the steps
+    in reverse order to spread the upper half of every lane back out.
+
+    Args:
+        bits (int): Number of bits per packed character
+        unpack (bool): Whether the halves are selected from packed or byte aligned characters
+
+    Returns:
+        Tuple[Tuple[int, int, int], ...]: Lower half mask, upper half mask and shift per step
+    """
+    steps = []
+    for step in range(MAX_PACKED_CHARS.bit_length() - 1):
+        half_bits = (bits if unpack else 8) << step
+        steps.append((*_half_lane_masks(16 << step, half_bits), (8 - bits) << step))
+
+    return tuple(steps)
+
+
+# Strings of up to MAX_PACKED_CHARS characters are packed or unpacked in parallel
+MAX_PACKED_CHARS = 256
+PACK_STEPS = {bits: _lane_steps(bits, unpack=False) for bits in (6, 7)}
+UNPACK_STEPS = {bits: _lane_steps(bits, unpack=True) for bits in (6, 7)}
+
+
+def _pack_codes(codes: bytes, bits: int) -> int:
+    """Pack character codes into a single integer using a fixed amount of bits per code.
+    All bytes are packed in parallel by repeatedly merging pairs of lanes, each step halving
+    the number of lanes.
+
+    Args:
+        codes (bytes): Character codes fitting in the given amount of bits
+        bits (int): Number of bits per code
+
+    Returns:
+        int: Packed codes, the first code occupying the most significant bits
+    """
+    steps = (len(codes) - 1).bit_length()
+    if steps > len(PACK_STEPS[bits]):
+        return _pack_codes(codes[:-MAX_PACKED_CHARS], bits) << (
+            bits * MAX_PACKED_CHARS
+        ) | _pack_codes(codes[-MAX_PACKED_CHARS:], bits)
+
+    value = int.from_bytes(codes, "big")
+    for lower, upper, shift in PACK_STEPS[bits][:steps]:
+        value = value & lower | (value & upper) >> shift
+
+    return value
+
+
+def _unpack_codes(value: int, count: int, bits: int) -> bytes:
+    """Unpack character codes using a fixed amount of bits per code into a byte per code,
+    the inverse of _pack_codes
+
+    Args:
+        value (int): Packed codes, the first code occupying the most significant bits
+        count (int): Number of packed codes
+        bits (int): Number of bits per code
+
+    Returns:
+        bytes: Character codes
+    """
+    steps = (count - 1).bit_length()
+    if steps > len(UNPACK_STEPS[bits]):
+        tail_bits = bits * MAX_PACKED_CHARS
+        return _unpack_codes(
+            value >> tail_bits, count - MAX_PACKED_CHARS, bits
+        ) + _unpack_codes(value & ((1 << tail_bits) - 1), MAX_PACKED_CHARS, bits)
+
+    for lower, upper, shift in reversed(UNPACK_STEPS[bits][:steps]):
+        value = value & lower | (value & upper) << shift
+
+    return value.to_bytes(count, "big")
+
+
+def _seven_bit_codes(string: str) -> bytes:
+    """Seven bit codes of the characters of a string, URI escapes are a single code
+
+    Args:
+        string (str): String to encode
+
+    Raises:
+        ConvertException: Character without seven bit code
+
+    Returns:
+        bytes: Character codes
+    """
+    if "%" in string:
+        string = "".join(
+            [
+                chr(int(g[1:], 16)) if g[:1] == "%" else g
+                for g in SEVEN_BIT_ESCAPE_SPLIT_REGEX.split(string)
+            ]
+        )
+
+    if string.isascii():
+        return string.encode("ascii")
+
+    return _check_codes(list(map(ord, string)), 7)
+
+
+def _six_bit_code(char: str) -> int:
+    """Six bit code of a single character
+
+    Args:
+        char (str): Character to encode
+
+    Returns:
+        int: Character code, out of the six bit range for unsupported characters
+    """
+    code = SIX_BIT_CODES.get(char)
+    if code is None:
+        code = 48 + int(char) if char.isnumeric() else ord(char) - 64
+
+    return code
+
+
+def _six_bit_codes(string: str) -> bytes:
+    """Six bit codes of the characters of a string, URI escapes are a single code
+
+    Args:
+        string (str): String to encode
+
+    Raises:
+        ConvertException: Character without six bit code
+
+    Returns:
+        bytes: Character codes
+    """
+    chars = string
+    if "%" in string:
+        # Escapes are replaced by the character of which the escaped value is the code,
+        # values out of the six bit range result in non ASCII characters
+        chars = "".join(
+            [
+                chr(64 + int(g[1:], 16)) if g[:1] == "%" else g
+                for g in SIX_BIT_ESCAPE_SPLIT_REGEX.split(string)
+            ]
+        )
+
+    if chars.isascii():
+        codes = chars.encode("ascii").translate(SIX_BIT_CODE_TRANSLATION)
+        if INVALID_SIX_BIT_CODE not in codes:
+            return codes
+
+    codes = []
+    for g in SIX_BIT_ESCAPE_SPLIT_REGEX.split(string):
+        if g[:1] == "%":
+            codes.append(int(g[1:], 16))
+        else:
+            codes.extend(map(_six_bit_code, g))
+
+    return _check_codes(codes, 6)
+
+
+def write_string(writer: BitWriter, string: str, num_bits: int) -> None:
+    """Write a string using seven bits per character, padded with zeros to a certain length
+
+    Args:
+        writer (BitWriter): Writer to append to
+        string (str): String to encode, URI escapes are encoded as a single character
+        num_bits (int): Minimal number of bits to write
+    """
+    codes = _seven_bit_codes(string)
+    length = 7 * len(codes)
+    padding = max(num_bits - length, 0)
+
+    writer.write(_pack_codes(codes, 7) << padding, length + padding)
+
+
+def read_string(reader: BitReader, num_bits: int) -> str:
+    """Read a string encoded using seven bits per character
+
+    Args:
+        reader (BitReader): Reader to consume from
+        num_bits (int): Number of bits occupied by the string
+
+    Returns:
+        str: Decoded string, special characters are URI escaped
+    """
+    count = num_bits // 7
+    value = reader.read(7 * count)
+    reader.read(num_bits % 7)
+
+    chars = _unpack_codes(value, count, 7).rstrip(b"\0").decode("ascii")
+
+    return chars if chars.isalnum() else chars.translate(SEVEN_BIT_CHARS)
+
+
+def _write_six_bit_chars(writer: BitWriter, string: str) -> None:
+    """Write every character of a string as a six bit sequence without terminator
+
+    Args:
+        writer (BitWriter): Writer to append to
+        string (str): String to encode
+    """
+    codes = _six_bit_codes(string)
+    writer.write(_pack_codes(codes, 6), 6 * len(codes))
+
+
+def write_string_six_bits(writer: BitWriter, string: str) -> None:
+    """Write a string using six bits per character followed by a six bit terminator
+
+    Args:
+        writer (BitWriter): Writer to append to
+        string (str): String to encode
+    """
+    codes = _six_bit_codes(string)
+    writer.write(_pack_codes(codes, 6) << 6, 6 * len(codes) + 6)
+
+
+def read_string_six_bits(reader: BitReader, max_chars: int) -> str:
+    """Read six bit characters until a terminator or the end of the bits is reached
+
+    Args:
+        reader (BitReader): Reader to consume from
+        max_chars (int): Maximum length of resulting string
+
+    Raises:
+        ConvertException: Resulting string too large
+
+    Returns:
+        str: Decoded string
+    """
+    count = reader.remaining // 6
+    value = reader.peek(6 * count)
+    codes = _unpack_codes(value, count, 6)
+
+    end = codes.find(0)
+    if end < 0:
+        end = count
+    if end > max_chars:
+        raise ConvertException(message="Too many characters decoded!")
+
+    reader.position += 6 * min(end + 1, count)
+
+    chars = codes[:end].translate(SIX_BIT_ASCII).decode("ascii")
+
+    return chars.replace("#", "%23").replace("/", "%2F")
+
+
+def write_partition_table(
+    writer: BitWriter,
+    parts: Sequence[str],
+    partition_table: Dict[int, Dict[str, int]],
+    string_partition=False,
+    six_bit_variable_partition=False,
+) -> None:
+    """Write a company prefix and reference based on a partition table
+
+    Args:
+        writer (BitWriter): Writer to append to
+        parts (Sequence[str]): Company prefix and reference to encode
+        partition_table (Dict[int, Dict[str, int]]): Partition table indexed by company prefix length
+        string_partition (bool, optional): Whether to use string partition table.
+            Defaults to False.
+        six_bit_variable_partition (bool, optional): Whether to use six bit variable partition table.
+            Defaults to False.
+    """
+    C = parts[0]
+    D = parts[1]
+
+    partition = partition_table[len(C)]
+
+    writer.write(partition["P"], 3)
+    writer.write(int(C), partition["M"])
+
+    if string_partition:
+        write_string(writer, D, partition["N"])
+    elif six_bit_variable_partition:
+        write_string_six_bits(writer, D)
+    else:
+        writer.write(int(D) if partition["K"] != 0 else 0, partition["N"])
+
+
+def read_partition_table(
+    reader: BitReader,
+    partition_table: Dict[int, Dict[str, int]],
+    unpadded_partition=False,
+    string_partition=False,
+    six_bit_variable_partition=False,
+) -> Tuple[str, str]:
+    """Read a company prefix and reference using a partition table.
+
+    Args:
+        reader (BitReader): Reader to consume from
+        partition_table (Dict[int, Dict[str, int]]): Partition table indexed by partition value
+        unpadded_partition (bool, optional): Whether to use unpadded partitioning. Defaults to False.
+        string_partition (bool, optional): Whether to use string partitioning. Defaults to False.
+        six_bit_variable_partition (bool, optional): Whether to use six bit variable partitioning. Defaults to False.
+
+    Raises:
+        ConvertException: Invalid partition header
+        ConvertException: Too long company prefix
+        ConvertException: Too long item reference
+
+    Returns:
+        Tuple[str, str]: Company prefix and reference
+    """
+    partition_value = reader.read(3)
+
+    try:
+        partition = partition_table[partition_value]
+    except KeyError:
+        raise ConvertException(
+            message=f"Invalid partition header {partition_value:03b}"
+        )
+
+    C = reader.read(partition["M"])
+
+    if string_partition:
+        D = read_string(reader, partition["N"])
+    elif six_bit_variable_partition:
+        D = read_string_six_bits(reader, partition["K"])
+    else:
+        D_int = reader.read(partition["N"])
+        D = str(D_int) if partition["K"] != 0 else ""
+
+    compare_D = not (
+        unpadded_partition or string_partition or six_bit_variable_partition
+    )
+
+    if not C < pow(10, partition["L"]):
+        raise ConvertException(message=f"Company prefix length too large")
+    if D != "" and compare_D and not D_int < pow(10, partition["K"]):
+        raise ConvertException(message=f"Item reference length too large")
+
+    return f"{C:>0{partition['L']}}", f"{D:>0{partition['K'] if compare_D else 0}}"
+
+
+def write_numeric_string(writer: BitWriter, string: str, bit_count: int) -> None:
+    """Write a numeric string, leading zeros are preserved by prefixing a one
+
+    Args:
+        writer (BitWriter): Writer to append to
+        string (str): String to encode
+        bit_count (int): Number of bits to write
+
+    Raises:
+        ConvertException: Character string invalid
+    """
+    if 2 * pow(10, len(string)) >= pow(2, bit_count):
+        raise ConvertException(message="Invalid character string")
+
+    writer.write(int(f"1{string}"), bit_count)
+
+
+def read_numeric_string(reader: BitReader, bit_count: int) -> str:
+    """Read a numeric string
+
+    Args:
+        reader (BitReader): Reader to consume from
+        bit_count (int): Number of bits to read
+
+    Raises:
+        ConvertException: Numeric string invalid
+
+    Returns:
+        str: Decoded numeric string
+    """
+    string = f"{reader.read(bit_count)}"
+
+    if len(string) <= 1 or string[0] != "1":
+        raise ConvertException(message="Invalid numeric string")
+
+    return string[1:]
+
+
+def write_fixed_width_integer(writer: BitWriter, string: str, bit_count: int) -> None:
+    """Write a string using fixed width integer
+
+    Args:
+        writer (BitWriter): Writer to append to
+        string (str): String to encode
+        bit_count (int): Number of bits to write
+
+    Raises:
+        ConvertException: Fixed width numeric integer too large
+    """
+    if int(string) >= (pow(10, int(bit_count * log(2) / log(10))) - 1):
+        raise ConvertException(message="Fixed width numeric integer too large")
+
+    writer.write(int(string), bit_count)
+
+
+def read_fixed_width_integer(reader: BitReader, bit_count: int) -> str:
+    """Read a fixed width integer
+
+    Args:
+        reader (BitReader): Reader to consume from
+        bit_count (int): Number of bits to read
+
+    Raises:
+        ConvertException: Bits cannot be converted into the required number of digits
+
+    Returns:
+        str: Decoded fixed width integer string
+    """
+    D = int(bit_count * log(2) / log(10))
+    value = reader.read(bit_count)
+    if value > pow(10, D) - 1:
+        raise ConvertException(message=f"Bits cannot be converted to {D} digits")
+
+    return f"{value:0>{D}}"
+
+
+def write_cage_code(writer: BitWriter, chars: str) -> None:
+    """Write a character sequence using eight bit cage codes
+
+    Args:
+        writer (BitWriter): Writer to append to
+        chars (str): Character sequence to encode
+    """
+    for char in chars:
+        writer.write(ord(char), 8)
+
+
+def read_cage_code(reader: BitReader, num_chars: int = 6) -> str:
+    """Read a character sequence of eight bit cage codes, padding spaces are removed
+
+    Args:
+        reader (BitReader): Reader to consume from
+        num_chars (int, optional): Number of characters to read. Defaults to 6.
+
+    Returns:
+        str: Decoded string
+    """
+    return "".join([chr(reader.read(8)) for _ in range(num_chars)]).replace(" ", "")
+
+
+def write_cage_code_six_bits(writer: BitWriter, chars: str) -> None:
+    """Write a character sequence using six bit cage codes, five character codes are padded
+
+    Args:
+        writer (BitWriter): Writer to append to
+        chars (str): Character sequence to encode
+    """
+    code_writer = BitWriter()
+    _write_six_bit_chars(code_writer, chars)
+
+    if code_writer.length == 30:
+        writer.write(0b100000, 6)
+    writer.write(code_writer.value, code_writer.length)
+
+
+def read_cage_code_six_bits(reader: BitReader) -> str:
+    """Read a six bit cage code of 36 bits
+
+    Args:
+        reader (BitReader): Reader to consume from
+
+    Returns:
+        str: Decoded string
+    """
+    if reader.peek(6) == 0b100000:
+        reader.read(6)
+        code_reader = BitReader(reader.read(30), 30)
+    else:
+        code_reader = BitReader(reader.read(36), 36)
+
+    return read_string_six_bits(code_reader, 6)
+
+
 def encode_string(string: str, num_bits: int) -> str:
     """Encode a string into a bit string of a certain length
 
@@ -166,15 +900,10 @@ def encode_string(string: str, num_bits: int) -> str:
     Returns:
         str: Binary string
     """
-    res = ""
-    for g in re.split("(%[0-9a-fA-F]{2})", string):
-        if len(g) == 0:
-            continue
-        elif g[0] != "%":
-            res += "".join([str_to_binary(str(ord(s)), 7) for s in g])
-        else:
-            res += str_to_binary(str(int(g[1:], 16)), 7)
-    return f"{res:<0{num_bits}}"
+    writer = BitWriter()
+    write_string(writer, string, num_bits)
+
+    return writer.to_binary()
 
 
 def decode_string_six_bits(binary: str, max_chars: int) -> str:
@@ -190,21 +919,7 @@ def decode_string_six_bits(binary: str, max_chars: int) -> str:
     Returns:
         str: Decoded string
     """
-    res = ""
-    for g in re.split("([0-1]{6})", binary):
-        if g == "000000":
-            break
-        if len(g) < 6:
-            continue
-        elif g.startswith("10") or g.startswith("11"):
-            res += chr(int(g, 2))
-        else:
-            res += chr(64 + int(g, 2))
-
-    if len(res) > max_chars:
-        raise ConvertException(message="Too many characters decoded!")
-
-    return res.replace("#", "%23").replace("/", "%2F")
+    return read_string_six_bits(BitReader.from_binary(binary), max_chars)
 
 
 def encode_string_six_bits(string: str) -> str:
@@ -216,22 +931,10 @@ def encode_string_six_bits(string: str) -> str:
     Returns:
         str: Encoded string
     """
-    res = ""
-    for g in re.split("(%[0-9a-fA-F]{2}|-)", string):
-        if len(g) == 0:
-            continue
-        elif g == "-":
-            res += "101101"
-        elif g[0] != "%":
-            res += "".join(
-                [
-                    f"11{int(s):04b}" if s.isnumeric() else f"{int(ord(s) - 64):06b}"
-                    for s in g
-                ]
-            )
-        else:
-            res += str_to_binary(str(int(g[1:], 16)), 6)
-    return f"{res}000000"
+    writer = BitWriter()
+    write_string_six_bits(writer, string)
+
+    return writer.to_binary()
 
 
 def decode_binary_char(binary: str) -> str:
@@ -260,14 +963,7 @@ def decode_string(binary: str) -> str:
     Returns:
         str: Decoded string
     """
-    return "".join(
-        list(
-            map(
-                decode_binary_char,
-                re.findall("." * 7, binary),
-            )
-        )
-    )
+    return read_string(BitReader.from_binary(binary), len(binary))
 
 
 def encode_partition_table(
@@ -289,26 +985,16 @@ def encode_partition_table(
     Returns:
         str: Encoded string
     """
-    C = parts[0]
-    D = parts[1]
-
-    partition = partition_table[len(C)]
-
-    P_bin = int_to_binary(partition["P"], 3)
-    C_bin = str_to_binary(C, partition["M"])
-
-    if string_partition:
-        D_bin = encode_string(D, partition["N"])
-    elif six_bit_variable_partition:
-        D_bin = encode_string_six_bits(D)
-    else:
-        D_bin = (
-            str_to_binary(D, partition["N"])
-            if partition["K"] != 0
-            else "0" * partition["N"]
-        )
+    writer = BitWriter()
+    write_partition_table(
+        writer,
+        parts,
+        partition_table,
+        string_partition=string_partition,
+        six_bit_variable_partition=six_bit_variable_partition,
+    )
 
-    return P_bin + C_bin + D_bin
+    return writer.to_binary()
 
 
 def decode_partition_table(
@@ -335,33 +1021,16 @@ def decode_partition_table(
     Returns:
         str: Decoded string
     """
-    try:
-        partition = partition_table[binary_to_int(binary_string[:3])]
-    except KeyError:
-        raise ConvertException(message=f"Invalid partition header {binary_string[:3]}")
-
-    C = binary_to_int(binary_string[3 : (3 + partition["M"])])
-
-    D_bin = binary_string[(3 + partition["M"]) : (3 + partition["M"] + partition["N"])]
-
-    if string_partition:
-        D = decode_string(D_bin)
-    elif six_bit_variable_partition:
-        D = decode_string_six_bits(D_bin, partition["K"])
-    else:
-        D = str(binary_to_int(D_bin)) if partition["K"] != 0 else ""
-
-    compare_D = not (
-        unpadded_partition or string_partition or six_bit_variable_partition
+    return ".".join(
+        read_partition_table(
+            BitReader.from_binary(binary_string),
+            partition_table,
+            unpadded_partition=unpadded_partition,
+            string_partition=string_partition,
+            six_bit_variable_partition=six_bit_variable_partition,
+        )
     )
 
-    if not C < pow(10, partition["L"]):
-        raise ConvertException(message=f"Company prefix length too large")
-    if D != "" and compare_D and not int(D) < pow(10, partition["K"]):
-        raise ConvertException(message=f"Item reference length too large")
-
-    return f"{C:>0{partition['L']}}.{D:>0{partition['K'] if compare_D else 0}}"
-
 
 def encode_numeric_string(string: str, bit_count: int) -> str:
     """Encode a numeric string
@@ -376,10 +1045,10 @@ def encode_numeric_string(string: str, bit_count: int) -> str:
     Returns:
         str: Encoded string
     """
-    if 2 * pow(10, len(string)) >= pow(2, bit_count):
-        raise ConvertException(message="Invalid character string")
+    writer = BitWriter()
+    write_numeric_string(writer, string, bit_count)
 
-    return str_to_binary(f"1{string}", bit_count)
+    return writer.to_binary()
 
 
 def decode_numeric_string(binary: str) -> str:
@@ -394,12 +1063,7 @@ def decode_numeric_string(binary: str) -> str:
     Returns:
         str: Decoded numeric string
     """
-    string = f"{int(binary, 2)}"
-
-    if len(string) <= 1 or string[0] != "1":
-        raise ConvertException(message="Invalid numeric string")
-
-    return string[1:]
+    return read_numeric_string(BitReader.from_binary(binary), len(binary))
 
 
 def encode_fixed_width_integer(string: str, bit_count: int) -> str:
@@ -415,10 +1079,10 @@ def encode_fixed_width_integer(string: str, bit_count: int) -> str:
     Returns:
         str: Encoded fixed width integer string
     """
-    if int(string) >= (pow(10, int(bit_count * log(2) / log(10))) - 1):
-        raise ConvertException(message="Fixed width numeric integer too large")
+    writer = BitWriter()
+    write_fixed_width_integer(writer, string, bit_count)
 
-    return str_to_binary(string, bit_count)
+    return writer.to_binary()
 
 
 def decode_fixed_width_integer(binary: str) -> str:
@@ -433,11 +1097,7 @@ def decode_fixed_width_integer(binary: str) -> str:
     Returns:
         str: Decoded fixed width integer string
     """
-    D = int(len(binary) * log(2) / log(10))
-    if int(binary, 2) > pow(10, D) - 1:
-        raise ConvertException(message=f"Bits cannot be converted to {D} digits")
-
-    return f"{int(binary, 2):0>{D}}"
+    return read_fixed_width_integer(BitReader.from_binary(binary), len(binary))
 
 
 def decode_cage_code(binary: str) -> str:
@@ -449,9 +1109,7 @@ def decode_cage_code(binary: str) -> str:
     Returns:
         str: Decoded string
     """
-    return "".join(
-        [chr(int(g, 2)) if g != "" else "" for g in re.split("([0-1]{8})", binary)]
-    ).replace(" ", "")
+    return read_cage_code(BitReader.from_binary(binary), len(binary) // 8)
 
 
 def encode_cage_code(chars: str) -> str:
@@ -463,7 +1121,10 @@ def encode_cage_code(chars: str) -> str:
     Returns:
         str: Encoded string
     """
-    return "".join([f"{ord(char):0>8b}" for char in chars])
+    writer = BitWriter()
+    write_cage_code(writer, chars)
+
+    return writer.to_binary()
 
 
 def decode_cage_code_six_bits(binary: str) -> str:
@@ -475,10 +1136,11 @@ def decode_cage_code_six_bits(binary: str) -> str:
     Returns:
         str: Decoded string
     """
+    reader = BitReader.from_binary(binary)
     if binary.startswith("100000"):
-        binary = binary[6:]
+        reader.read(6)
 
-    return decode_string_six_bits(binary, 6)
+    return read_string_six_bits(reader, 6)
 
 
 def encode_cage_code_six_bits(chars: str) -> str:
@@ -490,10 +1152,10 @@ def encode_cage_code_six_bits(chars: str) -> str:
     Returns:
         str: Encoded string
     """
-    binary = f"{encode_string_six_bits(chars)[:-6]}"
-    if len(binary) == 30:
-        binary = "100000" + binary
-    return binary
+    writer = BitWriter()
+    write_cage_code_six_bits(writer, chars)
+
+    return writer.to_binary()
 
 
 def verify_gs3a3_component(gs3a3_component: str):
@@ -542,14 +1204,29 @@ def calculate_checksum(digits: str) -> int:
     return checksum
 
 
+@lru_cache(maxsize=None)
+def coding_scheme_size(coding_scheme: Enum) -> Optional[int]:
+    """Number of bits of a binary coding scheme, parsed once per coding scheme
+
+    Args:
+        coding_scheme (Enum): Binary coding scheme, e.g. sgtin-96
+
+    Returns:
+        Optional[int]: Number of bits, None for variable length coding schemes
+    """
+    _, size = coding_scheme.value.split("-")
+
+    return int(size) if size.isnumeric() else None
+
+
 def parse_header_and_truncate_binary(
-    binary_string: str, header_to_schemes: Dict[str, Enum]
+    binary_string: str, header_to_schemes: Mapping[str, Enum]
 ) -> Tuple[Enum, str]:
     """Parse a binary header, detect the scheme and truncate the binary string based on the scheme.
 
     Args:
         binary_string (str): Full length binary string
-        header_to_schemes (Dict[str, str]): Mapping from binary headers to schemes
+        header_to_schemes (Mapping[str, Enum]): Mapping from binary headers to schemes
 
     Raises:
         ConvertException: Invalid binary header
@@ -562,11 +1239,10 @@ def parse_header_and_truncate_binary(
 
     try:
         scheme = header_to_schemes[header]
-    except ValueError:
+    except KeyError:
         raise ConvertException(message=f"{header} is not a valid header")
 
-    _, size = scheme.value.split("-")
-    size = int(size) if size.isnumeric() else None
+    size = coding_scheme_size(scheme)
 
     if size and size > len(binary_string):
         raise ConvertException(
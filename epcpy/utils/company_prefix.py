@@ -0,0 +1,462 @@
+"""Resolution of the length of GS1 Company Prefixes from the leading digits of GS1 keys.
+
+The lengths are loaded from the GS1 Company Prefix format list, published by GS1 in XML and
+JSON, or from a CSV export of prefix and length pairs. They are stored in a compact digit trie,
+resolving the length of the longest matching prefix in time linear in the length of the prefix.
+
+A configured trie is used by the from_gs1_element_string implementations of all GS1Element
+schemes, SGTIN.from_gtin_plus_serial and get_gs1_key when no company prefix length is given,
+see configure_company_prefixes. A CompanyPrefixTable reloads its file into a new trie, which
+replaces the configured trie atomically.
+"""
+
+import csv
+import json
+import os
+import threading
+from array import array
+from concurrent.futures import Future
+from itertools import groupby, repeat
+from operator import floordiv, itemgetter, mod
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from epcpy.utils.common import ConvertException
+
+MAX_COMPANY_PREFIX_LENGTH = 12
+
+DIGIT_BITS = tuple(1 << digit for digit in range(10))
+# Bit of every byte of an encoded string, 0 for bytes that are not ASCII digits
+BYTE_BITS = tuple(
+    DIGIT_BITS[byte - ord("0")] if ord("0") <= byte <= ord("9") else 0
+    for byte in range(256)
+)
+# Number of set bits of every 10 bit child mask
+MASK_RANKS = bytes(bin(mask).count("1") for mask in range(1 << 10))
+
+FILE_FORMATS = ("xml", "json", "csv")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class CompanyPrefixTrie:
+    """Digit trie mapping GS1 Company Prefix format prefixes onto company prefix lengths.
+
+    Nodes are numbered breadth first, with the children of a node numbered consecutively in
+    order of their digit. Every node is stored as a 10 bit mask of its child digits, the number
+    of its first child and the company prefix length of its longest prefix in the trie,
+    in three flat arrays.
+
+    Args:
+        entries (Iterable[Tuple[str, int]]): Prefixes of digits and their company prefix lengths,
+            a length of 0 marks prefixes that do not contain a company prefix
+
+    Raises:
+        ValueError: Invalid prefix or length, or conflicting lengths of a prefix
+    """
+
+    __slots__ = ("_masks", "_first_children", "_lengths", "_size")
+
+    def __init__(self, entries: Iterable[Tuple[str, int]]) -> None:
+        # Lengths by the integer value of the prefixes of every number of digits
+        by_depth: List[Dict[int, int]] = [{}]
+        for prefix, length in entries:
+            if not (prefix.isascii() and prefix.isdigit()):
+                raise ValueError(f"Invalid company prefix format prefix {prefix!r}")
+            if not 0 <= length <= MAX_COMPANY_PREFIX_LENGTH:
+                raise ValueError(f"Invalid company prefix length {length} of {prefix}")
+
+            while len(by_depth) <= len(prefix):
+                by_depth.append({})
+
+            known = by_depth[len(prefix)].setdefault(int(prefix), length)
+            if known != length:
+                raise ValueError(
+                    f"Conflicting company prefix lengths {known} and {length} of {prefix}"
+                )
+
+        self._size = sum(map(len, by_depth))
+
+        # The nodes of every depth are the entries of that depth and the parents of the next depth
+        levels: List[List[int]] = [[0] for _ in by_depth]
+        parents: Set[int] = set()
+        for depth in range(len(by_depth) - 1, 0, -1):
+            levels[depth] = sorted(parents.union(by_depth[depth]))
+            parents = set(map(floordiv, levels[depth], repeat(10)))
+
+        masks = array("H")
+        first_children = array("I")
+        lengths = bytearray(1)
+        numbers = {0: 0}
+        offset = 0
+
+        for depth in range(1, len(levels)):
+            level = levels[depth]
+            parent_offset, offset = offset, len(lengths)
+            parent_numbers = list(
+                map(numbers.__getitem__, map(floordiv, level, repeat(10)))
+            )
+
+            # Nodes that are not an entry inherit the length of their parent
+            lengths += bytearray(
+                map(
+                    by_depth[depth].get, level, map(lengths.__getitem__, parent_numbers)
+                )
+            )
+
+            # Children are sorted by parent, the mask of a parent is the sum of the bits of
+            # the last digits of its children
+            children = range(offset, offset + len(level))
+            first_child = dict(zip(reversed(parent_numbers), reversed(children)))
+            mask = {
+                parent: sum(map(itemgetter(1), group))
+                for parent, group in groupby(
+                    zip(
+                        parent_numbers,
+                        map(DIGIT_BITS.__getitem__, map(mod, level, repeat(10))),
+                    ),
+                    itemgetter(0),
+                )
+            }
+            parent_range = range(parent_offset, offset)
+            masks.extend(map(mask.get, parent_range, repeat(0)))
+            first_children.extend(map(first_child.get, parent_range, repeat(0)))
+
+            numbers = dict(zip(level, children))
+
+        masks.extend(repeat(0, len(lengths) - len(masks)))
+        first_children.extend(repeat(0, len(lengths) - len(first_children)))
+
+        self._masks = masks
+        self._first_children = first_children
+        self._lengths = lengths
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the nodes of the trie"""
+        return (
+            len(self._masks) * self._masks.itemsize
+            + len(self._first_children) * self._first_children.itemsize
+            + len(self._lengths)
+        )
+
+    def lookup(self, digits: str) -> Optional[int]:
+        """Company prefix length of the longest prefix of the digits in the trie
+
+        Args:
+            digits (str): Leading digits of a GS1 key, starting with the company prefix
+
+        Returns:
+            Optional[int]: Company prefix length, None if no prefix matches or the matching
+                prefix does not contain a company prefix
+        """
+        masks = self._masks
+        first_children = self._first_children
+        node = 0
+
+        for byte in digits.encode():
+            bit = BYTE_BITS[byte]
+            mask = masks[node]
+            if not mask & bit:
+                break
+
+            node = first_children[node] + MASK_RANKS[mask & (bit - 1)]
+
+        return self._lengths[node] or None
+
+    @classmethod
+    def from_file(
+        cls, path: PathLike, file_format: Optional[str] = None
+    ) -> "CompanyPrefixTrie":
+        """Load a trie from a company prefix file, see read_company_prefixes
+
+        Args:
+            path (PathLike): Path of the file
+            file_format (Optional[str], optional): One of xml, json and csv. Defaults to the
+                extension of the path.
+
+        Raises:
+            ValueError: Unknown file format or invalid entries
+
+        Returns:
+            CompanyPrefixTrie: Trie of the entries in the file
+        """
+        return cls(read_company_prefixes(path, file_format))
+
+
+def _invalid_file(path: PathLike, location: str, error: Exception) -> ValueError:
+    """Error of a malformed company prefix file
+
+    Args:
+        path (PathLike): Path of the file
+        location (str): Location of the malformed entry in the file
+        error (Exception): Error raised while reading the entry
+
+    Returns:
+        ValueError: Error naming the file and the location
+    """
+    if isinstance(error, KeyError):
+        error = f"missing {error}"
+
+    return ValueError(f"Invalid company prefix file {path}, {location}: {error}")
+
+
+def _read_xml(path: PathLike) -> Iterator[Tuple[str, int]]:
+    # ElementTree is imported on first use, as it dominates the cost of importing this module
+    from xml.etree.ElementTree import ParseError, iterparse
+
+    index = 0
+    try:
+        for _, element in iterparse(path):
+            if element.tag.rpartition("}")[2] == "entry":
+                try:
+                    entry = element.attrib["prefix"], int(element.attrib["gcpLength"])
+                except (KeyError, ValueError) as e:
+                    raise _invalid_file(
+                        path, f"entry element {index} {element.attrib}", e
+                    ) from e
+
+                yield entry
+                element.clear()
+                index += 1
+    except ParseError as e:
+        raise _invalid_file(path, "malformed XML", e) from e
+
+
+def _read_json(path: PathLike) -> Iterator[Tuple[str, int]]:
+    with open(path, encoding="utf-8") as f:
+        try:
+            entries = json.load(f)["GCPPrefixFormatList"]["entry"]
+        except (KeyError, TypeError, ValueError) as e:
+            raise _invalid_file(path, "GCPPrefixFormatList", e) from e
+
+    for index, entry in enumerate(entries):
+        try:
+            yield entry["prefix"], int(entry["gcpLength"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise _invalid_file(path, f"entry {index} {entry}", e) from e
+
+
+def _read_csv(path: PathLike) -> Iterator[Tuple[str, int]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if not row or not row[0].strip().isdigit():
+                continue
+
+            try:
+                length = int(row[1])
+            except (IndexError, ValueError) as e:
+                raise _invalid_file(path, f"row {reader.line_num} {row}", e) from e
+
+            yield row[0].strip(), length
+
+
+COMPANY_PREFIX_READERS = {"xml": _read_xml, "json": _read_json, "csv": _read_csv}
+
+
+def read_company_prefixes(
+    path: PathLike, file_format: Optional[str] = None
+) -> Iterator[Tuple[str, int]]:
+    """Read the entries of a company prefix file. Supported formats are:
+    - xml: the GS1 Company Prefix format list, entry elements with prefix and gcpLength attributes
+    - json: the GS1 Company Prefix format list, GCPPrefixFormatList.entry objects with prefix and
+      gcpLength members
+    - csv: rows of a prefix and its length, rows not starting with a prefix such as headers are skipped
+
+    Args:
+        path (PathLike): Path of the file
+        file_format (Optional[str], optional): One of xml, json and csv. Defaults to the
+            extension of the path.
+
+    Raises:
+        ValueError: Unknown file format, or while iterating a malformed file, naming the
+            file and the malformed entry
+
+    Returns:
+        Iterator[Tuple[str, int]]: Prefixes and their company prefix lengths
+    """
+    if file_format is None:
+        file_format = os.path.splitext(path)[1][1:].lower()
+    if file_format not in COMPANY_PREFIX_READERS:
+        raise ValueError(
+            f"Unknown company prefix file format {file_format}, expected one of {', '.join(FILE_FORMATS)}"
+        )
+
+    return COMPANY_PREFIX_READERS[file_format](path)
+
+
+class CompanyPrefixTable:
+    """Company prefix file loaded into a trie that can be reloaded while it is in use.
+
+    A reload reads the file into a new trie, which replaces the current trie in a single
+    assignment once it is complete. Tries are never modified after they are built, so lookups
+    do not take a lock and a lookup during a reload uses either the old or the new trie.
+    If a reload fails the current trie is kept.
+
+    Args:
+        path (PathLike): Path of the file
+        file_format (Optional[str], optional): One of xml, json and csv. Defaults to the
+            extension of the path.
+
+    Raises:
+        ValueError: Unknown file format or invalid entries
+    """
+
+    __slots__ = ("path", "file_format", "_trie", "_version", "_reload_lock")
+
+    def __init__(self, path: PathLike, file_format: Optional[str] = None) -> None:
+        self.path = path
+        self.file_format = file_format
+        self._reload_lock = threading.Lock()
+        self._trie = CompanyPrefixTrie([])
+        self._version: Optional[Tuple[int, int]] = None
+
+        self.reload()
+
+    @property
+    def trie(self) -> CompanyPrefixTrie:
+        """Current trie of the table"""
+        return self._trie
+
+    def lookup(self, digits: str) -> Optional[int]:
+        """Company prefix length of the longest prefix of the digits, see CompanyPrefixTrie.lookup
+
+        Args:
+            digits (str): Leading digits of a GS1 key, starting with the company prefix
+
+        Returns:
+            Optional[int]: Company prefix length, None if no prefix matches or the matching
+                prefix does not contain a company prefix
+        """
+        return self._trie.lookup(digits)
+
+    def _file_version(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> CompanyPrefixTrie:
+        """Read the file into a new trie and replace the current trie.
+        Concurrent reloads are applied one at a time.
+
+        Raises:
+            OSError: File could not be read
+            ValueError: Invalid entries
+
+        Returns:
+            CompanyPrefixTrie: New trie
+        """
+        with self._reload_lock:
+            # The version is taken before reading, a change during the read is reloaded again
+            version = self._file_version()
+            trie = CompanyPrefixTrie.from_file(self.path, self.file_format)
+            self._trie, self._version = trie, version
+
+        return trie
+
+    def reload_if_modified(self) -> bool:
+        """Reload the file if its modification time or size changed since it was last loaded
+
+        Raises:
+            OSError: File could not be read
+            ValueError: Invalid entries
+
+        Returns:
+            bool: Whether the file was reloaded
+        """
+        if self._file_version() == self._version:
+            return False
+
+        self.reload()
+
+        return True
+
+    def reload_in_background(self) -> "Future[CompanyPrefixTrie]":
+        """Reload the file in a background thread, the current trie is used until the new trie
+        is complete
+
+        Returns:
+            Future[CompanyPrefixTrie]: New trie, or the exception raised while reloading
+        """
+        future: "Future[CompanyPrefixTrie]" = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+
+            try:
+                future.set_result(self.reload())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="company-prefix-reload", daemon=True).start()
+
+        return future
+
+
+_company_prefixes: Optional[Union[CompanyPrefixTrie, CompanyPrefixTable]] = None
+
+
+def configure_company_prefixes(
+    company_prefixes: Optional[Union[CompanyPrefixTrie, CompanyPrefixTable]],
+) -> None:
+    """Configure the trie or table resolving company prefix lengths that are not given
+
+    Args:
+        company_prefixes (Optional[Union[CompanyPrefixTrie, CompanyPrefixTable]]): Company prefix
+            trie or reloadable table, None to disable resolution
+    """
+    global _company_prefixes
+
+    _company_prefixes = company_prefixes
+
+
+def load_company_prefixes(
+    path: PathLike, file_format: Optional[str] = None
+) -> CompanyPrefixTable:
+    """Load a company prefix file and configure it for resolving company prefix lengths.
+    The returned table can be reloaded when the file changes, without configuring it again.
+
+    Args:
+        path (PathLike): Path of the file
+        file_format (Optional[str], optional): One of xml, json and csv. Defaults to the
+            extension of the path.
+
+    Raises:
+        OSError: File could not be read
+        ValueError: Unknown file format or invalid entries
+
+    Returns:
+        CompanyPrefixTable: Configured table
+    """
+    table = CompanyPrefixTable(path, file_format)
+    configure_company_prefixes(table)
+
+    return table
+
+
+def resolve_company_prefix_length(digits: str) -> int:
+    """Company prefix length of a GS1 key using the configured trie or table
+
+    Args:
+        digits (str): Leading digits of a GS1 key, starting with the company prefix
+
+    Raises:
+        ConvertException: No company prefixes configured or unknown company prefix
+
+    Returns:
+        int: Company prefix length
+    """
+    if _company_prefixes is None:
+        raise ConvertException(
+            message="A company prefix length is required, no company prefixes are configured"
+        )
+
+    length = _company_prefixes.lookup(digits)
+    if length is None:
+        raise ConvertException(message=f"Unknown company prefix of {digits}")
+
+    return length
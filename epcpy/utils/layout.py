@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from epcpy.utils.common import (
+    BitReader,
+    BitWriter,
+    ConvertException,
+    read_cage_code,
+    read_cage_code_six_bits,
+    read_fixed_width_integer,
+    read_numeric_string,
+    read_partition_table,
+    read_string,
+    read_string_six_bits,
+    write_cage_code,
+    write_cage_code_six_bits,
+    write_fixed_width_integer,
+    write_numeric_string,
+    write_partition_table,
+    write_string,
+    write_string_six_bits,
+    verify_gs3a3_component,
+)
+from epcpy.utils.tokenizers import is_cage_code_or_dodaac, is_cpref, is_gs3a3
+
+
+class Field:
+    """Base class for a field of a binary layout
+
+    Attributes:
+        components (int): Number of URI components encoded by this field
+        validated (bool): Whether every decoded value is a valid URI component,
+            otherwise decoded values are checked by verify
+    """
+
+    components = 1
+    validated = True
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        """Read the URI components of this field
+
+        Args:
+            reader (BitReader): Reader to consume from
+
+        Raises:
+            NotImplementedError: Method not implemented by default.
+
+        Returns:
+            Tuple[str, ...]: Decoded URI components
+        """
+        raise NotImplementedError
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        """Write the URI components of this field
+
+        Args:
+            writer (BitWriter): Writer to append to
+            components (Sequence[str]): URI components to encode
+
+        Raises:
+            NotImplementedError: Method not implemented by default.
+        """
+        raise NotImplementedError
+
+    def verify(self, components: Sequence[str]) -> None:
+        """Verify the decoded URI components of this field, only needed if not validated
+
+        Args:
+            components (Sequence[str]): Decoded URI components of this field
+
+        Raises:
+            ConvertException: Components are not valid
+        """
+        pass
+
+
+def _verify_component(component: str, is_valid: Callable[[str], bool]) -> None:
+    """Verify a decoded URI component using a validator of the tokenizers
+
+    Args:
+        component (str): Decoded URI component
+        is_valid (Callable[[str], bool]): Validator of the component
+
+    Raises:
+        ConvertException: Component is not valid
+    """
+    if not is_valid(component):
+        raise ConvertException(message=f"Invalid URI component {component}")
+
+
+class Integer(Field):
+    """Unsigned integer of a fixed number of bits"""
+
+    def __init__(self, num_bits: int) -> None:
+        self.num_bits = num_bits
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (str(reader.read(self.num_bits)),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        writer.write(int(components[0]), self.num_bits)
+
+
+class TrailingInteger(Field):
+    """Unsigned integer of at most a number of bits, truncated by the end of the bits.
+    The number of digits can be limited below the number of bits, e.g. 12 digits in 40 bits.
+    """
+
+    def __init__(self, num_bits: int, max_digits: Optional[int] = None) -> None:
+        self.num_bits = num_bits
+        self.max_digits = max_digits
+        self.validated = max_digits is None
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (str(reader.read(min(self.num_bits, reader.remaining))),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        writer.write(int(components[0]), self.num_bits)
+
+    def verify(self, components: Sequence[str]) -> None:
+        if len(components[0]) > self.max_digits:
+            raise ConvertException(
+                message=f"Invalid number of digits: {len(components[0])} (max: {self.max_digits})"
+            )
+
+
+class String(Field):
+    """Seven bit character string of a fixed number of bits, decoded as a GS3A3 component.
+    The length of the component including escapes can be limited, e.g. 16 for GRAI serials.
+    """
+
+    validated = False
+
+    def __init__(self, num_bits: int, max_length: Optional[int] = None) -> None:
+        self.num_bits = num_bits
+        self.max_length = max_length
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (read_string(reader, self.num_bits),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_string(writer, components[0], self.num_bits)
+
+    def verify(self, components: Sequence[str]) -> None:
+        _verify_component(components[0], is_gs3a3)
+        verify_gs3a3_component(components[0])
+
+        if self.max_length is not None and len(components[0]) > self.max_length:
+            raise ConvertException(
+                message=f"Invalid number of characters: {len(components[0])} (max: {self.max_length})"
+            )
+
+
+class SixBitString(Field):
+    """Six bit character string followed by a six bit terminator"""
+
+    validated = False
+
+    def __init__(
+        self,
+        max_chars: int,
+        is_valid: Callable[[str], bool],
+        terminated: bool = False,
+    ) -> None:
+        self.max_chars = max_chars
+        self.is_valid = is_valid
+        self.terminated = terminated
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        string = read_string_six_bits(reader, self.max_chars)
+
+        if self.terminated and reader.remaining < 6:
+            raise ConvertException(message="Invalid binary, missing 6-bit terminators")
+
+        return (string,)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_string_six_bits(writer, components[0])
+
+    def verify(self, components: Sequence[str]) -> None:
+        _verify_component(components[0], self.is_valid)
+
+
+class NumericString(Field):
+    """Numeric string of a fixed number of bits, leading zeros are preserved"""
+
+    def __init__(self, num_bits: int) -> None:
+        self.num_bits = num_bits
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (read_numeric_string(reader, self.num_bits),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_numeric_string(writer, components[0], self.num_bits)
+
+
+class FixedWidthInteger(Field):
+    """Zero padded integer of a fixed number of bits"""
+
+    def __init__(self, num_bits: int) -> None:
+        self.num_bits = num_bits
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (read_fixed_width_integer(reader, self.num_bits),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_fixed_width_integer(writer, components[0], self.num_bits)
+
+
+class CageCode(Field):
+    """Six eight bit characters, padded with spaces on the left"""
+
+    validated = False
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (read_cage_code(reader),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_cage_code(writer, f"{components[0]:>6}")
+
+    def verify(self, components: Sequence[str]) -> None:
+        _verify_component(components[0], is_cage_code_or_dodaac)
+
+
+class SixBitCageCode(Field):
+    """Cage code of 36 bits using six bit characters"""
+
+    validated = False
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return (read_cage_code_six_bits(reader),)
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_cage_code_six_bits(writer, components[0])
+
+    def verify(self, components: Sequence[str]) -> None:
+        _verify_component(components[0], is_cage_code_or_dodaac)
+
+
+class Reserved(Field):
+    """Reserved bits, always encoded as zeros"""
+
+    components = 0
+
+    def __init__(self, num_bits: int) -> None:
+        self.num_bits = num_bits
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        reader.read(self.num_bits)
+        return ()
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        writer.write(0, self.num_bits)
+
+
+class Partition(Field):
+    """Company prefix and reference encoded using a partition table.
+    A reference that is not numeric is decoded as a GS3A3 component for string partitions
+    and as a CPREF component for six bit variable partitions. The combined length of the
+    company prefix and such a reference can be limited, e.g. 30 for GIAI asset references.
+    """
+
+    components = 2
+
+    def __init__(
+        self,
+        partition_table_p: Dict[int, Dict[str, int]],
+        partition_table_l: Dict[int, Dict[str, int]],
+        unpadded_partition=False,
+        string_partition=False,
+        six_bit_variable_partition=False,
+        max_length: Optional[int] = None,
+    ) -> None:
+        self.partition_table_p = partition_table_p
+        self.partition_table_l = partition_table_l
+        self.unpadded_partition = unpadded_partition
+        self.string_partition = string_partition
+        self.six_bit_variable_partition = six_bit_variable_partition
+        self.max_length = max_length
+        self.validated = not (string_partition or six_bit_variable_partition)
+
+    def read(self, reader: BitReader) -> Tuple[str, ...]:
+        return read_partition_table(
+            reader,
+            self.partition_table_p,
+            unpadded_partition=self.unpadded_partition,
+            string_partition=self.string_partition,
+            six_bit_variable_partition=self.six_bit_variable_partition,
+        )
+
+    def write(self, writer: BitWriter, components: Sequence[str]) -> None:
+        write_partition_table(
+            writer,
+            components,
+            self.partition_table_l,
+            string_partition=self.string_partition,
+            six_bit_variable_partition=self.six_bit_variable_partition,
+        )
+
+    def verify(self, components: Sequence[str]) -> None:
+        company_prefix, reference = components
+
+        if self.string_partition:
+            _verify_component(reference, is_gs3a3)
+            verify_gs3a3_component(reference)
+        elif self.six_bit_variable_partition:
+            _verify_component(reference, is_cpref)
+
+        length = len(company_prefix) + len(reference)
+        if self.max_length is not None and length > self.max_length:
+            raise ConvertException(
+                message=f"Invalid number of characters: {length} (max: {self.max_length})"
+            )
+
+
+class Layout:
+    """Binary layout of a single binary coding scheme
+
+    The layout is described once as a header, a filter value and a sequence of fields,
+    each field encoding one or more components of the EPC pure identity URI.
+
+    Attributes:
+        coding_scheme (Enum): Binary coding scheme described by this layout
+        header (int): Binary header value
+        size (Optional[int]): Number of bits, None for variable length schemes
+        filter_bits (int): Number of bits of the filter value, 0 if absent
+        fields (Tuple[Field, ...]): Fields following the filter value
+        epc_uri_prefix (str): Prefix of the EPC pure identity URI of this layout
+        validated (bool): Whether decoded components are always valid URI components,
+            allowing them to be used without verification
+    """
+
+    def __init__(
+        self,
+        coding_scheme: Enum,
+        header: Enum,
+        fields: Sequence[Field],
+        filter_bits: int = 3,
+    ) -> None:
+        self.coding_scheme = coding_scheme
+        self.header = int(header.value, 2)
+        self.filter_bits = filter_bits
+        self.fields = tuple(fields)
+        self.validated = all(field.validated for field in self.fields)
+
+        scheme, size = coding_scheme.value.split("-")
+        self.size = int(size) if size.isnumeric() else None
+        self.epc_uri_prefix = f"urn:epc:id:{scheme}:"
+
+        self._decoders = tuple(field.read for field in self.fields)
+
+        encoders = []
+        start = 0
+        for field in self.fields:
+            encoders.append((field.write, start, start + field.components))
+            start += field.components
+        self._encoders = tuple(encoders)
+        self._verifiers = tuple(
+            (field.verify, start, stop)
+            for field, (_, start, stop) in zip(self.fields, encoders)
+            if not field.validated
+        )
+
+    def integer_shift(self, index: int) -> Tuple[int, bool]:
+        """Position of a URI component that is encoded as an unsigned integer, allowing the component
+        to be changed by arithmetic on the encoded value.
+
+        Args:
+            index (int): Index of the URI component
+
+        Raises:
+            ConvertException: Component is not encoded as an unsigned integer at a fixed position
+
+        Returns:
+            Tuple[int, bool]: Number of bits following the component and whether the component is zero padded
+        """
+        shift = 0
+        stop = sum(field.components for field in self.fields)
+
+        for field in reversed(self.fields):
+            start = stop - field.components
+
+            if start <= index < stop:
+                if index == stop - 1 and self.size:
+                    if isinstance(field, Integer):
+                        return shift, False
+                    if isinstance(field, Partition) and field.validated:
+                        return shift, not field.unpadded_partition
+                break
+
+            if not hasattr(field, "num_bits"):
+                break
+
+            shift += field.num_bits
+            stop = start
+
+        raise ConvertException(
+            message=f"Component {index} of {self.coding_scheme.value} is not encoded as an integer"
+        )
+
+    def encode(
+        self, components: Sequence[str], filter_value: Optional[str] = None
+    ) -> BitWriter:
+        """Encode the components of an EPC pure identity URI
+
+        Args:
+            components (Sequence[str]): URI components in order of the fields
+            filter_value (Optional[str], optional): Filter value. Defaults to None.
+
+        Returns:
+            BitWriter: encoded bits
+        """
+        writer = BitWriter()
+        writer.write(self.header, 8)
+
+        if self.filter_bits:
+            writer.write(int(filter_value), self.filter_bits)
+
+        for write, start, stop in self._encoders:
+            write(writer, components[start:stop])
+
+        return writer
+
+    def decode(self, reader: BitReader) -> Tuple[Optional[int], List[str]]:
+        """Decode the bits following the header of this layout
+
+        Args:
+            reader (BitReader): Reader positioned directly after the header
+
+        Raises:
+            ConvertException: Binary too short
+
+        Returns:
+            Tuple[Optional[int], List[str]]: Filter value and URI components
+        """
+        if self.size:
+            if self.size > reader.length:
+                raise ConvertException(
+                    message=f"Invalid binary size, expected (>=): {self.size} actual: {reader.length}"
+                )
+            reader.truncate(self.size)
+
+        filter_value = reader.read(self.filter_bits) if self.filter_bits else None
+
+        components = []
+        for read in self._decoders:
+            components.extend(read(reader))
+
+        return filter_value, components
+
+    def verify(self, components: Sequence[str]) -> None:
+        """Verify decoded components using the fields that do not always decode valid components,
+        without creating an EPC pure identity URI
+
+        Args:
+            components (Sequence[str]): URI components in order of the fields
+
+        Raises:
+            ConvertException: Components are not valid
+        """
+        for verify, start, stop in self._verifiers:
+            verify(components[start:stop])
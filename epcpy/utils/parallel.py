@@ -0,0 +1,443 @@
+"""Decoding of large batches of encoded tags using a pool of worker processes.
+
+Decoding is CPU bound, so a single process is limited to a single core. The functions
+in this module split the sources into chunks that are decoded by worker processes using
+the batch decoders of `epcpy.utils.parsers`, results are returned in order of the sources.
+
+Raw tags placed in shared memory can be decoded without sending the tags and results
+between processes, see decode_shared_memory.
+"""
+
+import collections
+import itertools
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from epcpy.epc_schemes.base_scheme import TagEncodable
+from epcpy.utils.common import BitReader, ConvertException
+from epcpy.utils.parsers import (
+    _bits_to_tag_encodable,
+    base64_to_tag_encodables,
+    binary_to_tag_encodables,
+    bytes_to_tag_encodables,
+    configure_decode_cache,
+    hex_to_tag_encodables,
+)
+
+BATCH_DECODERS: Dict[
+    str, Callable[[Iterable[Any]], List[Union[TagEncodable, ConvertException]]]
+] = {
+    "binary": binary_to_tag_encodables,
+    "hex": hex_to_tag_encodables,
+    "bytes": bytes_to_tag_encodables,
+    "base64": base64_to_tag_encodables,
+}
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+SHARED_TAG_SIZES = (12, 16)
+DEFAULT_RECORD_SIZE = 64
+
+
+def _worker_count(workers: Optional[int]) -> int:
+    """Number of worker processes to start
+
+    Args:
+        workers (Optional[int]): Requested number of workers, None for the number of CPUs
+
+    Raises:
+        ValueError: Number of workers is not positive
+
+    Returns:
+        int: Number of worker processes
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("The number of workers must be positive")
+
+    return workers
+
+
+def _initialize_worker(decode_cache_size: int) -> None:
+    """Prepare a worker process before it receives its first chunk.
+    The header table of all schemes is built on import of the parsers, so only the decode cache
+    of the worker is configured.
+
+    Args:
+        decode_cache_size (int): Maximum number of tags in the decode cache of the worker
+    """
+    configure_decode_cache(decode_cache_size)
+
+
+def _decode_chunk(
+    source_format: str,
+    convert: Optional[Callable[[TagEncodable], Any]],
+    chunk: Sequence[Any],
+) -> List[Any]:
+    """Decode a chunk of sources in a worker process
+
+    Args:
+        source_format (str): Format of the sources
+        convert (Optional[Callable[[TagEncodable], Any]]): Conversion applied to decoded tags
+        chunk (Sequence[Any]): Sources
+
+    Returns:
+        List[Any]: Decoded tag, converted tag or ConvertException for every source
+    """
+    results = BATCH_DECODERS[source_format](chunk)
+
+    if convert is None:
+        return results
+
+    converted = []
+    for result in results:
+        if not isinstance(result, ConvertException):
+            try:
+                result = convert(result)
+            except ConvertException as e:
+                result = e
+
+        converted.append(result)
+
+    return converted
+
+
+def iter_decode_parallel(
+    sources: Iterable[Any],
+    source_format: str = "hex",
+    convert: Optional[Callable[[TagEncodable], Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mp_context: Optional[BaseContext] = None,
+    decode_cache_size: int = 0,
+) -> Iterator[Any]:
+    """Decode sources using a pool of worker processes, yielding the results in order of the sources.
+    The sources are consumed lazily, at most two chunks per worker are in progress at once.
+    Invalid sources do not raise but result in the ConvertException describing the error.
+
+    Args:
+        sources (Iterable[Any]): Encoded tags
+        source_format (str, optional): Format of the sources, one of binary, hex, bytes and base64.
+            Defaults to "hex".
+        convert (Optional[Callable[[TagEncodable], Any]], optional): Conversion applied to every decoded tag
+            in the worker, e.g. operator.methodcaller("gs1_key"). Must be picklable. Defaults to None.
+        workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): Number of sources sent to a worker at once. Defaults to 10_000.
+        mp_context (Optional[BaseContext], optional): Multiprocessing context used to start the workers.
+            Defaults to None.
+        decode_cache_size (int, optional): Maximum number of tags in the decode cache of every worker,
+            0 disables the cache. Defaults to 0.
+
+    Raises:
+        ValueError: Unknown source format, invalid number of workers, chunk size or decode cache size
+
+    Yields:
+        Iterator[Any]: Decoded tag, converted tag or ConvertException for every source
+    """
+    if source_format not in BATCH_DECODERS:
+        raise ValueError(f"Unknown source format {source_format}")
+
+    workers = _worker_count(workers)
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive")
+    if decode_cache_size < 0:
+        raise ValueError(f"Invalid decode cache size {decode_cache_size}")
+
+    return _iter_decode_parallel(
+        iter(sources),
+        source_format,
+        convert,
+        workers,
+        chunk_size,
+        mp_context,
+        decode_cache_size,
+    )
+
+
+def _iter_decode_parallel(
+    sources: Iterator[Any],
+    source_format: str,
+    convert: Optional[Callable[[TagEncodable], Any]],
+    workers: int,
+    chunk_size: int,
+    mp_context: Optional[BaseContext],
+    decode_cache_size: int,
+) -> Iterator[Any]:
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+        initargs=(decode_cache_size,),
+    ) as executor:
+        pending: Deque[Future] = collections.deque()
+
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(itertools.islice(sources, chunk_size))
+                if not chunk:
+                    break
+
+                pending.append(
+                    executor.submit(_decode_chunk, source_format, convert, chunk)
+                )
+
+            if not pending:
+                break
+
+            yield from pending.popleft().result()
+
+
+def decode_parallel(
+    sources: Iterable[Any],
+    source_format: str = "hex",
+    convert: Optional[Callable[[TagEncodable], Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mp_context: Optional[BaseContext] = None,
+    decode_cache_size: int = 0,
+) -> List[Any]:
+    """Decode sources using a pool of worker processes.
+    Invalid sources do not raise but result in the ConvertException describing the error.
+
+    Args:
+        sources (Iterable[Any]): Encoded tags
+        source_format (str, optional): Format of the sources, one of binary, hex, bytes and base64.
+            Defaults to "hex".
+        convert (Optional[Callable[[TagEncodable], Any]], optional): Conversion applied to every decoded tag
+            in the worker, e.g. operator.methodcaller("gs1_key"). Must be picklable. Defaults to None.
+        workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): Number of sources sent to a worker at once. Defaults to 10_000.
+        mp_context (Optional[BaseContext], optional): Multiprocessing context used to start the workers.
+            Defaults to None.
+        decode_cache_size (int, optional): Maximum number of tags in the decode cache of every worker,
+            0 disables the cache. Defaults to 0.
+
+    Raises:
+        ValueError: Unknown source format, invalid number of workers, chunk size or decode cache size
+
+    Returns:
+        List[Any]: Decoded tag, converted tag or ConvertException for every source, in order of the sources
+    """
+    return list(
+        iter_decode_parallel(
+            sources,
+            source_format=source_format,
+            convert=convert,
+            workers=workers,
+            chunk_size=chunk_size,
+            mp_context=mp_context,
+            decode_cache_size=decode_cache_size,
+        )
+    )
+
+
+def _decode_shared_slice(
+    tags: memoryview,
+    output: memoryview,
+    tag_size: int,
+    record_size: int,
+    start: int,
+    stop: int,
+    convert: Optional[Callable[[TagEncodable], str]],
+) -> int:
+    """Decode a slice of raw tags and write the results into the output records.
+    Repeated tags within the slice are decoded once.
+
+    Args:
+        tags (memoryview): Raw tags of tag_size bytes each
+        output (memoryview): Records of record_size bytes each
+        tag_size (int): Number of bytes per tag
+        record_size (int): Number of bytes per record
+        start (int): Index of the first tag
+        stop (int): Index after the last tag
+        convert (Optional[Callable[[TagEncodable], str]]): Conversion of decoded tags into strings,
+            the EPC pure identity URI is used if None
+
+    Returns:
+        int: Number of invalid tags
+    """
+    empty = bytes(record_size)
+    records: Dict[bytes, bytes] = {}
+    errors = 0
+
+    for index in range(start, stop):
+        tag = tags[index * tag_size : (index + 1) * tag_size].tobytes()
+        record = records.get(tag)
+
+        if record is None:
+            try:
+                scheme = _bits_to_tag_encodable(BitReader.from_bytes(tag))
+                value = (
+                    scheme.epc_uri if convert is None else convert(scheme)
+                ).encode()
+
+                if len(value) > record_size:
+                    raise ConvertException(
+                        message=f"Result does not fit in a record of {record_size} bytes"
+                    )
+
+                record = value.ljust(record_size, b"\0")
+            except ConvertException:
+                record = empty
+
+            records[tag] = record
+
+        if record is empty:
+            errors += 1
+
+        output[index * record_size : (index + 1) * record_size] = record
+
+    return errors
+
+
+def _decode_shared_chunk(
+    tags_name: str,
+    output_name: str,
+    tag_size: int,
+    record_size: int,
+    start: int,
+    stop: int,
+    convert: Optional[Callable[[TagEncodable], str]],
+) -> int:
+    """Attach to the shared memory blocks in a worker process and decode a slice of the tags
+
+    Args:
+        tags_name (str): Name of the shared memory block of the tags
+        output_name (str): Name of the shared memory block of the records
+        tag_size (int): Number of bytes per tag
+        record_size (int): Number of bytes per record
+        start (int): Index of the first tag
+        stop (int): Index after the last tag
+        convert (Optional[Callable[[TagEncodable], str]]): Conversion of decoded tags into strings
+
+    Returns:
+        int: Number of invalid tags
+    """
+    tags = SharedMemory(name=tags_name)
+    output = SharedMemory(name=output_name)
+
+    try:
+        return _decode_shared_slice(
+            tags.buf, output.buf, tag_size, record_size, start, stop, convert
+        )
+    finally:
+        tags.close()
+        output.close()
+
+
+def decode_shared_memory(
+    tags: SharedMemory,
+    output: SharedMemory,
+    count: int,
+    tag_size: int = 12,
+    record_size: int = DEFAULT_RECORD_SIZE,
+    convert: Optional[Callable[[TagEncodable], str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mp_context: Optional[BaseContext] = None,
+) -> int:
+    """Decode raw tags in shared memory using a pool of worker processes.
+    Workers attach to the shared memory blocks and decode their slice of the tags in place,
+    only the names of the blocks and the bounds of every slice are sent to the workers.
+
+    The result for tag i is written to the output at offset i * record_size as a UTF-8 string,
+    padded with null bytes. The record of an invalid tag only contains null bytes.
+    Use read_shared_records to read the records.
+
+    Args:
+        tags (SharedMemory): Contiguous raw tags of tag_size bytes each, e.g. 96-bit tags padded to 16 bytes
+        output (SharedMemory): Output of at least count * record_size bytes
+        count (int): Number of tags
+        tag_size (int, optional): Number of bytes per tag, 12 or 16. Defaults to 12.
+        record_size (int, optional): Number of bytes per output record. Defaults to DEFAULT_RECORD_SIZE.
+        convert (Optional[Callable[[TagEncodable], str]], optional): Conversion of decoded tags into strings,
+            e.g. operator.methodcaller("gs1_key"). Must be picklable. Defaults to the EPC pure identity URI.
+        workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): Number of tags decoded by a worker at once. Defaults to 10_000.
+        mp_context (Optional[BaseContext], optional): Multiprocessing context used to start the workers.
+            Defaults to None.
+
+    Raises:
+        ValueError: Invalid tag size, record size, number of workers or chunk size
+        ValueError: Shared memory blocks are too small for count tags
+
+    Returns:
+        int: Number of invalid tags
+    """
+    if tag_size not in SHARED_TAG_SIZES:
+        raise ValueError(
+            f"Invalid tag size {tag_size}, expected one of {SHARED_TAG_SIZES}"
+        )
+    if record_size < 1:
+        raise ValueError("The record size must be positive")
+    if tags.size < count * tag_size:
+        raise ValueError(f"Shared memory of the tags is too small for {count} tags")
+    if output.size < count * record_size:
+        raise ValueError(
+            f"Shared memory of the output is too small for {count} records"
+        )
+
+    workers = _worker_count(workers)
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+        initargs=(0,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _decode_shared_chunk,
+                tags.name,
+                output.name,
+                tag_size,
+                record_size,
+                start,
+                min(start + chunk_size, count),
+                convert,
+            )
+            for start in range(0, count, chunk_size)
+        ]
+
+        return sum(future.result() for future in futures)
+
+
+def read_shared_records(
+    output: SharedMemory, count: int, record_size: int = DEFAULT_RECORD_SIZE
+) -> List[Optional[str]]:
+    """Read the records written by decode_shared_memory
+
+    Args:
+        output (SharedMemory): Output of decode_shared_memory
+        count (int): Number of records
+        record_size (int, optional): Number of bytes per record. Defaults to DEFAULT_RECORD_SIZE.
+
+    Returns:
+        List[Optional[str]]: Result for every tag, None for invalid tags
+    """
+    data = output.buf[: count * record_size].tobytes()
+
+    return [
+        data[offset : offset + record_size].rstrip(b"\0").decode() or None
+        for offset in range(0, count * record_size, record_size)
+    ]
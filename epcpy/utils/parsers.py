@@ -1,5 +1,19 @@
 import re
-from typing import Dict, List, Optional, Type
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from epcpy.epc_schemes import (
     ADI,
@@ -26,17 +40,31 @@ from epcpy.epc_schemes import (
 )
 from epcpy.epc_schemes.base_scheme import EPCScheme, GS1Element, GS1Keyed, TagEncodable
 from epcpy.utils.common import (
+    BitReader,
     ConvertException,
-    base64_to_hex,
+    base64_to_bytes,
     binary_to_hex,
-    hex_to_binary,
 )
-from epcpy.utils.regex import EPC_URI, GS1_ELEMENT_STRING, IDPAT_URI, TAG_URI
+from epcpy.utils.layout import Layout
+from epcpy.utils.regex import (
+    EPC_URI,
+    GS1_ELEMENT_STRING,
+    IDPAT_URI,
+    IDPAT_URI_BODIES,
+    TAG_URI,
+    LazyRegex,
+)
+from epcpy.utils.tokenizers import EPC_URI_TOKENIZERS, gs1_element_string_identifier
+
+EPC_URI_REGEX = LazyRegex(EPC_URI)
+GS1_ELEMENT_STRING_REGEX = LazyRegex(GS1_ELEMENT_STRING)
+IDPAT_URI_REGEX = LazyRegex(IDPAT_URI)
+TAG_URI_REGEX = LazyRegex(TAG_URI)
 
-EPC_URI_REGEX = re.compile(EPC_URI)
-GS1_ELEMENT_STRING_REGEX = re.compile(GS1_ELEMENT_STRING)
-IDPAT_URI_REGEX = re.compile(IDPAT_URI)
-TAG_URI_REGEX = re.compile(TAG_URI)
+IDPAT_URI_REGEXES = {
+    identifier: LazyRegex(f"urn:epc:idpat:{body}")
+    for identifier, body in IDPAT_URI_BODIES.items()
+}
 
 EPC_SCHEMES: List[Type[EPCScheme]] = [
     ADI,
@@ -77,10 +105,28 @@ TAG_ENCODABLE_HEX_HEADERS = {
     for h in cls.BinaryHeader
 }
 
-GS1_ELEMENT_STRING_REGEX_TO_SCHEME: Dict[re.Pattern, Type[GS1Element]] = {
-    cls.gs1_element_string_regex: cls
-    for cls in EPC_SCHEMES
-    if issubclass(cls, GS1Element)
+
+class HeaderEntry(NamedTuple):
+    """Scheme, binary coding scheme, number of bits and layout identified by a binary header"""
+
+    scheme: Type[TagEncodable]
+    coding_scheme: Enum
+    size: Optional[int]
+    layout: Layout
+
+
+# Entry of every binary header value, None for unknown headers
+TAG_ENCODABLE_HEADER_TABLE: Tuple[Optional[HeaderEntry], ...] = tuple(
+    {
+        layout.header: HeaderEntry(cls, layout.coding_scheme, layout.size, layout)
+        for cls in TAG_ENCODABLE_CLASSES
+        for layout in cls.binary_layouts
+    }.get(header)
+    for header in range(256)
+)
+
+GS1_ELEMENT_SCHEME_IDENTIFIERS: Dict[str, Type[GS1Element]] = {
+    cls.__name__.lower(): cls for cls in EPC_SCHEMES if issubclass(cls, GS1Element)
 }
 
 EPC_SCHEME_IDENTIFIERS = {cls.__name__.lower(): cls for cls in EPC_SCHEMES}
@@ -89,23 +135,119 @@ TAG_ENCODABLE_SCHEME_IDENTIFIERS = {
 }
 GS1_KEYED_SCHEME_IDENTIFIERS = {cls.__name__.lower(): cls for cls in GS1_KEYED_CLASSES}
 
+EPC_URI_PREFIXES = ("urn:epc:id:", "urn:epc:class:")
+EPC_TAG_URI_PREFIX = "urn:epc:tag:"
+EPC_IDPAT_URI_PREFIX = "urn:epc:idpat:"
+GS1_ELEMENT_STRING_PREFIX = "("
+
+T_Source = TypeVar("T_Source", str, bytes)
+
+# Binary coding scheme, filter value (None if absent) and EPC pure identity URI components
+TagFields = Tuple[Union[str, Optional[int]], ...]
+
+
+class DecodeCacheInfo(NamedTuple):
+    """Statistics of the decode cache"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_decode_cache: Optional[Callable[..., TagEncodable]] = None
+
+
+def configure_decode_cache(maxsize: int) -> None:
+    """Configure the least recently used cache of decoded tags, used by base64_to_tag_encodable,
+    binary_to_tag_encodable, bytes_to_tag_encodable, hex_to_tag_encodable and tag_uri_to_tag_encodable.
+    Repeated reads of the same tag return the same TagEncodable instance, which must not be modified.
+    The cache is disabled by default, configuring resets its contents and statistics.
+
+    Args:
+        maxsize (int): Maximum number of cached tags, 0 disables the cache
+
+    Raises:
+        ValueError: Negative cache size
+    """
+    global _decode_cache
+
+    if maxsize < 0:
+        raise ValueError(f"Invalid decode cache size {maxsize}")
+
+    _decode_cache = lru_cache(maxsize=maxsize)(_decode) if maxsize else None
+
+
+def decode_cache_info() -> DecodeCacheInfo:
+    """Statistics of the decode cache
+
+    Returns:
+        DecodeCacheInfo: Hits, misses, maximum size and current size of the decode cache
+    """
+    if _decode_cache is None:
+        return DecodeCacheInfo(0, 0, 0, 0)
+
+    return DecodeCacheInfo(*_decode_cache.cache_info())
+
+
+def clear_decode_cache() -> None:
+    """Remove all tags and statistics from the decode cache"""
+    if _decode_cache is not None:
+        _decode_cache.cache_clear()
+
+
+def _decode(
+    decoder: Callable[[T_Source], TagEncodable], source: T_Source
+) -> TagEncodable:
+    """Decode the source using the given decoder
+
+    Args:
+        decoder (Callable[[T_Source], TagEncodable]): Decoder of the source format
+        source (T_Source): Raw input
+
+    Returns:
+        TagEncodable: Decoded TagEncodable
+    """
+    return decoder(source)
+
+
+def _cached_decode(
+    decoder: Callable[[T_Source], TagEncodable], source: T_Source
+) -> TagEncodable:
+    """Decode the source using the given decoder, through the decode cache if enabled.
+    The decoder is part of the cache key, so equal sources of different formats do not collide.
+
+    Args:
+        decoder (Callable[[T_Source], TagEncodable]): Decoder of the source format
+        source (T_Source): Raw input
+
+    Returns:
+        TagEncodable: Decoded TagEncodable
+    """
+    if _decode_cache is None:
+        return decoder(source)
+
+    return _decode_cache(decoder, source)
+
 
 def get_gs1_key(
     source: str, company_prefix_length: Optional[int] = None, **kwargs
 ) -> str:
     """Get the GS1 key belonging to the source string.
+    The kind of source is identified by its prefix, after which only the validation of that kind
+    of source and its scheme is applied.
     This method can identify and parse:
     - EPC pure identity URIs
     - EPC tag URIs
-    - GS1 element strings (company_prefix_length should be provided)
+    - GS1 element strings (company_prefix_length should be provided, or company prefixes configured)
     - IDPAT URIs
     - Binary strings
     - Hexadecimal strings
 
     Args:
         source (str): Source string
-        company_prefix_length (int, optional): Company prefix length, required for gs1 element strings.
-            Defaults to None.
+        company_prefix_length (int, optional): Company prefix length of gs1 element strings.
+            Defaults to the length resolved using the configured company prefixes.
 
     Raises:
         ConvertException: Source could not be converted to GS1 key
@@ -115,14 +257,14 @@ def get_gs1_key(
     """
     scheme = None
 
-    if EPC_URI_REGEX.fullmatch(source):
+    if source.startswith(EPC_URI_PREFIXES):
         scheme = epc_pure_identity_to_scheme(source)
-    elif GS1_ELEMENT_STRING_REGEX.fullmatch(source) and company_prefix_length:
-        scheme = gs1_element_string_to_gs1_element(source, company_prefix_length)
-    elif TAG_URI_REGEX.fullmatch(source):
+    elif source.startswith(EPC_TAG_URI_PREFIX):
         scheme = tag_uri_to_tag_encodable(source)
-    elif IDPAT_URI_REGEX.fullmatch(source):
+    elif source.startswith(EPC_IDPAT_URI_PREFIX):
         scheme = _idpat_to_gs1_keyed_scheme(source)
+    elif source.startswith(GS1_ELEMENT_STRING_PREFIX):
+        scheme = gs1_element_string_to_gs1_element(source, company_prefix_length)
     elif source[:8] in TAG_ENCODABLE_BINARY_HEADERS.keys():
         scheme = binary_to_tag_encodable(source)
     elif source[:2].upper() in TAG_ENCODABLE_HEX_HEADERS.keys():
@@ -148,12 +290,12 @@ def epc_pure_identity_to_scheme(epc_pure_identity_uri: str) -> EPCScheme:
     Returns:
         EPCScheme: EPCScheme instance for this URI
     """
-    identifier = epc_pure_identity_uri.split(":")[3]
+    parts = epc_pure_identity_uri.split(":", 4)
 
-    if identifier not in EPC_SCHEME_IDENTIFIERS:
+    if len(parts) < 5 or parts[3] not in EPC_SCHEME_IDENTIFIERS:
         raise ConvertException(message="Unknown EPC URI")
 
-    return EPC_SCHEME_IDENTIFIERS[identifier].from_epc_uri(epc_pure_identity_uri)
+    return EPC_SCHEME_IDENTIFIERS[parts[3]].from_epc_uri(epc_pure_identity_uri)
 
 
 def epc_pure_identity_to_gs1_element(epc_pure_identity_uri: str) -> GS1Element:
@@ -241,26 +383,32 @@ def epc_pure_identity_to_tag_encodable(epc_pure_identity_uri: str) -> TagEncodab
 
 
 def gs1_element_string_to_gs1_element(
-    gs1_element_string: str, company_prefix_length: int
+    gs1_element_string: str, company_prefix_length: Optional[int] = None
 ) -> GS1Element:
-    """EPC gs1 element string to GS1Element class
+    """EPC gs1 element string to GS1Element class.
+    The scheme is identified by the application identifiers of the element string.
 
     Args:
         gs1_element_string (str): GS1 element string
+        company_prefix_length (Optional[int], optional): Company prefix length. Defaults to
+            the length resolved using the configured company prefixes.
 
     Raises:
-        ConvertException: Scheme is not GS1Element
+        ConvertException: Unknown or invalid GS1 element string, or unknown company prefix
 
     Returns:
         GS1Element: GS1Element class for this gs1 element string
     """
-    for regex, scheme in GS1_ELEMENT_STRING_REGEX_TO_SCHEME.items():
-        if regex.fullmatch(gs1_element_string):
-            return scheme.from_gs1_element_string(
-                gs1_element_string, company_prefix_length
-            )
+    identifier = gs1_element_string_identifier(gs1_element_string)
+
+    if identifier is None:
+        raise ConvertException(
+            message=f"Unknown GS1 element string: {gs1_element_string}"
+        )
 
-    raise ConvertException(message=f"Unknown GS1 element string: {gs1_element_string}")
+    return GS1_ELEMENT_SCHEME_IDENTIFIERS[identifier].from_gs1_element_string(
+        gs1_element_string, company_prefix_length
+    )
 
 
 ONE_ESCAPE_ALLOWED_SCHEMES = [
@@ -287,14 +435,20 @@ def _idpat_to_gs1_keyed_scheme(idpat: str) -> GS1Keyed:
     """
     identifier = idpat.split(":")[3]
 
+    if identifier not in IDPAT_URI_REGEXES or not IDPAT_URI_REGEXES[
+        identifier
+    ].fullmatch(idpat):
+        raise ConvertException(message=f"Invalid EPC IDPAT URI {idpat}")
+
     if identifier not in GS1_KEYED_SCHEME_IDENTIFIERS:
         raise ConvertException(message="Unknown GS1Keyed identifier")
 
     # Create URI from idpat
     uri = idpat.replace("idpat", "id", 1)
+    uri_tokenizer = EPC_URI_TOKENIZERS[identifier]
 
     # URI already matches existing scheme
-    if EPC_URI_REGEX.fullmatch(uri):
+    if uri_tokenizer.tokenize(uri) is not None:
         return GS1_KEYED_SCHEME_IDENTIFIERS[identifier](uri)
 
     if identifier not in ONE_ESCAPE_ALLOWED_SCHEMES:
@@ -302,7 +456,7 @@ def _idpat_to_gs1_keyed_scheme(idpat: str) -> GS1Keyed:
 
     # Create URI with dummy serial to create GS1 key
     dummy_uri = re.sub("\.\*$", ".0", uri, 1)
-    if EPC_URI_REGEX.fullmatch(dummy_uri):
+    if uri_tokenizer.tokenize(dummy_uri) is not None:
         return GS1_KEYED_SCHEME_IDENTIFIERS[identifier](dummy_uri)
 
     raise ConvertException(message="Could not create valid scheme from given id pat")
@@ -317,7 +471,13 @@ def tag_uri_to_tag_encodable(epc_tag_uri: str) -> TagEncodable:
     Returns:
         TagEncodable: TagEncodable class for this tag URI
     """
-    identifier = epc_tag_uri.split(":")[3].split("-")[0]
+    return _cached_decode(_tag_uri_to_tag_encodable, epc_tag_uri)
+
+
+def _tag_uri_to_tag_encodable(epc_tag_uri: str) -> TagEncodable:
+    """Uncached implementation of tag_uri_to_tag_encodable"""
+    parts = epc_tag_uri.split(":", 4)
+    identifier = parts[3].split("-")[0] if len(parts) == 5 else None
 
     if identifier not in TAG_ENCODABLE_SCHEME_IDENTIFIERS:
         raise ConvertException(message="Unknown TagEncodable scheme identifier")
@@ -325,24 +485,41 @@ def tag_uri_to_tag_encodable(epc_tag_uri: str) -> TagEncodable:
     return TAG_ENCODABLE_SCHEME_IDENTIFIERS[identifier].from_tag_uri(epc_tag_uri)
 
 
-def binary_to_tag_encodable(binary_string: str) -> TagEncodable:
-    """Binary string to TagEncodable class
+def _bits_to_tag_encodable(reader: BitReader) -> TagEncodable:
+    """Decode the bits of an encoded tag into a TagEncodable class
 
     Args:
-        binary_string (str): Binary string
+        reader (BitReader): Reader positioned at the start of the header
 
     Raises:
         ConvertException: Binary header does not belong to valid TagEncodable class
 
     Returns:
-        TagEncodable: TagEncodable class for this binary string
+        TagEncodable: TagEncodable class for these bits
     """
-    header = binary_string[:8]
+    entry = TAG_ENCODABLE_HEADER_TABLE[reader.read(8)]
 
-    if header not in TAG_ENCODABLE_BINARY_HEADERS:
+    if entry is None:
         raise ConvertException(message="Unknown header")
 
-    return TAG_ENCODABLE_BINARY_HEADERS[header].from_binary(binary_string)
+    return entry.scheme._from_layout_bits(entry.layout, reader)
+
+
+def binary_to_tag_encodable(binary_string: str) -> TagEncodable:
+    """Binary string to TagEncodable class
+
+    Args:
+        binary_string (str): Binary string
+
+    Returns:
+        TagEncodable: TagEncodable class for this binary string
+    """
+    return _cached_decode(_binary_to_tag_encodable, binary_string)
+
+
+def _binary_to_tag_encodable(binary_string: str) -> TagEncodable:
+    """Uncached implementation of binary_to_tag_encodable"""
+    return _bits_to_tag_encodable(BitReader.from_binary(binary_string))
 
 
 def hex_to_tag_encodable(hex_string: str) -> TagEncodable:
@@ -354,9 +531,30 @@ def hex_to_tag_encodable(hex_string: str) -> TagEncodable:
     Returns:
         TagEncodable: TagEncodable class for this hexadecimal string
     """
-    binary = hex_to_binary(hex_string)
+    return _cached_decode(_hex_to_tag_encodable, hex_string)
+
 
-    return binary_to_tag_encodable(binary)
+def _hex_to_tag_encodable(hex_string: str) -> TagEncodable:
+    """Uncached implementation of hex_to_tag_encodable"""
+    return _bits_to_tag_encodable(BitReader.from_hex(hex_string))
+
+
+def bytes_to_tag_encodable(tag_bytes: bytes) -> TagEncodable:
+    """Raw bytes to TagEncodable class
+
+    Args:
+        tag_bytes (bytes): Raw bytes of an encoded tag
+
+    Returns:
+        TagEncodable: TagEncodable class for these bytes
+    """
+    # Mutable buffers such as bytearray are not hashable, the cache is keyed by bytes
+    return _cached_decode(_bytes_to_tag_encodable, bytes(tag_bytes))
+
+
+def _bytes_to_tag_encodable(tag_bytes: bytes) -> TagEncodable:
+    """Uncached implementation of bytes_to_tag_encodable"""
+    return _bits_to_tag_encodable(BitReader.from_bytes(tag_bytes))
 
 
 def base64_to_tag_encodable(base64_string: str) -> TagEncodable:
@@ -368,6 +566,193 @@ def base64_to_tag_encodable(base64_string: str) -> TagEncodable:
     Returns:
         TagEncodable: TagEncodable class for this base64 string
     """
-    hex_string = base64_to_hex(base64_string)
+    return _cached_decode(_base64_to_tag_encodable, base64_string)
+
+
+def _base64_to_tag_encodable(base64_string: str) -> TagEncodable:
+    """Uncached implementation of base64_to_tag_encodable"""
+    return _bytes_to_tag_encodable(base64_to_bytes(base64_string))
+
+
+def _bits_to_tag_fields(reader: BitReader) -> TagFields:
+    """Decode the bits of an encoded tag into plain fields, without creating a TagEncodable
+
+    Args:
+        reader (BitReader): Reader positioned at the start of the header
+
+    Raises:
+        ConvertException: Unknown header or invalid encoded tag
+
+    Returns:
+        TagFields: Binary coding scheme, filter value and EPC pure identity URI components
+    """
+    entry = TAG_ENCODABLE_HEADER_TABLE[reader.read(8)]
+
+    if entry is None:
+        raise ConvertException(message="Unknown header")
+
+    layout = entry.layout
+    filter_value, components = layout.decode(reader)
+
+    # Components decoded by these layouts are not always valid URI components
+    if not layout.validated:
+        layout.verify(components)
+
+    return (layout.coding_scheme.value, filter_value, *components)
+
+
+def binary_to_tag_fields(binary_string: str) -> TagFields:
+    """Binary string to the fields of the encoded tag, e.g.
+    ("sgtin-96", 3, "0614141", "812345", "6789")
+
+    Args:
+        binary_string (str): Binary string
+
+    Returns:
+        TagFields: Binary coding scheme, filter value and EPC pure identity URI components
+    """
+    return _bits_to_tag_fields(BitReader.from_binary(binary_string))
+
+
+def hex_to_tag_fields(hex_string: str) -> TagFields:
+    """Hexadecimal string to the fields of the encoded tag, e.g.
+    ("sgtin-96", 3, "0614141", "812345", "6789")
+
+    Args:
+        hex_string (str): Hexadecimal string
+
+    Returns:
+        TagFields: Binary coding scheme, filter value and EPC pure identity URI components
+    """
+    return _bits_to_tag_fields(BitReader.from_hex(hex_string))
+
+
+def bytes_to_tag_fields(tag_bytes: bytes) -> TagFields:
+    """Raw bytes to the fields of the encoded tag, e.g.
+    ("sgtin-96", 3, "0614141", "812345", "6789")
+
+    Args:
+        tag_bytes (bytes): Raw bytes of an encoded tag
+
+    Returns:
+        TagFields: Binary coding scheme, filter value and EPC pure identity URI components
+    """
+    return _bits_to_tag_fields(BitReader.from_bytes(tag_bytes))
+
+
+def base64_to_tag_fields(base64_string: str) -> TagFields:
+    """Base64 string to the fields of the encoded tag, e.g.
+    ("sgtin-96", 3, "0614141", "812345", "6789")
+
+    Args:
+        base64_string (str): Base64 string
+
+    Returns:
+        TagFields: Binary coding scheme, filter value and EPC pure identity URI components
+    """
+    return bytes_to_tag_fields(base64_to_bytes(base64_string))
+
+
+def _decode_batch(
+    decoder: Callable[[T_Source], TagEncodable],
+    sources: Iterable[Any],
+    normalize: Optional[Callable[[Any], T_Source]] = None,
+) -> List[Union[TagEncodable, ConvertException]]:
+    """Decode every source using the given decoder without raising.
+    Repeated sources within the batch are decoded once, the decode cache is used if enabled.
+
+    Args:
+        decoder (Callable[[T_Source], TagEncodable]): Decoder of the source format
+        sources (Iterable[Any]): Raw inputs
+        normalize (Optional[Callable[[Any], T_Source]], optional): Conversion of every source into
+            the hashable key passed to the decoder, e.g. bytes. Defaults to None.
+
+    Returns:
+        List[Union[TagEncodable, ConvertException]]: TagEncodable or the raised ConvertException
+            for every source, in order of the sources
+    """
+    decoded: Dict[T_Source, Union[TagEncodable, ConvertException]] = {}
+    results: List[Union[TagEncodable, ConvertException]] = []
+
+    for source in sources:
+        if normalize is not None:
+            try:
+                source = normalize(source)
+            except (TypeError, ValueError) as e:
+                results.append(ConvertException(message=f"Invalid source: {e}"))
+                continue
 
-    return hex_to_tag_encodable(hex_string)
+        result = decoded.get(source)
+
+        if result is None:
+            try:
+                result = _cached_decode(decoder, source)
+            except ConvertException as e:
+                result = e
+
+            decoded[source] = result
+
+        results.append(result)
+
+    return results
+
+
+def binary_to_tag_encodables(
+    binary_strings: Iterable[str],
+) -> List[Union[TagEncodable, ConvertException]]:
+    """Binary strings to TagEncodable classes, invalid binary strings do not raise but
+    result in the ConvertException describing the error.
+
+    Args:
+        binary_strings (Iterable[str]): Binary strings
+
+    Returns:
+        List[Union[TagEncodable, ConvertException]]: TagEncodable class or error for every binary string
+    """
+    return _decode_batch(_binary_to_tag_encodable, binary_strings)
+
+
+def hex_to_tag_encodables(
+    hex_strings: Iterable[str],
+) -> List[Union[TagEncodable, ConvertException]]:
+    """Hexadecimal strings to TagEncodable classes, invalid hexadecimal strings do not raise but
+    result in the ConvertException describing the error.
+
+    Args:
+        hex_strings (Iterable[str]): Hexadecimal strings
+
+    Returns:
+        List[Union[TagEncodable, ConvertException]]: TagEncodable class or error for every hexadecimal string
+    """
+    return _decode_batch(_hex_to_tag_encodable, hex_strings)
+
+
+def bytes_to_tag_encodables(
+    tags_bytes: Iterable[bytes],
+) -> List[Union[TagEncodable, ConvertException]]:
+    """Raw bytes to TagEncodable classes, invalid bytes do not raise but
+    result in the ConvertException describing the error.
+
+    Args:
+        tags_bytes (Iterable[bytes]): Raw bytes of encoded tags
+
+    Returns:
+        List[Union[TagEncodable, ConvertException]]: TagEncodable class or error for every encoded tag
+    """
+    # Keyed by bytes like bytes_to_tag_encodable, so mutable buffers share the cached tags
+    return _decode_batch(_bytes_to_tag_encodable, tags_bytes, normalize=bytes)
+
+
+def base64_to_tag_encodables(
+    base64_strings: Iterable[str],
+) -> List[Union[TagEncodable, ConvertException]]:
+    """Base64 strings to TagEncodable classes, invalid base64 strings do not raise but
+    result in the ConvertException describing the error.
+
+    Args:
+        base64_strings (Iterable[str]): Base64 strings
+
+    Returns:
+        List[Union[TagEncodable, ConvertException]]: TagEncodable class or error for every base64 string
+    """
+    return _decode_batch(_base64_to_tag_encodable, base64_strings)
@@ -1,3 +1,48 @@
+import re
+from typing import List, Optional
+
+
+class LazyRegex:
+    """Regex compiled on first use instead of on import.
+    After compilation the match and split methods of the compiled pattern are bound to the instance,
+    so later calls have no overhead compared to a compiled pattern.
+
+    Args:
+        pattern (str): Regular expression
+    """
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+
+    def compile(self) -> re.Pattern:
+        """Compile the regex and bind the match methods of the compiled pattern
+
+        Returns:
+            re.Pattern: Compiled regex
+        """
+        compiled = re.compile(self.pattern)
+        self.fullmatch = compiled.fullmatch
+        self.match = compiled.match
+        self.search = compiled.search
+        self.split = compiled.split
+        return compiled
+
+    def fullmatch(self, string: str) -> Optional[re.Match]:
+        return self.compile().fullmatch(string)
+
+    def match(self, string: str) -> Optional[re.Match]:
+        return self.compile().match(string)
+
+    def search(self, string: str) -> Optional[re.Match]:
+        return self.compile().search(string)
+
+    def split(self, string: str) -> List[str]:
+        return self.compile().split(string)
+
+    def __repr__(self) -> str:
+        return f"LazyRegex({self.pattern!r})"
+
+
 # Generic
 CPREF_COMPONENT = "([0-9A-Z-]|%2F|%23)+"
 NUMERIC_COMPONENT = "(0|[1-9]\d*)"
@@ -79,11 +124,32 @@ IMOVN_URI = f"urn:epc:id:imovn:{IMOVN_URI_BODY}"
 
 LGTIN_CLASS = f"urn:epc:class:lgtin:{PADDED_NUMERIC_COMPONENT}\.{PADDED_NUMERIC_COMPONENT}\.{GS3A3_COMPONENT}"
 
-EPC_URI = (
-    f"({SGTIN_URI}|{SSCC_URI}|{SGLN_URI}|{GRAI_URI}|{GIAI_URI}|{GSRN_URI}|{GSRNP_URI}|{GDTI_URI}"
-    f"|{CPI_URI}|{SGCN_URI}|{GINC_URI}|{GSIN_URI}|{ITIP_URI}|{UPUI_URI}|{PGLN_URI}|{GID_URI}"
-    f"|{USDOD_URI}|{ADI_URI}|{BIC_URI}|{IMOVN_URI}|{LGTIN_CLASS})"
-)
+# EPC pure identity URIs by scheme identifier
+EPC_URIS = {
+    "sgtin": SGTIN_URI,
+    "sscc": SSCC_URI,
+    "sgln": SGLN_URI,
+    "grai": GRAI_URI,
+    "giai": GIAI_URI,
+    "gsrn": GSRN_URI,
+    "gsrnp": GSRNP_URI,
+    "gdti": GDTI_URI,
+    "cpi": CPI_URI,
+    "sgcn": SGCN_URI,
+    "ginc": GINC_URI,
+    "gsin": GSIN_URI,
+    "itip": ITIP_URI,
+    "upui": UPUI_URI,
+    "pgln": PGLN_URI,
+    "gid": GID_URI,
+    "usdod": USDOD_URI,
+    "adi": ADI_URI,
+    "bic": BIC_URI,
+    "imovn": IMOVN_URI,
+    "lgtin": LGTIN_CLASS,
+}
+
+EPC_URI = f"({'|'.join(EPC_URIS.values())})"
 
 # EPC IDPAT URIs
 SGTIN_IDPAT_URI_BODY = f"sgtin:({PADDED_NUMERIC_COMPONENT}\.{PADDED_NUMERIC_COMPONENT}\.{GS3A3_COMPONENT}|{PADDED_NUMERIC_COMPONENT}\.{PADDED_NUMERIC_COMPONENT}\.\*|{PADDED_NUMERIC_COMPONENT}\.\*\.\*|\*\.\*\.\*)"
@@ -106,13 +172,29 @@ GID_IDPAT_URI_BODY = f"gid:({NUMERIC_COMPONENT}\.{NUMERIC_COMPONENT}\.{NUMERIC_C
 USDOD_IDPAT_URI_BODY = f"usdod:({CAGE_CODE_OR_DODAAC}\.{NUMERIC_COMPONENT}|{CAGE_CODE_OR_DODAAC}\.\*|\*\.\*)"
 ADI_IDPAT_URI_BODY = f"adi:({CAGE_CODE_OR_DODAAC}\.{ADI_CHAR}*\.(%23)?{ADI_CHAR}+|{CAGE_CODE_OR_DODAAC}\.{ADI_CHAR}*\.\*|{CAGE_CODE_OR_DODAAC}\.\*\.\*|\*\.\*\.\*)"
 
-IDPAT_BODY = (
-    f"({SGTIN_IDPAT_URI_BODY}|{SSCC_IDPAT_URI_BODY}|{SGLN_IDPAT_URI_BODY}|{GRAI_IDPAT_URI_BODY}"
-    f"|{GIAI_IDPAT_URI_BODY}|{GSRN_IDPAT_URI_BODY}|{GSRNP_IDPAT_URI_BODY}|{GDTI_IDPAT_URI_BODY}"
-    f"|{CPI_IDPAT_URI_BODY}|{SGCN_IDPAT_URI_BODY}|{GINC_IDPAT_URI_BODY}|{GSIN_IDPAT_URI_BODY}"
-    f"|{ITIP_IDPAT_URI_BODY}|{UPUI_IDPAT_URI_BODY}|{PGLN_IDPAT_URI_BODY}|{GID_IDPAT_URI_BODY}"
-    f"|{USDOD_IDPAT_URI_BODY}|{ADI_IDPAT_URI_BODY})"
-)
+# EPC IDPAT URI bodies by scheme identifier
+IDPAT_URI_BODIES = {
+    "sgtin": SGTIN_IDPAT_URI_BODY,
+    "sscc": SSCC_IDPAT_URI_BODY,
+    "sgln": SGLN_IDPAT_URI_BODY,
+    "grai": GRAI_IDPAT_URI_BODY,
+    "giai": GIAI_IDPAT_URI_BODY,
+    "gsrn": GSRN_IDPAT_URI_BODY,
+    "gsrnp": GSRNP_IDPAT_URI_BODY,
+    "gdti": GDTI_IDPAT_URI_BODY,
+    "cpi": CPI_IDPAT_URI_BODY,
+    "sgcn": SGCN_IDPAT_URI_BODY,
+    "ginc": GINC_IDPAT_URI_BODY,
+    "gsin": GSIN_IDPAT_URI_BODY,
+    "itip": ITIP_IDPAT_URI_BODY,
+    "upui": UPUI_IDPAT_URI_BODY,
+    "pgln": PGLN_IDPAT_URI_BODY,
+    "gid": GID_IDPAT_URI_BODY,
+    "usdod": USDOD_IDPAT_URI_BODY,
+    "adi": ADI_IDPAT_URI_BODY,
+}
+
+IDPAT_BODY = f"({'|'.join(IDPAT_URI_BODIES.values())})"
 IDPAT_URI = f"urn:epc:idpat:{IDPAT_BODY}"
 
 # EPC Tag URIs
@@ -131,33 +213,46 @@ GID_TAG_URI_BODY = f"gid-96:{GID_URI_BODY}"
 USDOD_TAG_URI_BODY = f"usdod-96:{NUMERIC_COMPONENT}\.{USDOD_URI_BODY}"
 ADI_TAG_URI_BODY = f"adi-var:{NUMERIC_COMPONENT}\.{ADI_URI_BODY}"
 
-TAG_URI_BODY = (
-    f"({SGTIN_TAG_URI_BODY}|{SSCC_TAG_URI_BODY}|{SGLN_TAG_URI_BODY}|{GRAI_TAG_URI_BODY}"
-    f"|{GIAI_TAG_URI_BODY}|{GSRN_TAG_URI_BODY}|{GSRNP_TAG_URI_BODY}|{GDTI_TAG_URI_BODY}"
-    f"|{CPI_TAG_URI_BODY}|{SGCN_TAG_URI_BODY}|{ITIP_TAG_URI_BODY}|{GID_TAG_URI_BODY}"
-    f"|{USDOD_TAG_URI_BODY}|{ADI_TAG_URI_BODY})"
-)
+# EPC tag URI bodies by scheme identifier
+TAG_URI_BODIES = {
+    "sgtin": SGTIN_TAG_URI_BODY,
+    "sscc": SSCC_TAG_URI_BODY,
+    "sgln": SGLN_TAG_URI_BODY,
+    "grai": GRAI_TAG_URI_BODY,
+    "giai": GIAI_TAG_URI_BODY,
+    "gsrn": GSRN_TAG_URI_BODY,
+    "gsrnp": GSRNP_TAG_URI_BODY,
+    "gdti": GDTI_TAG_URI_BODY,
+    "cpi": CPI_TAG_URI_BODY,
+    "sgcn": SGCN_TAG_URI_BODY,
+    "itip": ITIP_TAG_URI_BODY,
+    "gid": GID_TAG_URI_BODY,
+    "usdod": USDOD_TAG_URI_BODY,
+    "adi": ADI_TAG_URI_BODY,
+}
+
+TAG_URI_BODY = f"({'|'.join(TAG_URI_BODIES.values())})"
 TAG_URI = f"urn:epc:tag:{TAG_URI_BODY}"
 
-# GS1 element strings
-SGTIN_GS1_ELEMENT_STRING = f"\(01\){DIGIT}{{14}}\(21\){GS1_ELEM_CHARS}{{1,20}}"
-SSCC_GS1_ELEMENT_STRING = f"\(00\){DIGIT}{{18}}"
-SGLN_GS1_ELEMENT_STRING = f"\(414\){DIGIT}{{13}}\(254\){GS1_ELEM_CHARS}{{1,20}}"
-GRAI_GS1_ELEMENT_STRING = f"\(8003\)0{DIGIT}{{13}}{GS1_ELEM_CHARS}{{1,16}}"
-GIAI_GS1_ELEMENT_STRING = f"\(8004\){DIGIT}{{6,12}}{GS1_ELEM_CHARS}{{1,24}}"
-GSRN_GS1_ELEMENT_STRING = f"\(8018\){DIGIT}{{18}}"
-GSRNP_GS1_ELEMENT_STRING = f"\(8017\){DIGIT}{{18}}"
-GDTI_GS1_ELEMENT_STRING = f"\(253\){DIGIT}{{13}}{GS1_ELEM_CHARS}{{1,17}}"
+# GS1 element strings, the value of every application identifier is captured by a group
+SGTIN_GS1_ELEMENT_STRING = f"\(01\)({DIGIT}{{14}})\(21\)({GS1_ELEM_CHARS}{{1,20}})"
+SSCC_GS1_ELEMENT_STRING = f"\(00\)({DIGIT}{{18}})"
+SGLN_GS1_ELEMENT_STRING = f"\(414\)({DIGIT}{{13}})\(254\)({GS1_ELEM_CHARS}{{1,20}})"
+GRAI_GS1_ELEMENT_STRING = f"\(8003\)(0{DIGIT}{{13}}{GS1_ELEM_CHARS}{{1,16}})"
+GIAI_GS1_ELEMENT_STRING = f"\(8004\)({DIGIT}{{6,12}}{GS1_ELEM_CHARS}{{1,24}})"
+GSRN_GS1_ELEMENT_STRING = f"\(8018\)({DIGIT}{{18}})"
+GSRNP_GS1_ELEMENT_STRING = f"\(8017\)({DIGIT}{{18}})"
+GDTI_GS1_ELEMENT_STRING = f"\(253\)({DIGIT}{{13}}{GS1_ELEM_CHARS}{{1,17}})"
 CPI_GS1_ELEMENT_STRING = (
-    f"\(8010\){DIGIT}{{6,12}}{GS1_ELEM_CHARS_CPI}{{,24}}\(8011\){DIGIT}{{1,12}}"
+    f"\(8010\)({DIGIT}{{6,12}}{GS1_ELEM_CHARS_CPI}{{,24}})\(8011\)({DIGIT}{{1,12}})"
 )
-SGCN_GS1_ELEMENT_STRING = f"\(255\){DIGIT}{{13}}{GS1_ELEM_CHARS}{{1,12}}"
-GINC_GS1_ELEMENT_STRING = f"\(401\){DIGIT}{{6,12}}{GS1_ELEM_CHARS}{{1,24}}"
-GSIN_GS1_ELEMENT_STRING = f"\(402\){DIGIT}{{17}}"
-ITIP_GS1_ELEMENT_STRING = f"\(8006\){DIGIT}{{18}}\(21\){GS1_ELEM_CHARS}{{1,20}}"
-UPUI_GS1_ELEMENT_STRING = f"\(01\){DIGIT}{{14}}\(235\){GS1_ELEM_CHARS}{{1,28}}"
-PGLN_GS1_ELEMENT_STRING = f"\(417\){DIGIT}{{13}}"
-LGTIN_GS1_ELEMENT_STRING = f"\(01\){DIGIT}{{14}}\(10\){GS1_ELEM_CHARS}{{1,20}}"
+SGCN_GS1_ELEMENT_STRING = f"\(255\)({DIGIT}{{13}}{GS1_ELEM_CHARS}{{1,12}})"
+GINC_GS1_ELEMENT_STRING = f"\(401\)({DIGIT}{{6,12}}{GS1_ELEM_CHARS}{{1,24}})"
+GSIN_GS1_ELEMENT_STRING = f"\(402\)({DIGIT}{{17}})"
+ITIP_GS1_ELEMENT_STRING = f"\(8006\)({DIGIT}{{18}})\(21\)({GS1_ELEM_CHARS}{{1,20}})"
+UPUI_GS1_ELEMENT_STRING = f"\(01\)({DIGIT}{{14}})\(235\)({GS1_ELEM_CHARS}{{1,28}})"
+PGLN_GS1_ELEMENT_STRING = f"\(417\)({DIGIT}{{13}})"
+LGTIN_GS1_ELEMENT_STRING = f"\(01\)({DIGIT}{{14}})\(10\)({GS1_ELEM_CHARS}{{1,20}})"
 
 GS1_ELEMENT_STRING = (
     f"({SGTIN_GS1_ELEMENT_STRING}|{SSCC_GS1_ELEMENT_STRING}|{SGLN_GS1_ELEMENT_STRING}"
@@ -0,0 +1,151 @@
+"""Decoding of asynchronous streams of encoded tags without blocking the event loop.
+
+Tags are grouped into micro-batches, which are decoded in an executor. A batch is complete
+when it contains batch_size tags or when max_delay seconds have passed since its first tag.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional
+
+from epcpy.epc_schemes.base_scheme import TagEncodable
+from epcpy.utils.parallel import BATCH_DECODERS, _decode_chunk
+
+DEFAULT_BATCH_SIZE = 1_000
+DEFAULT_MAX_DELAY = 0.01
+DEFAULT_MAX_PENDING = 4
+
+
+async def _produce_batches(
+    sources: AsyncIterable[Any],
+    batches: "asyncio.Queue[Optional[asyncio.Future]]",
+    decode: Callable[[list], list],
+    batch_size: int,
+    max_delay: float,
+    executor: Optional[Executor],
+) -> None:
+    """Read the sources into micro-batches and submit them to the executor.
+    The futures of the batches are put in the queue in order, None marks the end of the sources.
+    An exception raised by the sources is put in the queue as a failed future.
+
+    Args:
+        sources (AsyncIterable[Any]): Encoded tags
+        batches (asyncio.Queue[Optional[asyncio.Future]]): Bounded queue of decoded batches
+        decode (Callable[[list], list]): Decoder of a batch
+        batch_size (int): Maximum number of tags per batch
+        max_delay (float): Maximum number of seconds between the first tag of a batch and its submission
+        executor (Optional[Executor]): Executor decoding the batches, the default executor if None
+    """
+    loop = asyncio.get_running_loop()
+    iterator = sources.__aiter__()
+    next_source: Optional[asyncio.Future] = None
+    exhausted = False
+
+    try:
+        while not exhausted:
+            batch = []
+            deadline = None
+
+            while len(batch) < batch_size:
+                if next_source is None:
+                    next_source = asyncio.ensure_future(iterator.__anext__())
+
+                timeout = None if deadline is None else deadline - loop.time()
+                if timeout is not None and timeout <= 0:
+                    break
+
+                done, _ = await asyncio.wait({next_source}, timeout=timeout)
+                if not done:
+                    break
+
+                try:
+                    batch.append(next_source.result())
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                finally:
+                    next_source = None
+
+                if deadline is None:
+                    deadline = loop.time() + max_delay
+
+            if batch:
+                await batches.put(loop.run_in_executor(executor, decode, batch))
+    except Exception as e:
+        failed = loop.create_future()
+        failed.set_exception(e)
+        await batches.put(failed)
+    finally:
+        if next_source is not None:
+            next_source.cancel()
+
+    await batches.put(None)
+
+
+async def decode_stream(
+    sources: AsyncIterable[Any],
+    source_format: str = "hex",
+    convert: Optional[Callable[[TagEncodable], Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    executor: Optional[Executor] = None,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> AsyncIterator[Any]:
+    """Decode an asynchronous stream of encoded tags in micro-batches, yielding the results in order of the sources.
+    Batches are decoded in the executor, so the event loop is not blocked during bursts of tags.
+    Reading from the sources is paused while max_pending batches are waiting to be consumed,
+    bounding the memory used when the consumer can not keep up with the sources.
+    Invalid sources do not raise but result in the ConvertException describing the error.
+
+    Args:
+        sources (AsyncIterable[Any]): Encoded tags
+        source_format (str, optional): Format of the sources, one of binary, hex, bytes and base64.
+            Defaults to "hex".
+        convert (Optional[Callable[[TagEncodable], Any]], optional): Conversion applied to every decoded tag
+            in the executor, must be picklable for process pool executors. Defaults to None.
+        batch_size (int, optional): Maximum number of tags per batch. Defaults to DEFAULT_BATCH_SIZE.
+        max_delay (float, optional): Maximum number of seconds between reading the first tag of a batch
+            and decoding the batch. Defaults to DEFAULT_MAX_DELAY.
+        executor (Optional[Executor], optional): Executor decoding the batches. Defaults to the default
+            executor of the event loop.
+        max_pending (int, optional): Maximum number of batches waiting to be consumed.
+            Defaults to DEFAULT_MAX_PENDING.
+
+    Raises:
+        ValueError: Unknown source format, invalid batch size, delay or number of pending batches
+
+    Yields:
+        AsyncIterator[Any]: Decoded tag, converted tag or ConvertException for every source
+    """
+    if source_format not in BATCH_DECODERS:
+        raise ValueError(f"Unknown source format {source_format}")
+    if batch_size < 1:
+        raise ValueError("The batch size must be positive")
+    if max_delay < 0:
+        raise ValueError("The maximum delay can not be negative")
+    if max_pending < 1:
+        raise ValueError("The maximum number of pending batches must be positive")
+
+    batches: "asyncio.Queue[Optional[asyncio.Future]]" = asyncio.Queue(max_pending)
+    producer = asyncio.ensure_future(
+        _produce_batches(
+            sources,
+            batches,
+            functools.partial(_decode_chunk, source_format, convert),
+            batch_size,
+            max_delay,
+            executor,
+        )
+    )
+
+    try:
+        while True:
+            batch = await batches.get()
+            if batch is None:
+                break
+
+            for result in await batch:
+                yield result
+    finally:
+        producer.cancel()
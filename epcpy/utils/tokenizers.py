@@ -0,0 +1,401 @@
+"""Tokenizers of EPC pure identity URIs and GS1 element strings.
+
+A tokenizer validates a URI or element string and extracts its components in a single scan,
+accepting exactly the strings matched by the corresponding pattern in epcpy.utils.regex.
+
+URI components are checked using str and frozenset primitives instead of regexes, so the time
+taken is linear in the length of the URI. GS1 element strings are dispatched on their
+application identifiers to the regex of a single scheme, whose groups capture the element values.
+"""
+
+import string
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from epcpy.utils.regex import (
+    CPI_GS1_ELEMENT_STRING,
+    GDTI_GS1_ELEMENT_STRING,
+    GIAI_GS1_ELEMENT_STRING,
+    GINC_GS1_ELEMENT_STRING,
+    GRAI_GS1_ELEMENT_STRING,
+    GSIN_GS1_ELEMENT_STRING,
+    GSRN_GS1_ELEMENT_STRING,
+    GSRNP_GS1_ELEMENT_STRING,
+    ITIP_GS1_ELEMENT_STRING,
+    LGTIN_GS1_ELEMENT_STRING,
+    PGLN_GS1_ELEMENT_STRING,
+    SGCN_GS1_ELEMENT_STRING,
+    SGLN_GS1_ELEMENT_STRING,
+    SGTIN_GS1_ELEMENT_STRING,
+    SSCC_GS1_ELEMENT_STRING,
+    UPUI_GS1_ELEMENT_STRING,
+    LazyRegex,
+)
+
+ASCII_DIGITS = frozenset(string.digits)
+NON_ZERO_DIGITS = frozenset("123456789")
+HEX_DIGITS = frozenset(string.hexdigits)
+GS3A3_CHARS = frozenset(f"{string.ascii_letters}{string.digits}!'()*+,-.:;=_")
+CPREF_CHARS = frozenset(f"{string.ascii_uppercase}{string.digits}-")
+CPREF_ESCAPES = frozenset(["2F", "23"])
+ADI_CHARS = CPREF_CHARS
+ADI_ESCAPES = frozenset(["2F"])
+CAGE_CODE_OR_DODAAC_CHARS = frozenset("0123456789ABCDEFGHJKLMNPQRSTUVWXYZ")
+BIC_OWNER_CODE_CHARS = frozenset("ABCDEFGHJKLMNPQRSTUVWXYZ")
+BIC_EQUIPMENT_CATEGORY_CHARS = frozenset("JUZ")
+
+
+def _is_escaped(
+    component: str, chars: FrozenSet[str], escapes: FrozenSet[str], escape_length: int
+) -> bool:
+    """Whether a component only consists of chars and %-escapes, possibly empty
+
+    Args:
+        component (str): URI component
+        chars (FrozenSet[str]): Allowed characters
+        escapes (FrozenSet[str]): Allowed escapes, without the leading %
+        escape_length (int): Length of the escapes
+
+    Returns:
+        bool: Component consists of chars and escapes
+    """
+    if "%" not in component:
+        return chars.issuperset(component)
+
+    unescaped, *escaped = component.split("%")
+
+    return chars.issuperset(unescaped) and all(
+        part[:escape_length] in escapes and chars.issuperset(part[escape_length:])
+        for part in escaped
+    )
+
+
+def is_padded_numeric(component: str) -> bool:
+    """PADDED_NUMERIC_COMPONENT: one or more decimal digits"""
+    return component.isdecimal()
+
+
+def is_padded_numeric_or_empty(component: str) -> bool:
+    """PADDED_NUMERIC_COMPONENT_OR_EMPTY: zero or more decimal digits"""
+    return not component or component.isdecimal()
+
+
+def is_numeric(component: str) -> bool:
+    """NUMERIC_COMPONENT: zero or decimal digits without leading zeros"""
+    return component == "0" or (
+        component[:1] in NON_ZERO_DIGITS and component.isdecimal()
+    )
+
+
+def is_gs3a3(component: str) -> bool:
+    """GS3A3_COMPONENT: one or more GS3A3 characters or % followed by a hexadecimal digit"""
+    return component != "" and _is_escaped(component, GS3A3_CHARS, HEX_DIGITS, 1)
+
+
+def is_cpref(component: str) -> bool:
+    """CPREF_COMPONENT: one or more uppercase letters, digits, dashes, %2F or %23"""
+    return component != "" and _is_escaped(component, CPREF_CHARS, CPREF_ESCAPES, 2)
+
+
+def is_cage_code_or_dodaac(component: str) -> bool:
+    """CAGE_CODE_OR_DODAAC: five or six uppercase letters except I and O, or digits"""
+    return 5 <= len(component) <= 6 and CAGE_CODE_OR_DODAAC_CHARS.issuperset(component)
+
+
+def is_adi_part_number(component: str) -> bool:
+    """ADI part number: zero or more uppercase letters, digits, dashes or %2F"""
+    return _is_escaped(component, ADI_CHARS, ADI_ESCAPES, 2)
+
+
+def is_adi_serial(component: str) -> bool:
+    """ADI serial: optional %23 followed by one or more uppercase letters, digits, dashes or %2F"""
+    if component.startswith("%23"):
+        component = component[3:]
+
+    return component != "" and _is_escaped(component, ADI_CHARS, ADI_ESCAPES, 2)
+
+
+def is_bic(component: str) -> bool:
+    """BIC container code: owner code, equipment category identifier and seven digits"""
+    return (
+        len(component) == 11
+        and BIC_OWNER_CODE_CHARS.issuperset(component[:3])
+        and component[3] in BIC_EQUIPMENT_CATEGORY_CHARS
+        and ASCII_DIGITS.issuperset(component[4:])
+    )
+
+
+def is_imovn(component: str) -> bool:
+    """IMO vessel number: seven digits"""
+    return len(component) == 7 and ASCII_DIGITS.issuperset(component)
+
+
+class URITokenizer:
+    """Tokenizer of URIs consisting of a prefix and dot separated components.
+    Only the last component can contain dots.
+
+    Args:
+        prefix (str): URI prefix, e.g. urn:epc:id:sgtin:
+        components (Tuple[Callable[[str], bool], ...]): Validator of every component
+    """
+
+    __slots__ = ("prefix", "components", "_prefix_length", "_max_split")
+
+    def __init__(
+        self, prefix: str, components: Tuple[Callable[[str], bool], ...]
+    ) -> None:
+        self.prefix = prefix
+        self.components = components
+        self._prefix_length = len(prefix)
+        self._max_split = len(components) - 1
+
+    def tokenize(self, uri: str) -> Optional[List[str]]:
+        """Validate a URI and split it into its components
+
+        Args:
+            uri (str): URI
+
+        Returns:
+            Optional[List[str]]: Components of the URI, None if the URI is invalid
+        """
+        if not uri.startswith(self.prefix):
+            return None
+
+        components = uri[self._prefix_length :].split(".", self._max_split)
+        if len(components) != len(self.components):
+            return None
+
+        for component, is_valid in zip(components, self.components):
+            if not is_valid(component):
+                return None
+
+        return components
+
+
+SGTIN_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:sgtin:", (is_padded_numeric, is_padded_numeric, is_gs3a3)
+)
+SSCC_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:sscc:", (is_padded_numeric, is_padded_numeric)
+)
+SGLN_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:sgln:", (is_padded_numeric, is_padded_numeric_or_empty, is_gs3a3)
+)
+GRAI_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:grai:", (is_padded_numeric, is_padded_numeric_or_empty, is_gs3a3)
+)
+GIAI_URI_TOKENIZER = URITokenizer("urn:epc:id:giai:", (is_padded_numeric, is_gs3a3))
+GSRN_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:gsrn:", (is_padded_numeric, is_padded_numeric)
+)
+GSRNP_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:gsrnp:", (is_padded_numeric, is_padded_numeric)
+)
+GDTI_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:gdti:", (is_padded_numeric, is_padded_numeric_or_empty, is_gs3a3)
+)
+CPI_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:cpi:", (is_padded_numeric, is_cpref, is_numeric)
+)
+SGCN_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:sgcn:",
+    (is_padded_numeric, is_padded_numeric_or_empty, is_padded_numeric),
+)
+GINC_URI_TOKENIZER = URITokenizer("urn:epc:id:ginc:", (is_padded_numeric, is_gs3a3))
+GSIN_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:gsin:", (is_padded_numeric, is_padded_numeric)
+)
+ITIP_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:itip:",
+    (
+        is_padded_numeric,
+        is_padded_numeric,
+        is_padded_numeric,
+        is_padded_numeric,
+        is_gs3a3,
+    ),
+)
+UPUI_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:upui:", (is_padded_numeric, is_padded_numeric_or_empty, is_gs3a3)
+)
+PGLN_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:pgln:", (is_padded_numeric, is_padded_numeric_or_empty)
+)
+GID_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:gid:", (is_numeric, is_numeric, is_numeric)
+)
+USDOD_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:usdod:", (is_cage_code_or_dodaac, is_numeric)
+)
+ADI_URI_TOKENIZER = URITokenizer(
+    "urn:epc:id:adi:", (is_cage_code_or_dodaac, is_adi_part_number, is_adi_serial)
+)
+BIC_URI_TOKENIZER = URITokenizer("urn:epc:id:bic:", (is_bic,))
+IMOVN_URI_TOKENIZER = URITokenizer("urn:epc:id:imovn:", (is_imovn,))
+LGTIN_CLASS_TOKENIZER = URITokenizer(
+    "urn:epc:class:lgtin:", (is_padded_numeric, is_padded_numeric, is_gs3a3)
+)
+
+# EPC pure identity URI tokenizers by scheme identifier, see EPC_URIS
+EPC_URI_TOKENIZERS = {
+    "sgtin": SGTIN_URI_TOKENIZER,
+    "sscc": SSCC_URI_TOKENIZER,
+    "sgln": SGLN_URI_TOKENIZER,
+    "grai": GRAI_URI_TOKENIZER,
+    "giai": GIAI_URI_TOKENIZER,
+    "gsrn": GSRN_URI_TOKENIZER,
+    "gsrnp": GSRNP_URI_TOKENIZER,
+    "gdti": GDTI_URI_TOKENIZER,
+    "cpi": CPI_URI_TOKENIZER,
+    "sgcn": SGCN_URI_TOKENIZER,
+    "ginc": GINC_URI_TOKENIZER,
+    "gsin": GSIN_URI_TOKENIZER,
+    "itip": ITIP_URI_TOKENIZER,
+    "upui": UPUI_URI_TOKENIZER,
+    "pgln": PGLN_URI_TOKENIZER,
+    "gid": GID_URI_TOKENIZER,
+    "usdod": USDOD_URI_TOKENIZER,
+    "adi": ADI_URI_TOKENIZER,
+    "bic": BIC_URI_TOKENIZER,
+    "imovn": IMOVN_URI_TOKENIZER,
+    "lgtin": LGTIN_CLASS_TOKENIZER,
+}
+
+
+class ElementStringTokenizer:
+    """Tokenizer of GS1 element strings of a single scheme
+
+    Args:
+        ais (Tuple[str, ...]): Application identifiers of the element string, in order
+        pattern (str): Regex of the element string, capturing every element value in a group
+    """
+
+    __slots__ = ("ais", "regex")
+
+    def __init__(self, ais: Tuple[str, ...], pattern: str) -> None:
+        self.ais = ais
+        self.regex = LazyRegex(pattern)
+
+    def tokenize(self, element_string: str) -> Optional[Tuple[str, ...]]:
+        """Validate a GS1 element string and split it into its element values
+
+        Args:
+            element_string (str): GS1 element string
+
+        Returns:
+            Optional[Tuple[str, ...]]: Element values, None if the element string is invalid
+        """
+        match = self.regex.fullmatch(element_string)
+
+        return None if match is None else match.groups()
+
+
+SGTIN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("01", "21"), SGTIN_GS1_ELEMENT_STRING
+)
+SSCC_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("00",), SSCC_GS1_ELEMENT_STRING
+)
+SGLN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("414", "254"), SGLN_GS1_ELEMENT_STRING
+)
+GRAI_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("8003",), GRAI_GS1_ELEMENT_STRING
+)
+GIAI_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("8004",), GIAI_GS1_ELEMENT_STRING
+)
+GSRN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("8018",), GSRN_GS1_ELEMENT_STRING
+)
+GSRNP_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("8017",), GSRNP_GS1_ELEMENT_STRING
+)
+GDTI_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("253",), GDTI_GS1_ELEMENT_STRING
+)
+CPI_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("8010", "8011"), CPI_GS1_ELEMENT_STRING
+)
+SGCN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("255",), SGCN_GS1_ELEMENT_STRING
+)
+GINC_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("401",), GINC_GS1_ELEMENT_STRING
+)
+GSIN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("402",), GSIN_GS1_ELEMENT_STRING
+)
+ITIP_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("8006", "21"), ITIP_GS1_ELEMENT_STRING
+)
+UPUI_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("01", "235"), UPUI_GS1_ELEMENT_STRING
+)
+PGLN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("417",), PGLN_GS1_ELEMENT_STRING
+)
+LGTIN_GS1_ELEMENT_STRING_TOKENIZER = ElementStringTokenizer(
+    ("01", "10"), LGTIN_GS1_ELEMENT_STRING
+)
+
+# GS1 element string tokenizers by scheme identifier
+GS1_ELEMENT_STRING_TOKENIZERS = {
+    "sgtin": SGTIN_GS1_ELEMENT_STRING_TOKENIZER,
+    "sscc": SSCC_GS1_ELEMENT_STRING_TOKENIZER,
+    "sgln": SGLN_GS1_ELEMENT_STRING_TOKENIZER,
+    "grai": GRAI_GS1_ELEMENT_STRING_TOKENIZER,
+    "giai": GIAI_GS1_ELEMENT_STRING_TOKENIZER,
+    "gsrn": GSRN_GS1_ELEMENT_STRING_TOKENIZER,
+    "gsrnp": GSRNP_GS1_ELEMENT_STRING_TOKENIZER,
+    "gdti": GDTI_GS1_ELEMENT_STRING_TOKENIZER,
+    "cpi": CPI_GS1_ELEMENT_STRING_TOKENIZER,
+    "sgcn": SGCN_GS1_ELEMENT_STRING_TOKENIZER,
+    "ginc": GINC_GS1_ELEMENT_STRING_TOKENIZER,
+    "gsin": GSIN_GS1_ELEMENT_STRING_TOKENIZER,
+    "itip": ITIP_GS1_ELEMENT_STRING_TOKENIZER,
+    "upui": UPUI_GS1_ELEMENT_STRING_TOKENIZER,
+    "pgln": PGLN_GS1_ELEMENT_STRING_TOKENIZER,
+    "lgtin": LGTIN_GS1_ELEMENT_STRING_TOKENIZER,
+}
+
+GTIN_AI_MARKER = "(01)"
+GTIN_LENGTH = 14
+AI_MARKER_LENGTHS = (4, 5, 6)
+
+# Scheme identifiers by the leading application identifier between parentheses
+AI_MARKER_IDENTIFIERS: Dict[str, str] = {
+    f"({tokenizer.ais[0]})": identifier
+    for identifier, tokenizer in GS1_ELEMENT_STRING_TOKENIZERS.items()
+    if tokenizer.ais[0] != "01"
+}
+# GTIN based scheme identifiers by the application identifier following the GTIN
+GTIN_AI_MARKER_IDENTIFIERS: Dict[str, str] = {
+    f"({tokenizer.ais[1]})": identifier
+    for identifier, tokenizer in GS1_ELEMENT_STRING_TOKENIZERS.items()
+    if tokenizer.ais[0] == "01"
+}
+
+
+def gs1_element_string_identifier(element_string: str) -> Optional[str]:
+    """Identifier of the scheme of a GS1 element string, based on its application identifiers.
+    The element string itself is not validated.
+
+    Args:
+        element_string (str): GS1 element string
+
+    Returns:
+        Optional[str]: Scheme identifier, None if the application identifiers are unknown
+    """
+    if element_string.startswith(GTIN_AI_MARKER):
+        identifiers = GTIN_AI_MARKER_IDENTIFIERS
+        start = len(GTIN_AI_MARKER) + GTIN_LENGTH
+    else:
+        identifiers = AI_MARKER_IDENTIFIERS
+        start = 0
+
+    for length in AI_MARKER_LENGTHS:
+        identifier = identifiers.get(element_string[start : start + length])
+        if identifier is not None:
+            return identifier
+
+    return None
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from typing import Any, Dict, List
 
@@ -19,12 +20,26 @@ class TestEPCSchemeInitMeta(type):
         def generate_valid_init_tests(scheme: EPCScheme, epc_uri: str):
             def test(self: unittest.TestCase):
                 try:
-                    self.assertEqual(scheme.from_epc_uri(epc_uri).epc_uri, epc_uri)
+                    s = scheme.from_epc_uri(epc_uri)
                 except ConvertException:
                     self.fail(
                         f"{scheme} init unexpectedly raised ConvertException for URI {epc_uri}"
                     )
 
+                self.assertEqual(s.epc_uri, epc_uri)
+                self.assertFalse(hasattr(s, "__dict__"))
+
+                other = scheme.from_epc_uri(epc_uri)
+                self.assertEqual(hash(s), hash(other))
+                self.assertEqual(len({s, other}), 1)
+
+                with self.assertRaises(AttributeError):
+                    s.epc_uri = epc_uri
+
+                state = s.__getstate__()
+                self.assertEqual(hash(epc_uri), hash(s))
+                self.assertEqual(state, pickle.loads(pickle.dumps(s)).__getstate__())
+
             return test
 
         def generate_invalid_init_tests(scheme: EPCScheme, epc_uri: str):
@@ -164,6 +179,8 @@ class TestTagEncodableMeta(type):
                         f"{scheme} tag uri unexpectedly raised ConvertException for URI {epc_uri} and kwargs {kwargs}"
                     )
 
+                self.assertIs(s.tag_uri(**kwargs), s.tag_uri(**kwargs))
+
             return test
 
         def generate_valid_to_hex_test(
@@ -178,6 +195,8 @@ class TestTagEncodableMeta(type):
                         f"{scheme} hex unexpectedly raised ConvertException for URI {epc_uri} and kwargs {kwargs}"
                     )
 
+                self.assertIs(s.hex(**kwargs), s.hex(**kwargs))
+
             return test
 
         def generate_valid_from_tag_uri_test(
@@ -222,6 +241,20 @@ class TestTagEncodableMeta(type):
 
             return test
 
+        def generate_valid_from_bytes_test(
+            scheme: TagEncodable, epc_uri: str, hex_string: str
+        ):
+            def test(self: unittest.TestCase):
+                try:
+                    s: EPCScheme = scheme.from_bytes(bytes.fromhex(hex_string))
+                    self.assertEqual(s.epc_uri, epc_uri)
+                except ConvertException:
+                    self.fail(
+                        f"{scheme} from bytes unexpectedly raised ConvertException for URI {epc_uri}"
+                    )
+
+            return test
+
         def generate_invalid_tag_encodable_tests(
             scheme: EPCScheme, epc_uri: str, **kwargs
         ):
@@ -261,6 +294,11 @@ class TestTagEncodableMeta(type):
                 entry["uri"],
                 entry["hex"],
             )
+            attrs[f"{name}_from_bytes"] = generate_valid_from_bytes_test(
+                scheme,
+                entry["uri"],
+                entry["hex"],
+            )
 
         for entry in invalid_data:
             attrs[entry["name"]] = generate_invalid_tag_encodable_tests(
@@ -217,3 +217,24 @@ class TestGIAITagEncodable(
     ],
 ):
     pass
+
+
+class TestGIAISerialRange(unittest.TestCase):
+    def test_serial_range(self):
+        giai = GIAI("urn:epc:id:giai:0614141.12345400")
+
+        self.assertEqual(
+            [
+                GIAI(f"urn:epc:id:giai:0614141.{serial}").hex(
+                    GIAI.BinaryCodingScheme.GIAI_96, GIAIFilterValue.ALL_OTHERS
+                )
+                for serial in range(0, 50)
+            ],
+            list(
+                giai.serial_range(
+                    range(0, 50),
+                    GIAI.BinaryCodingScheme.GIAI_96,
+                    GIAIFilterValue.ALL_OTHERS,
+                )
+            ),
+        )
@@ -104,3 +104,21 @@ class TestGIDTagEncodable(
     invalid_data=[],
 ):
     pass
+
+
+class TestGIDSerialRange(unittest.TestCase):
+    def test_serial_range(self):
+        gid = GID("urn:epc:id:gid:95100000.12345.400")
+
+        self.assertEqual(
+            [
+                GID(f"urn:epc:id:gid:95100000.12345.{serial}").hex()
+                for serial in range(400, 450)
+            ],
+            list(gid.serial_range(range(400, 450))),
+        )
+
+    def test_empty_serial_range(self):
+        gid = GID("urn:epc:id:gid:95100000.12345.400")
+
+        self.assertEqual([], list(gid.serial_range(range(0))))
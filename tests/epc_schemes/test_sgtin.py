@@ -1,5 +1,6 @@
 import unittest
 
+from epcpy import ConvertException
 from epcpy.epc_schemes.sgtin import GTIN_TYPE, SGTIN, SGTINFilterValue
 from tests.epc_schemes.test_base_scheme import (
     TestEPCSchemeInitMeta,
@@ -210,3 +211,74 @@ class TestSGTINTagEncodable(
     ],
 ):
     pass
+
+
+class TestSGTINSerialRange(unittest.TestCase):
+    def test_serial_range(self):
+        sgtin = SGTIN("urn:epc:id:sgtin:0614141.812345.6789")
+
+        self.assertEqual(
+            [
+                SGTIN(f"urn:epc:id:sgtin:0614141.812345.{serial}").hex(
+                    SGTIN.BinaryCodingScheme.SGTIN_96, SGTINFilterValue.POS_ITEM
+                )
+                for serial in range(0, 100, 3)
+            ],
+            list(
+                sgtin.serial_range(
+                    range(0, 100, 3),
+                    SGTIN.BinaryCodingScheme.SGTIN_96,
+                    SGTINFilterValue.POS_ITEM,
+                )
+            ),
+        )
+
+    def test_serial_range_bytes(self):
+        sgtin = SGTIN("urn:epc:id:sgtin:0614141.812345.6789")
+
+        self.assertEqual(
+            [
+                bytes.fromhex("3054257BF7194E4000001A85"),
+                bytes.fromhex("3054257BF7194E4000001A86"),
+            ],
+            list(
+                sgtin.serial_range(
+                    range(6789, 6791),
+                    SGTIN.BinaryCodingScheme.SGTIN_96,
+                    SGTINFilterValue.FULL_CASE,
+                    as_bytes=True,
+                )
+            ),
+        )
+
+    def test_serial_range_out_of_range(self):
+        sgtin = SGTIN("urn:epc:id:sgtin:0614141.812345.6789")
+
+        with self.assertRaises(ConvertException):
+            sgtin.serial_range(
+                range(pow(2, 38) - 1, pow(2, 38) + 1),
+                SGTIN.BinaryCodingScheme.SGTIN_96,
+                SGTINFilterValue.POS_ITEM,
+            )
+
+    def test_serial_range_string_serial(self):
+        sgtin = SGTIN("urn:epc:id:sgtin:0614141.812345.6789")
+
+        with self.assertRaises(ConvertException):
+            sgtin.serial_range(
+                range(10),
+                SGTIN.BinaryCodingScheme.SGTIN_198,
+                SGTINFilterValue.POS_ITEM,
+            )
+
+
+class TestSGTINFromTagURI(unittest.TestCase):
+    def test_invalid_tag_uri(self):
+        for tag_uri in [
+            "urn:epc:tag:sscc-96:3.0614141.1234567890",
+            "urn:epc:tag:sgtin-97:3.0614141.812345.6789",
+            "urn:epc:tag:sgtin-96:.0614141.812345.6789",
+            "urn:epc:id:sgtin:0614141.812345.6789",
+        ]:
+            with self.assertRaises(ConvertException):
+                SGTIN.from_tag_uri(tag_uri)
@@ -132,3 +132,18 @@ class TestSSCCTagEncodable(
     invalid_data=[],
 ):
     pass
+
+
+class TestSSCCSerialRange(unittest.TestCase):
+    def test_serial_range(self):
+        sscc = SSCC("urn:epc:id:sscc:0614141.1234567890")
+
+        self.assertEqual(
+            [
+                SSCC(f"urn:epc:id:sscc:0614141.{serial:010}").hex(
+                    SSCCFilterValue.ALL_OTHERS
+                )
+                for serial in range(5, 50)
+            ],
+            list(sscc.serial_range(range(5, 50), SSCCFilterValue.ALL_OTHERS)),
+        )
@@ -0,0 +1,257 @@
+import io
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from epcpy.cli import Converter, convert_stream, detect_source, main
+from epcpy.utils.common import ConvertException, hex_to_base64
+from epcpy.utils.company_prefix import configure_company_prefixes
+from tests.utils.test_data import VALID_TEST_DATA
+
+
+class TestDetectSource(unittest.TestCase):
+    def test_detect_source(self):
+        self.assertEqual("hex", detect_source("3074257BF7194E4000001A85"))
+        self.assertEqual("base64", detect_source("MHQle/cZTkAAABqF"))
+        self.assertEqual("binary", detect_source("0011" * 24))
+        self.assertEqual(
+            "tag-uri", detect_source("urn:epc:tag:sgtin-96:3.0614141.812345.6789")
+        )
+        self.assertEqual(
+            "epc-uri", detect_source("urn:epc:id:sgtin:0614141.812345.6789")
+        )
+        self.assertEqual(
+            "gs1-element-string", detect_source("(01)80614141123458(21)6789")
+        )
+
+
+class TestConverter(unittest.TestCase):
+    def test_tag_encodables(self):
+        for epc in VALID_TEST_DATA:
+            if not epc["tag_encodable"]:
+                continue
+
+            sources = [epc["hex"], hex_to_base64(epc["hex"]), epc["tag_uri"]]
+            targets = {
+                "epc-uri": epc["uri"],
+                "tag-uri": epc["tag_uri"],
+                "hex": epc["hex"],
+                "base64": hex_to_base64(epc["hex"]),
+            }
+
+            for source in sources:
+                for target, expected in targets.items():
+                    with self.subTest(source=source, target=target):
+                        self.assertEqual(
+                            expected, Converter("auto", target).convert(source)
+                        )
+
+                binary = Converter("auto", "binary").convert(source)
+                self.assertEqual(epc["binary"], binary.ljust(len(epc["binary"]), "0"))
+
+    def test_encode_pure_identity(self):
+        converter = Converter(
+            "epc-uri", "hex", coding_scheme="sgtin-96", filter_value="3"
+        )
+
+        self.assertEqual(
+            "3074257BF7194E4000001A85",
+            converter.convert("urn:epc:id:sgtin:0614141.812345.6789"),
+        )
+
+    def test_gs1_element_string(self):
+        converter = Converter("auto", "epc-uri", company_prefix_length=7)
+
+        self.assertEqual(
+            "urn:epc:id:sgtin:0614141.812345.6789",
+            converter.convert("(01)80614141123458(21)6789"),
+        )
+        self.assertEqual(
+            "(01)80614141123458(21)6789",
+            Converter("auto", "gs1-element-string").convert(
+                "urn:epc:tag:sgtin-96:3.0614141.812345.6789"
+            ),
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ConvertException):
+            Converter("auto", "hex").convert("urn:epc:id:sgtin:0614141.812345.6789")
+        with self.assertRaises(ConvertException):
+            Converter("auto", "hex", coding_scheme="sscc-96", filter_value="3").convert(
+                "urn:epc:id:sgtin:0614141.812345.6789"
+            )
+        with self.assertRaises(ConvertException):
+            Converter(
+                "auto", "hex", coding_scheme="sgtin-96", filter_value="3"
+            ).convert("urn:epc:id:sgtin:0614141.812345.ABC")
+        with self.assertRaises(ConvertException):
+            Converter("auto", "epc-uri").convert("(01)80614141123458(21)6789")
+        with self.assertRaises(ConvertException):
+            Converter("auto", "gs1-key").convert("urn:epc:id:usdod:2S194.12345678901")
+
+    def test_malformed(self):
+        for source, line in [
+            ("auto", "hello"),
+            ("base64", "MHQlB"),
+            ("auto", "urn:epc:id"),
+            ("epc-uri", "urn:epc"),
+            ("auto", "urn:epc:tag"),
+            ("tag-uri", "urn:epc:tag:sgtin-96"),
+            ("binary", "0011002"),
+        ]:
+            with self.subTest(source=source, line=line), self.assertRaises(
+                ConvertException
+            ):
+                Converter(source, "epc-uri").convert(line)
+
+
+class TestConvertStream(unittest.TestCase):
+    LINES = ["3074257BF7194E4000001A85", "invalid", "3074257BF7194E4000001A86"]
+
+    def test_convert_stream(self):
+        output = io.StringIO()
+        errors = io.StringIO()
+
+        summary = convert_stream(
+            self.LINES,
+            output,
+            Converter("auto", "epc-uri"),
+            chunk_size=2,
+            errors=errors,
+        )
+
+        self.assertEqual(
+            "urn:epc:id:sgtin:0614141.812345.6789\n\nurn:epc:id:sgtin:0614141.812345.6790\n",
+            output.getvalue(),
+        )
+        self.assertTrue(errors.getvalue().startswith("invalid: "))
+        self.assertEqual((3, 1), (summary.lines, summary.errors))
+
+    def test_convert_stream_skip(self):
+        output = io.StringIO()
+
+        convert_stream(
+            self.LINES, output, Converter("auto", "epc-uri"), on_error="skip"
+        )
+
+        self.assertEqual(2, len(output.getvalue().splitlines()))
+
+    def test_convert_stream_fail(self):
+        output = io.StringIO()
+
+        with self.assertRaises(ConvertException):
+            convert_stream(
+                self.LINES, output, Converter("auto", "epc-uri"), on_error="fail"
+            )
+
+        self.assertEqual("urn:epc:id:sgtin:0614141.812345.6789\n", output.getvalue())
+
+    def test_convert_stream_invalid_chunk_size(self):
+        for chunk_size in (0, -1):
+            with self.subTest(chunk_size=chunk_size), self.assertRaises(ValueError):
+                convert_stream(
+                    self.LINES,
+                    io.StringIO(),
+                    Converter("auto", "epc-uri"),
+                    chunk_size=chunk_size,
+                )
+
+    def test_convert_stream_malformed(self):
+        output = io.StringIO()
+        errors = io.StringIO()
+
+        summary = convert_stream(
+            ["3074257BF7194E4000001A85", "hello", "urn:epc:id", "MHQle/cZTkAAABqF"],
+            output,
+            Converter("auto", "epc-uri"),
+            errors=errors,
+        )
+
+        self.assertEqual(
+            "urn:epc:id:sgtin:0614141.812345.6789\n\n\nurn:epc:id:sgtin:0614141.812345.6789\n",
+            output.getvalue(),
+        )
+        self.assertEqual(2, len(errors.getvalue().splitlines()))
+        self.assertEqual((4, 2), (summary.lines, summary.errors))
+
+
+class TestMain(unittest.TestCase):
+    def test_main(self):
+        output = io.StringIO()
+        with unittest.mock.patch(
+            "sys.stdin", io.StringIO("3074257BF7194E4000001A85\n\n")
+        ):
+            with unittest.mock.patch("sys.stdout", output):
+                self.assertEqual(0, main(["--to", "tag-uri", "--quiet"]))
+
+        self.assertEqual(
+            "urn:epc:tag:sgtin-96:3.0614141.812345.6789\n", output.getvalue()
+        )
+
+    def test_main_fail(self):
+        with unittest.mock.patch("sys.stdin", io.StringIO("invalid\n")):
+            with unittest.mock.patch("sys.stderr", io.StringIO()):
+                self.assertEqual(1, main(["--on-error", "fail"]))
+
+    def test_main_malformed(self):
+        output = io.StringIO()
+        with unittest.mock.patch(
+            "sys.stdin",
+            io.StringIO("3074257BF7194E4000001A85\nhello\nurn:epc:id\nMHQlB\n"),
+        ):
+            with unittest.mock.patch("sys.stdout", output):
+                with unittest.mock.patch("sys.stderr", io.StringIO()):
+                    self.assertEqual(0, main(["--on-error", "skip"]))
+
+        self.assertEqual("urn:epc:id:sgtin:0614141.812345.6789\n", output.getvalue())
+
+    def test_main_invalid_arguments(self):
+        for argv in [
+            ["--coding-scheme", "sgtin-97"],
+            ["--coding-scheme", "sgtin-96", "--filter", "8"],
+            ["--filter", "A"],
+            ["--filter", "-1"],
+            ["--chunk-size", "0"],
+            ["--chunk-size", "-5"],
+        ]:
+            with self.subTest(argv=argv):
+                with unittest.mock.patch("sys.stderr", io.StringIO()):
+                    with self.assertRaises(SystemExit) as context:
+                        main(argv)
+
+                self.assertEqual(2, context.exception.code)
+
+    def test_main_company_prefixes(self):
+        output = io.StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "prefixes.csv")
+            with open(path, "w") as f:
+                f.write("0614141,7\n")
+
+            try:
+                with unittest.mock.patch(
+                    "sys.stdin", io.StringIO("(01)80614141123458(21)6789\n")
+                ):
+                    with unittest.mock.patch("sys.stdout", output):
+                        self.assertEqual(
+                            0, main(["--company-prefixes", path, "--quiet"])
+                        )
+            finally:
+                configure_company_prefixes(None)
+
+        self.assertEqual("urn:epc:id:sgtin:0614141.812345.6789\n", output.getvalue())
+
+    def test_main_malformed_company_prefixes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "prefixes.csv")
+            with open(path, "w") as f:
+                f.write("0614141\n")
+
+            errors = io.StringIO()
+            with unittest.mock.patch("sys.stderr", errors):
+                with self.assertRaises(SystemExit) as context:
+                    main(["--company-prefixes", path])
+
+        self.assertEqual(2, context.exception.code)
+        self.assertIn("row 1", errors.getvalue())
@@ -0,0 +1,60 @@
+import subprocess
+import sys
+import unittest
+
+import epcpy
+import epcpy.epc_schemes
+
+
+def loaded_modules(statement: str, *modules: str) -> str:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print(*[m for m in {modules!r} if m in sys.modules])",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_epcpy(self):
+        self.assertEqual(
+            "",
+            loaded_modules(
+                "import epcpy",
+                "epcpy.epc_schemes.sgtin",
+                "epcpy.utils.parsers",
+                "epcpy.utils.parallel",
+                "asyncio",
+            ),
+        )
+
+    def test_import_scheme(self):
+        self.assertEqual(
+            "epcpy.epc_schemes.sgtin",
+            loaded_modules(
+                "from epcpy.epc_schemes import SGTIN",
+                "epcpy.epc_schemes.sgtin",
+                "epcpy.epc_schemes.adi",
+                "epcpy.utils.parsers",
+            ),
+        )
+
+    def test_exports(self):
+        for name in epcpy.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(epcpy, name)))
+                self.assertIn(name, dir(epcpy))
+
+        for name in epcpy.epc_schemes.__all__:
+            with self.subTest(name=name):
+                self.assertEqual(name, getattr(epcpy.epc_schemes, name).__name__)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            epcpy.unknown
+        with self.assertRaises(AttributeError):
+            epcpy.epc_schemes.UNKNOWN
@@ -0,0 +1,196 @@
+import unittest
+
+from epcpy.epc_schemes import GRAI, SGTIN, SSCC
+from epcpy.epc_schemes.grai import GRAIFilterValue
+from epcpy.epc_schemes.sgtin import SGTINFilterValue
+from epcpy.utils.common import ConvertException
+from tests.utils.test_data import VALID_TEST_DATA
+
+try:
+    import numpy as np
+
+    from epcpy.utils.columnar import (
+        LAYOUTS_96,
+        decode_96,
+        encode_96,
+        from_hex,
+        to_hex,
+    )
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestColumnarDecoder(unittest.TestCase):
+    def test_decode_96(self):
+        data = [
+            epc
+            for epc in VALID_TEST_DATA
+            if epc["tag_encodable"] and int(epc["hex"][:2], 16) in LAYOUTS_96
+        ]
+        tags = np.frombuffer(
+            b"".join(bytes.fromhex(epc["hex"]) for epc in data), dtype=np.uint8
+        ).reshape(-1, 12)
+
+        columns = decode_96(tags)
+
+        self.assertTrue(columns.valid.all())
+        for i, epc in enumerate(data):
+            components = epc["uri"].split(":")[4].split(".")
+            values = [
+                int(columns.company_prefix[i]),
+                int(columns.item_reference[i]),
+                int(columns.serial[i]),
+            ]
+
+            self.assertEqual(int(epc["hex"][:2], 16), columns.header[i])
+            self.assertEqual(
+                [int(component) if component else 0 for component in components],
+                values[: len(components)],
+            )
+
+    def test_decode_sgtin_96(self):
+        columns = decode_96(
+            np.frombuffer(
+                bytes.fromhex("3074257BF7194E4000001A85"), dtype=np.uint8
+            ).reshape(1, 12)
+        )
+
+        self.assertEqual(
+            [0x30, 3, 5, 614141, 812345, 6789, True],
+            [column[0] for column in columns],
+        )
+
+    def test_words(self):
+        value = 0x3074257BF7194E4000001A85
+        words = np.array([[value >> 64, value & (2**64 - 1)]], dtype=np.uint64)
+
+        columns = decode_96(words)
+
+        self.assertEqual(614141, columns.company_prefix[0])
+        self.assertEqual(812345, columns.item_reference[0])
+        self.assertEqual(6789, columns.serial[0])
+
+    def test_invalid_rows(self):
+        values = [
+            0x3074257BF7194E4000001A85,  # valid SGTIN-96
+            0xFF74257BF7194E4000001A85,  # unknown header
+            0x307C257BF7194E4000001A85,  # partition 7
+            (0x30 << 88)
+            | (3 << 85)
+            | (5 << 82)
+            | ((2**24 - 1) << 58),  # company prefix too large
+        ]
+        tags = np.frombuffer(
+            b"".join(value.to_bytes(12, "big") for value in values), dtype=np.uint8
+        ).reshape(-1, 12)
+
+        self.assertEqual([True, False, False, False], list(decode_96(tags).valid))
+
+    def test_invalid_shape(self):
+        with self.assertRaises(ConvertException):
+            decode_96(np.zeros((2, 16), dtype=np.uint8))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestColumnarEncoder(unittest.TestCase):
+    def test_encode_sgtin_96(self):
+        tags = encode_96(
+            SGTIN.BinaryCodingScheme.SGTIN_96,
+            filter_value=3,
+            company_prefix=614141,
+            company_prefix_length=7,
+            item_reference=812345,
+            serial=[6789, 6790],
+        )
+
+        self.assertEqual((2, 12), tags.shape)
+        self.assertEqual(
+            [
+                SGTIN("urn:epc:id:sgtin:0614141.812345.6789").hex(
+                    SGTIN.BinaryCodingScheme.SGTIN_96, SGTINFilterValue.RESERVED_3
+                ),
+                SGTIN("urn:epc:id:sgtin:0614141.812345.6790").hex(
+                    SGTIN.BinaryCodingScheme.SGTIN_96, SGTINFilterValue.RESERVED_3
+                ),
+            ],
+            list(to_hex(tags)),
+        )
+
+    def test_encode_sscc_96(self):
+        tags = encode_96(
+            SSCC.BinaryCodingScheme.SSCC_96,
+            filter_value=0,
+            company_prefix=[61414123456],
+            company_prefix_length=12,
+            item_reference=[12345],
+        )
+
+        self.assertEqual(["31003932449F003039000000"], list(to_hex(tags)))
+
+    def test_encode_grai_96(self):
+        tags = encode_96(
+            GRAI.BinaryCodingScheme.GRAI_96,
+            filter_value=[1, 2],
+            company_prefix=[614141, 95100000],
+            company_prefix_length=[7, 8],
+            item_reference=[12345, 1234],
+            serial=[400, 0],
+        )
+
+        self.assertEqual(
+            [
+                GRAI("urn:epc:id:grai:0614141.12345.400").hex(
+                    GRAI.BinaryCodingScheme.GRAI_96, GRAIFilterValue.RESERVED_1
+                ),
+                GRAI("urn:epc:id:grai:95100000.1234.0").hex(
+                    GRAI.BinaryCodingScheme.GRAI_96, GRAIFilterValue.RESERVED_2
+                ),
+            ],
+            list(to_hex(tags)),
+        )
+
+    def test_roundtrip(self):
+        tags = from_hex(["3074257BF7194E4000001A85", "31003932449F003039000000"])
+        columns = decode_96(tags)
+
+        for i, header in enumerate(columns.header):
+            layout = LAYOUTS_96[header]
+            length = layout.fields[0].partition_table_p[columns.partition[i]]["L"]
+
+            np.testing.assert_array_equal(
+                tags[i : i + 1],
+                encode_96(
+                    layout.coding_scheme,
+                    columns.filter[i],
+                    columns.company_prefix[i],
+                    length,
+                    columns.item_reference[i],
+                    columns.serial[i],
+                ),
+            )
+
+    def test_invalid_company_prefix_length(self):
+        with self.assertRaises(ConvertException):
+            encode_96(SGTIN.BinaryCodingScheme.SGTIN_96, 0, 614141, 5, 812345, 1)
+
+    def test_invalid_values(self):
+        for filter_value, company_prefix, item_reference, serial in [
+            (8, 614141, 812345, 1),
+            (0, 10000000, 812345, 1),
+            (0, 614141, 1000000, 1),
+            (0, 614141, 812345, pow(2, 38)),
+        ]:
+            with self.assertRaises(ConvertException):
+                encode_96(
+                    SGTIN.BinaryCodingScheme.SGTIN_96,
+                    filter_value,
+                    company_prefix,
+                    7,
+                    item_reference,
+                    serial,
+                )
+
+    def test_unsupported_coding_scheme(self):
+        with self.assertRaises(ConvertException):
+            encode_96(SGTIN.BinaryCodingScheme.SGTIN_198, 0, 614141, 7, 812345, 1)
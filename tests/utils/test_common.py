@@ -0,0 +1,176 @@
+import random
+import re
+import unittest
+
+from epcpy.utils.common import (
+    ESCAPE_CHARACTER_CODES,
+    BitReader,
+    BitWriter,
+    ConvertException,
+    _pack_codes,
+    _unpack_codes,
+    decode_string,
+    decode_string_six_bits,
+    encode_string,
+    encode_string_six_bits,
+    read_string_six_bits,
+    write_cage_code_six_bits,
+)
+
+CHARS = list("0123456789ABCXYZabcxyz-_.:!'()*+,;=#/@[]^`{}~%\x7f٣½é") + [
+    "%2F",
+    "%23",
+    "%2f",
+    "%41",
+    "%7F",
+    "%80",
+    "%A",
+]
+
+
+def reference_bits(code, num_bits):
+    if code < 0 or code >> num_bits:
+        raise ConvertException(message=f"Value {code} does not fit in {num_bits} bits")
+
+    return f"{code:0{num_bits}b}"
+
+
+def reference_encode_string(string, num_bits):
+    bits = []
+    for g in re.split("(%[0-9a-fA-F]{2})", string):
+        if len(g) == 0:
+            continue
+        elif g[0] != "%":
+            bits.extend(reference_bits(ord(s), 7) for s in g)
+        else:
+            bits.append(reference_bits(int(g[1:], 16), 7))
+
+    return "".join(bits).ljust(num_bits, "0")
+
+
+def reference_decode_string(binary):
+    chars = []
+    for i in range(0, len(binary) - 6, 7):
+        code = int(binary[i : i + 7], 2)
+        if code:
+            chars.append(ESCAPE_CHARACTER_CODES.get(code, chr(code)))
+
+    return "".join(chars)
+
+
+def reference_encode_string_six_bits(string):
+    bits = []
+    for g in re.split("(%[0-9a-fA-F]{2}|-)", string):
+        if len(g) == 0:
+            continue
+        elif g == "-":
+            bits.append("101101")
+        elif g[0] != "%":
+            bits.extend(
+                reference_bits(48 + int(s) if s.isnumeric() else ord(s) - 64, 6)
+                for s in g
+            )
+        else:
+            bits.append(reference_bits(int(g[1:], 16), 6))
+
+    return "".join(bits) + "000000"
+
+
+def reference_decode_string_six_bits(binary, max_chars):
+    chars = []
+    for i in range(0, len(binary) - 5, 6):
+        code = int(binary[i : i + 6], 2)
+        if code == 0:
+            break
+        if len(chars) == max_chars:
+            raise ConvertException(message="Too many characters decoded!")
+
+        chars.append(chr(code) if code >= 32 else chr(64 + code))
+
+    return "".join(chars).replace("#", "%23").replace("/", "%2F")
+
+
+def outcome(function, *args):
+    try:
+        return function(*args)
+    except (ConvertException, ValueError):
+        return None
+
+
+class TestStringCodecs(unittest.TestCase):
+    def test_encode_string(self):
+        self.assertEqual(
+            "1000001" "0100010" "1000010" "0000000" "0000",
+            encode_string("A%22B", 32),
+        )
+        self.assertEqual("", encode_string("", 0))
+        with self.assertRaises(ConvertException):
+            encode_string("é", 7)
+
+    def test_decode_string(self):
+        self.assertEqual(
+            "A%22B", decode_string("1000001" "0100010" "1000010" "0000000" "0000")
+        )
+        self.assertEqual("", decode_string("000000"))
+
+    def test_string_six_bits(self):
+        self.assertEqual(
+            "000011" "101101" "110000" "000000", encode_string_six_bits("C-0")
+        )
+        self.assertEqual(
+            "C-0", decode_string_six_bits("000011" "101101" "110000" "000000", 3)
+        )
+        self.assertEqual("%23%2F", decode_string_six_bits("100011" "101111", 2))
+        with self.assertRaises(ConvertException):
+            decode_string_six_bits("000011" "101101" "110000" "000000", 2)
+        with self.assertRaises(ConvertException):
+            encode_string_six_bits("$")
+
+    def test_read_string_six_bits_position(self):
+        reader = BitReader.from_binary("000011" "000000" "000001" "11")
+        self.assertEqual("C", read_string_six_bits(reader, 1))
+        self.assertEqual(12, reader.position)
+        self.assertEqual("A", read_string_six_bits(reader, 1))
+        self.assertEqual(18, reader.position)
+
+    def test_cage_code(self):
+        writer = BitWriter()
+        write_cage_code_six_bits(writer, "2S194")
+        self.assertEqual("100000110010010011110001111001110100", writer.to_binary())
+
+    def test_differential(self):
+        rnd = random.Random(0)
+
+        for _ in range(2000):
+            string = "".join(rnd.choice(CHARS) for _ in range(rnd.randint(0, 12)))
+            num_bits = rnd.randint(0, 100)
+            with self.subTest(string=string, num_bits=num_bits):
+                self.assertEqual(
+                    outcome(reference_encode_string, string, num_bits),
+                    outcome(encode_string, string, num_bits),
+                )
+                self.assertEqual(
+                    outcome(reference_encode_string_six_bits, string),
+                    outcome(encode_string_six_bits, string),
+                )
+
+            binary = "".join(rnd.choice("01") for _ in range(rnd.randint(0, 100)))
+            max_chars = rnd.randint(0, 20)
+            with self.subTest(binary=binary, max_chars=max_chars):
+                self.assertEqual(reference_decode_string(binary), decode_string(binary))
+                self.assertEqual(
+                    outcome(reference_decode_string_six_bits, binary, max_chars),
+                    outcome(decode_string_six_bits, binary, max_chars),
+                )
+
+    def test_pack_codes(self):
+        rnd = random.Random(0)
+
+        for count in list(range(70)) + [255, 256, 257, 600]:
+            for bits in (6, 7):
+                codes = bytes(rnd.randrange(1 << bits) for _ in range(count))
+                value = int("".join(f"{code:0{bits}b}" for code in codes) or "0", 2)
+
+                with self.subTest(count=count, bits=bits):
+                    self.assertEqual(value, _pack_codes(codes, bits))
+                    self.assertEqual(codes, _unpack_codes(value, count, bits))
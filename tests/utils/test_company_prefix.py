@@ -0,0 +1,293 @@
+import os
+import random
+import tempfile
+import threading
+import unittest
+
+from epcpy.epc_schemes import SGTIN
+from epcpy.utils.common import ConvertException
+from epcpy.utils.company_prefix import (
+    CompanyPrefixTable,
+    CompanyPrefixTrie,
+    configure_company_prefixes,
+    load_company_prefixes,
+    read_company_prefixes,
+    resolve_company_prefix_length,
+)
+from epcpy.utils.parsers import gs1_element_string_to_gs1_element, get_gs1_key
+from tests.utils.test_data import VALID_TEST_DATA
+
+ENTRIES = [("0614141", 7), ("061", 9), ("95100000", 8), ("02", 0), ("1", 6)]
+
+GS1_ELEMENT_DATA = [
+    epc
+    for epc in VALID_TEST_DATA
+    if epc.get("gs1_element_string") and epc["uri"].startswith("urn:epc:id:")
+]
+
+FILES = {
+    "xml": """<?xml version="1.0" encoding="UTF-8"?>
+<GCPPrefixFormatList date="2022-01-01">
+  <entry prefix="0614141" gcpLength="7"/>
+  <entry prefix="061" gcpLength="9"/>
+</GCPPrefixFormatList>
+""",
+    "json": """{"GCPPrefixFormatList": {"date": "2022-01-01", "entry": [
+  {"prefix": "0614141", "gcpLength": 7},
+  {"prefix": "061", "gcpLength": "9"}
+]}}""",
+    "csv": "prefix,length\n0614141,7\n\n061, 9\n",
+}
+
+
+def longest_prefix_length(entries, digits):
+    matches = [(len(p), l) for p, l in entries if digits.startswith(p)]
+    return (max(matches)[1] or None) if matches else None
+
+
+class TestCompanyPrefixTrie(unittest.TestCase):
+    def test_lookup(self):
+        trie = CompanyPrefixTrie(ENTRIES)
+
+        self.assertEqual(5, len(trie))
+        self.assertEqual(7, trie.lookup("0614141812345"))
+        self.assertEqual(9, trie.lookup("0619"))
+        self.assertEqual(9, trie.lookup("061"))
+        self.assertEqual(8, trie.lookup("951000001"))
+        self.assertEqual(6, trie.lookup("1234"))
+        self.assertIsNone(trie.lookup("06"))
+        self.assertIsNone(trie.lookup("95"))
+        self.assertIsNone(trie.lookup("0200"))
+        self.assertIsNone(trie.lookup(""))
+        self.assertIsNone(trie.lookup("A061"))
+
+    def test_random(self):
+        rnd = random.Random(0)
+        entries = {
+            "".join(rnd.choice("0123") for _ in range(rnd.randint(1, 6))): rnd.randint(
+                0, 12
+            )
+            for _ in range(500)
+        }
+        trie = CompanyPrefixTrie(entries.items())
+
+        self.assertEqual(len(entries), len(trie))
+        for _ in range(2000):
+            digits = "".join(rnd.choice("01234") for _ in range(rnd.randint(0, 8)))
+            self.assertEqual(
+                longest_prefix_length(entries.items(), digits), trie.lookup(digits)
+            )
+
+    def test_empty(self):
+        trie = CompanyPrefixTrie([])
+
+        self.assertEqual(0, len(trie))
+        self.assertIsNone(trie.lookup("0614141"))
+
+    def test_invalid_entries(self):
+        for entries in [
+            [("06A", 7)],
+            [("", 7)],
+            [("٣", 7)],
+            [("0614141", 13)],
+            [("0614141", -1)],
+            [("0614141", 7), ("0614141", 8)],
+        ]:
+            with self.subTest(entries=entries), self.assertRaises(ValueError):
+                CompanyPrefixTrie(entries)
+
+        self.assertEqual(1, len(CompanyPrefixTrie([("0614141", 7), ("0614141", 7)])))
+
+    def test_read_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for file_format, content in FILES.items():
+                with self.subTest(file_format=file_format):
+                    path = os.path.join(directory, f"prefixes.{file_format}")
+                    with open(path, "w") as f:
+                        f.write(content)
+
+                    self.assertEqual(
+                        [("0614141", 7), ("061", 9)],
+                        list(read_company_prefixes(path)),
+                    )
+                    self.assertEqual(
+                        7, CompanyPrefixTrie.from_file(path).lookup("0614141")
+                    )
+
+            with self.assertRaises(ValueError):
+                read_company_prefixes(os.path.join(directory, "prefixes.txt"))
+            self.assertEqual(
+                [("0614141", 7), ("061", 9)],
+                list(
+                    read_company_prefixes(
+                        os.path.join(directory, "prefixes.csv"), file_format="csv"
+                    )
+                ),
+            )
+
+    def test_read_malformed_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for file_format, content, location in [
+                ("csv", "prefix,length\n0614141,7\n061\n", "row 3"),
+                ("csv", "0614141,seven\n", "row 1"),
+                (
+                    "xml",
+                    '<GCPPrefixFormatList><entry prefix="061"/></GCPPrefixFormatList>',
+                    "entry element 0",
+                ),
+                ("xml", "<GCPPrefixFormatList><entry", "malformed XML"),
+                ("json", '{"entry": []}', "GCPPrefixFormatList"),
+                ("json", '{"GCPPrefixFormatList": {"entry": [{}]}}', "entry 0"),
+            ]:
+                with self.subTest(file_format=file_format, content=content):
+                    path = os.path.join(directory, f"prefixes.{file_format}")
+                    with open(path, "w") as f:
+                        f.write(content)
+
+                    with self.assertRaisesRegex(ValueError, location) as context:
+                        CompanyPrefixTrie.from_file(path)
+
+                    self.assertIn(path, str(context.exception))
+
+
+class TestResolveCompanyPrefixLength(unittest.TestCase):
+    def tearDown(self):
+        configure_company_prefixes(None)
+
+    def test_not_configured(self):
+        with self.assertRaises(ConvertException):
+            resolve_company_prefix_length("0614141")
+        with self.assertRaises(ConvertException):
+            get_gs1_key("(01)80614141123458(21)6789")
+
+    def test_unknown_prefix(self):
+        configure_company_prefixes(CompanyPrefixTrie(ENTRIES))
+
+        self.assertEqual(7, resolve_company_prefix_length("0614141812345"))
+        with self.assertRaises(ConvertException):
+            resolve_company_prefix_length("0200")
+        with self.assertRaises(ConvertException):
+            gs1_element_string_to_gs1_element("(01)89514141123458(21)6789")
+
+    def test_gs1_element_strings(self):
+        for epc in GS1_ELEMENT_DATA:
+            company_prefix = epc["uri"].split(":")[4].split(".")[0]
+            configure_company_prefixes(
+                CompanyPrefixTrie([(company_prefix, len(company_prefix))])
+            )
+
+            with self.subTest(uri=epc["uri"]):
+                self.assertEqual(
+                    epc["uri"],
+                    gs1_element_string_to_gs1_element(
+                        epc["gs1_element_string"]
+                    ).epc_uri,
+                )
+
+    def test_explicit_length(self):
+        configure_company_prefixes(CompanyPrefixTrie([("0614141", 9)]))
+
+        self.assertEqual(
+            "urn:epc:id:sgtin:0614141.812345.6789",
+            gs1_element_string_to_gs1_element("(01)80614141123458(21)6789", 7).epc_uri,
+        )
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "prefixes.csv")
+            with open(path, "w") as f:
+                f.write(FILES["csv"])
+
+            load_company_prefixes(path)
+
+        self.assertEqual("80614141123458", get_gs1_key("(01)80614141123458(21)6789"))
+
+
+class TestCompanyPrefixTable(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "prefixes.csv")
+        self.write("0614141,7\n", 1)
+
+    def tearDown(self):
+        configure_company_prefixes(None)
+        self.directory.cleanup()
+
+    def write(self, content, version):
+        with open(self.path, "w") as f:
+            f.write(content)
+        os.utime(self.path, ns=(version * 10**9, version * 10**9))
+
+    def test_reload(self):
+        table = CompanyPrefixTable(self.path)
+        trie = table.trie
+
+        self.assertEqual(7, table.lookup("0614141812345"))
+        self.assertFalse(table.reload_if_modified())
+
+        self.write("0614141,9\n", 2)
+        self.assertTrue(table.reload_if_modified())
+        self.assertFalse(table.reload_if_modified())
+        self.assertEqual(9, table.lookup("0614141812345"))
+        self.assertIsNot(trie, table.trie)
+        self.assertEqual(7, trie.lookup("0614141812345"))
+
+    def test_reload_invalid(self):
+        table = CompanyPrefixTable(self.path)
+
+        self.write("0614141,13\n", 2)
+        with self.assertRaises(ValueError):
+            table.reload()
+        os.remove(self.path)
+        with self.assertRaises(OSError):
+            table.reload_if_modified()
+
+        self.assertEqual(7, table.lookup("0614141812345"))
+
+    def test_reload_in_background(self):
+        table = CompanyPrefixTable(self.path)
+
+        self.write("0614141,9\n", 2)
+        trie = table.reload_in_background().result(timeout=10)
+        self.assertIs(trie, table.trie)
+        self.assertEqual(9, table.lookup("0614141812345"))
+
+        self.write("invalid,1\n0614141,13\n", 3)
+        with self.assertRaises(ValueError):
+            table.reload_in_background().result(timeout=10)
+        self.assertIs(trie, table.trie)
+
+    def test_lookup_during_reloads(self):
+        table = CompanyPrefixTable(self.path)
+        self.write("".join(f"1{i:06},9\n" for i in range(10_000)) + "0614141,9\n", 2)
+        results = set()
+        reloading = True
+
+        def lookup():
+            while reloading:
+                results.add(table.lookup("0614141812345"))
+
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        for _ in range(5):
+            table.reload()
+        reloading = False
+        thread.join()
+
+        self.assertEqual({7, 9} & results, results)
+
+    def test_configured(self):
+        table = load_company_prefixes(self.path)
+
+        self.assertEqual(
+            "urn:epc:id:sgtin:0614141.812345.6789",
+            SGTIN.from_gtin_plus_serial("80614141123458", "6789").epc_uri,
+        )
+
+        self.write("0614141,9\n", 2)
+        table.reload()
+        self.assertEqual(
+            "urn:epc:id:sgtin:061414112.8345.6789",
+            SGTIN.from_gtin_plus_serial("80614141123458", "6789").epc_uri,
+        )
+        self.assertEqual("80614141123458", get_gs1_key("(01)80614141123458(21)6789"))
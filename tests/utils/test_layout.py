@@ -0,0 +1,156 @@
+import unittest
+
+from epcpy.epc_schemes import ADI, CPI, GIAI, GID, GRAI, SGTIN
+from epcpy.epc_schemes.base_scheme import GS1Element, GS1Keyed
+from epcpy.utils.common import BitReader, ConvertException
+from tests.utils.test_data import VALID_TEST_DATA
+
+
+class TestLayout(unittest.TestCase):
+    def test_layouts_by_header(self):
+        for layout in SGTIN.binary_layouts:
+            self.assertIs(SGTIN._header_layouts[layout.header], layout)
+            self.assertIs(SGTIN._layouts[layout.coding_scheme], layout)
+
+    def test_layout_size(self):
+        sizes = {layout.coding_scheme: layout.size for layout in SGTIN.binary_layouts}
+
+        self.assertEqual(
+            {
+                SGTIN.BinaryCodingScheme.SGTIN_96: 96,
+                SGTIN.BinaryCodingScheme.SGTIN_198: 198,
+            },
+            sizes,
+        )
+
+    def test_decode(self):
+        layout = SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_96]
+        reader = BitReader.from_hex("3074257BF7194E4000001A85")
+        reader.read(8)
+
+        self.assertEqual(
+            (3, ["0614141", "812345", "6789"]),
+            layout.decode(reader),
+        )
+
+    def test_decode_without_filter(self):
+        layout = GID._layouts[GID.BinaryCodingScheme.GID_96]
+        reader = BitReader.from_hex("355AB1C60003039000000190")
+        reader.read(8)
+
+        self.assertEqual((None, ["95100000", "12345", "400"]), layout.decode(reader))
+
+    def test_encode(self):
+        layout = SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_96]
+
+        self.assertEqual(
+            "3074257BF7194E4000001A85",
+            layout.encode(["0614141", "812345", "6789"], "3").to_hex(),
+        )
+
+    def test_integer_shift(self):
+        self.assertEqual(
+            (0, False),
+            SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_96].integer_shift(2),
+        )
+        self.assertEqual(
+            (0, False), GID._layouts[GID.BinaryCodingScheme.GID_96].integer_shift(2)
+        )
+        self.assertEqual(
+            (36, False), GID._layouts[GID.BinaryCodingScheme.GID_96].integer_shift(1)
+        )
+
+    def test_integer_shift_invalid(self):
+        with self.assertRaises(ConvertException):
+            SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_198].integer_shift(2)
+        with self.assertRaises(ConvertException):
+            SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_96].integer_shift(0)
+
+    def test_decode_too_short(self):
+        layout = SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_96]
+        reader = BitReader.from_hex("3074257BF7194E40")
+        reader.read(8)
+
+        with self.assertRaises(ConvertException):
+            layout.decode(reader)
+
+    def test_verify(self):
+        valid = [
+            (
+                SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_198],
+                ["0614141", "812345", "A%2FB"],
+            ),
+            (
+                GRAI._layouts[GRAI.BinaryCodingScheme.GRAI_170],
+                ["0614141", "12345", "ABCDEFGHIJKLMNOP"],
+            ),
+            (
+                CPI._layouts[CPI.BinaryCodingScheme.CPI_VAR],
+                ["0614141", "5PQ7%2FZ43", "999999999999"],
+            ),
+            (
+                ADI._layouts[ADI.BinaryCodingScheme.ADI_VAR],
+                ["35962", "", "%23M37GXB92"],
+            ),
+        ]
+        invalid = [
+            (
+                SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_198],
+                ["0614141", "812345", "A B"],
+            ),
+            (
+                SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_198],
+                ["0614141", "812345", ""],
+            ),
+            (
+                GRAI._layouts[GRAI.BinaryCodingScheme.GRAI_170],
+                ["0614141", "12345", "A%2FBCDEFGHIJKLMNO"],
+            ),
+            (
+                GIAI._layouts[GIAI.BinaryCodingScheme.GIAI_202],
+                ["0614141", "A%2FBCDEFGHIJKLMNOPQRSTU"],
+            ),
+            (
+                CPI._layouts[CPI.BinaryCodingScheme.CPI_VAR],
+                ["0614141", "5PQ7%2FZ43", "1099511627775"],
+            ),
+            (CPI._layouts[CPI.BinaryCodingScheme.CPI_VAR], ["0614141", "5pq7", "1"]),
+            (ADI._layouts[ADI.BinaryCodingScheme.ADI_VAR], ["3596I", "", "M37GXB92"]),
+            (ADI._layouts[ADI.BinaryCodingScheme.ADI_VAR], ["35962", "", "%23"]),
+        ]
+
+        for layout, components in valid:
+            with self.subTest(components=components):
+                layout.verify(components)
+
+        for layout, components in invalid:
+            with self.subTest(components=components), self.assertRaises(
+                ConvertException
+            ):
+                layout.verify(components)
+
+
+class TestTrustedConstruction(unittest.TestCase):
+    def test_validated_layouts(self):
+        self.assertTrue(SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_96].validated)
+        self.assertFalse(SGTIN._layouts[SGTIN.BinaryCodingScheme.SGTIN_198].validated)
+
+    def test_from_components(self):
+        for epc in VALID_TEST_DATA:
+            if not epc["tag_encodable"]:
+                continue
+
+            scheme = epc["scheme"]
+            reader = BitReader.from_hex(epc["hex"])
+            _, components = scheme._header_layouts[reader.read(8)].decode(reader)
+
+            expected = scheme(epc["uri"])
+            actual = scheme._from_components(components)
+
+            self.assertEqual(expected, actual)
+            if isinstance(expected, GS1Element):
+                self.assertEqual(
+                    expected.gs1_element_string(), actual.gs1_element_string()
+                )
+            if isinstance(expected, GS1Keyed):
+                self.assertEqual(expected.gs1_key(), actual.gs1_key())
@@ -0,0 +1,169 @@
+import multiprocessing
+import operator
+import unittest
+from multiprocessing.shared_memory import SharedMemory
+
+from epcpy.utils.common import ConvertException
+from epcpy.utils.parallel import (
+    decode_parallel,
+    decode_shared_memory,
+    iter_decode_parallel,
+    read_shared_records,
+)
+from epcpy.utils.parsers import bytes_to_tag_encodables, hex_to_tag_encodables
+from tests.utils.test_data import VALID_TEST_DATA
+
+HEX_STRINGS = [epc["hex"] for epc in VALID_TEST_DATA if epc["tag_encodable"]] + [
+    "3074257BF7194E4000001A85",
+    "FF",
+    "3074257BF7194E4000001A85",
+]
+
+
+class TestDecodeParallel(unittest.TestCase):
+    def assertResultsEqual(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+
+        for e, a in zip(expected, actual):
+            if isinstance(e, ConvertException):
+                self.assertIsInstance(a, ConvertException)
+            else:
+                self.assertEqual(e, a)
+                self.assertEqual(hash(e), hash(a))
+
+    def test_decode_parallel(self):
+        self.assertResultsEqual(
+            hex_to_tag_encodables(HEX_STRINGS),
+            decode_parallel(HEX_STRINGS, workers=2, chunk_size=3),
+        )
+
+    def test_decode_parallel_spawn(self):
+        self.assertResultsEqual(
+            hex_to_tag_encodables(HEX_STRINGS),
+            decode_parallel(
+                HEX_STRINGS,
+                workers=2,
+                chunk_size=5,
+                mp_context=multiprocessing.get_context("spawn"),
+                decode_cache_size=16,
+            ),
+        )
+
+    def test_iter_decode_parallel(self):
+        results = iter_decode_parallel(
+            iter(HEX_STRINGS),
+            workers=1,
+            chunk_size=1,
+            convert=operator.attrgetter("epc_uri"),
+        )
+
+        self.assertEqual(
+            [
+                e.epc_uri if not isinstance(e, ConvertException) else None
+                for e in hex_to_tag_encodables(HEX_STRINGS)
+            ],
+            [r if not isinstance(r, ConvertException) else None for r in results],
+        )
+
+    def test_convert_exception(self):
+        self.assertIsInstance(
+            decode_parallel(
+                ["3074257BF7194E4000001A85"],
+                convert=operator.methodcaller("gtin", gtin_type=8),
+                workers=1,
+            )[0],
+            ConvertException,
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            decode_parallel(HEX_STRINGS, source_format="uri")
+        with self.assertRaises(ValueError):
+            decode_parallel(HEX_STRINGS, workers=-1)
+        with self.assertRaises(ValueError):
+            iter_decode_parallel(HEX_STRINGS, workers=0)
+        with self.assertRaises(ValueError):
+            decode_parallel(HEX_STRINGS, chunk_size=0)
+        with self.assertRaises(ValueError):
+            decode_parallel(HEX_STRINGS, decode_cache_size=-1)
+
+
+class TestDecodeSharedMemory(unittest.TestCase):
+    def setUp(self):
+        self.memory = []
+
+    def tearDown(self):
+        for memory in self.memory:
+            memory.close()
+            memory.unlink()
+
+    def shared_memory(self, size):
+        memory = SharedMemory(create=True, size=size)
+        self.memory.append(memory)
+
+        return memory
+
+    def decode(self, tag_size, **kwargs):
+        raw_tags = [
+            bytes.fromhex(hex_string)[:tag_size].ljust(tag_size, b"\0")
+            for hex_string in HEX_STRINGS
+        ]
+        tags = self.shared_memory(len(raw_tags) * tag_size)
+        tags.buf[: len(raw_tags) * tag_size] = b"".join(raw_tags)
+        output = self.shared_memory(len(raw_tags) * 64)
+
+        errors = decode_shared_memory(
+            tags,
+            output,
+            len(raw_tags),
+            tag_size=tag_size,
+            workers=2,
+            chunk_size=4,
+            **kwargs,
+        )
+        expected = [
+            None if isinstance(tag, ConvertException) else tag
+            for tag in bytes_to_tag_encodables(raw_tags)
+        ]
+
+        self.assertEqual(expected.count(None), errors)
+
+        return expected, read_shared_records(output, len(raw_tags))
+
+    def test_decode_shared_memory(self):
+        for tag_size in (12, 16):
+            expected, records = self.decode(tag_size)
+
+            self.assertEqual([tag and tag.epc_uri for tag in expected], records)
+
+    def test_decode_shared_memory_spawn(self):
+        expected, records = self.decode(
+            16,
+            convert=operator.attrgetter("epc_uri"),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        self.assertEqual([tag and tag.epc_uri for tag in expected], records)
+
+    def test_record_too_small(self):
+        tags = self.shared_memory(12)
+        tags.buf[:12] = bytes.fromhex("3074257BF7194E4000001A85")
+        output = self.shared_memory(8)
+
+        self.assertEqual(
+            1, decode_shared_memory(tags, output, 1, record_size=8, workers=1)
+        )
+        self.assertEqual([None], read_shared_records(output, 1, record_size=8))
+
+    def test_invalid_arguments(self):
+        tags = self.shared_memory(24)
+        output = self.shared_memory(128)
+
+        with self.assertRaises(ValueError):
+            decode_shared_memory(tags, output, 2, tag_size=8)
+        with self.assertRaises(ValueError):
+            decode_shared_memory(tags, output, 3)
+        with self.assertRaises(ValueError):
+            decode_shared_memory(tags, output, 2, record_size=65)
+        with self.assertRaises(ValueError):
+            decode_shared_memory(tags, output, 2, workers=0)
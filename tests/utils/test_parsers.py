@@ -1,6 +1,19 @@
+import random
 import unittest
 
 from epcpy import (
+    base64_to_tag_encodable,
+    base64_to_tag_encodables,
+    base64_to_tag_fields,
+    binary_to_tag_encodable,
+    binary_to_tag_encodables,
+    binary_to_tag_fields,
+    bytes_to_tag_encodable,
+    bytes_to_tag_encodables,
+    bytes_to_tag_fields,
+    clear_decode_cache,
+    configure_decode_cache,
+    decode_cache_info,
     epc_pure_identity_to_gs1_element,
     epc_pure_identity_to_gs1_element_string,
     epc_pure_identity_to_gs1_key,
@@ -9,9 +22,22 @@ from epcpy import (
     epc_pure_identity_to_tag_encodable,
     get_gs1_key,
     hex_to_tag_encodable,
+    hex_to_tag_encodables,
+    hex_to_tag_fields,
     tag_uri_to_tag_encodable,
 )
-from epcpy.utils.common import ConvertException
+from epcpy.epc_schemes import ADI, GID, SGTIN
+from epcpy.utils.common import (
+    ConvertException,
+    hex_to_base64,
+    hex_to_binary,
+    parse_header_and_truncate_binary,
+)
+from epcpy.utils.parsers import (
+    TAG_ENCODABLE_CLASSES,
+    TAG_ENCODABLE_HEADER_TABLE,
+    gs1_element_string_to_gs1_element,
+)
 from tests.utils.test_data import (
     INVALID_ID_PATTERNS,
     VALID_ID_PATTERNS,
@@ -85,6 +111,14 @@ class TestParsersValid(unittest.TestCase):
 
                 self.assertEqual(expected_scheme, actual_scheme)
 
+    def test_bytes_to_tag_encodable(self):
+        for epc in VALID_TEST_DATA:
+            if epc["tag_encodable"]:
+                expected_scheme = epc["scheme"].from_epc_uri(epc["uri"])
+                actual_scheme = bytes_to_tag_encodable(bytes.fromhex(epc["hex"]))
+
+                self.assertEqual(expected_scheme, actual_scheme)
+
 
 class TestParsersInvalid(unittest.TestCase):
     def test_invalid_epc_pure_identity_to_gs1_element(self):
@@ -124,6 +158,306 @@ class TestParsersInvalid(unittest.TestCase):
             tag_uri_to_tag_encodable("urn:epc:tag:imovn-96:0.9176187")
 
 
+class TestHeaderTable(unittest.TestCase):
+    def test_header_table(self):
+        self.assertEqual(256, len(TAG_ENCODABLE_HEADER_TABLE))
+
+        headers = set()
+        for cls in TAG_ENCODABLE_CLASSES:
+            for binary_header, coding_scheme in cls.header_to_schemes().items():
+                header = int(binary_header, 2)
+                headers.add(header)
+
+                entry = TAG_ENCODABLE_HEADER_TABLE[header]
+                self.assertIs(cls, entry.scheme)
+                self.assertIs(coding_scheme, entry.coding_scheme)
+                self.assertIs(cls._header_layouts[header], entry.layout)
+
+        for header, entry in enumerate(TAG_ENCODABLE_HEADER_TABLE):
+            self.assertEqual(header in headers, entry is not None)
+
+        self.assertEqual(96, TAG_ENCODABLE_HEADER_TABLE[0b00110000].size)
+        self.assertEqual(198, TAG_ENCODABLE_HEADER_TABLE[0b00110110].size)
+        self.assertIsNone(TAG_ENCODABLE_HEADER_TABLE[0b00111011].size)
+
+    def test_unknown_header(self):
+        for source in ["FF74257BF7194E4000001A85", "30"]:
+            with self.assertRaises(ConvertException):
+                hex_to_tag_encodable(source)
+
+    def test_header_to_schemes(self):
+        self.assertIs(SGTIN.header_to_schemes(), SGTIN.header_to_schemes())
+        self.assertEqual(
+            {"00111011": ADI.BinaryCodingScheme.ADI_VAR}, ADI.header_to_schemes()
+        )
+        with self.assertRaises(TypeError):
+            SGTIN.header_to_schemes()["00000000"] = SGTIN.BinaryCodingScheme.SGTIN_96
+
+    def test_parse_header_and_truncate_binary(self):
+        binary = "00110000" + "0" * 100
+        self.assertEqual(
+            (SGTIN.BinaryCodingScheme.SGTIN_96, binary[:96]),
+            parse_header_and_truncate_binary(binary, SGTIN.header_to_schemes()),
+        )
+        self.assertEqual(
+            (ADI.BinaryCodingScheme.ADI_VAR, "00111011"),
+            parse_header_and_truncate_binary("00111011", ADI.header_to_schemes()),
+        )
+        with self.assertRaises(ConvertException):
+            parse_header_and_truncate_binary(binary[:90], SGTIN.header_to_schemes())
+        with self.assertRaises(ConvertException):
+            parse_header_and_truncate_binary(binary, ADI.header_to_schemes())
+
+
+class TestTagFieldParsers(unittest.TestCase):
+    def assertFieldsMatchScheme(self, binary_string):
+        try:
+            scheme = binary_to_tag_encodable(binary_string)
+        except ConvertException:
+            with self.assertRaises(ConvertException):
+                binary_to_tag_fields(binary_string)
+            return
+
+        coding_scheme, _, *components = binary_to_tag_fields(binary_string)
+        self.assertEqual(
+            scheme.epc_uri,
+            f"urn:epc:id:{coding_scheme.split('-')[0]}:{'.'.join(components)}",
+        )
+
+    def test_tag_fields(self):
+        for epc in VALID_TEST_DATA:
+            if epc["tag_encodable"]:
+                coding_scheme, value = epc["tag_uri"].split(":")[3:5]
+                filter_value = (
+                    int(value.split(".")[0]) if epc["scheme"] is not GID else None
+                )
+                expected = (
+                    coding_scheme,
+                    filter_value,
+                    *epc["uri"].split(":")[4].split("."),
+                )
+                tag_bytes = bytes.fromhex(epc["hex"])
+
+                with self.subTest(tag_uri=epc["tag_uri"]):
+                    self.assertEqual(expected, hex_to_tag_fields(epc["hex"]))
+                    self.assertEqual(expected, binary_to_tag_fields(epc["binary"]))
+                    self.assertEqual(expected, bytes_to_tag_fields(tag_bytes))
+                    self.assertEqual(
+                        expected, base64_to_tag_fields(hex_to_base64(epc["hex"]))
+                    )
+
+    def test_differential(self):
+        rnd = random.Random(0)
+
+        for epc in VALID_TEST_DATA:
+            if epc["tag_encodable"]:
+                binary = epc["binary"]
+                for _ in range(20):
+                    i = rnd.randrange(8, len(binary))
+                    flipped = "1" if binary[i] == "0" else "0"
+                    self.assertFieldsMatchScheme(
+                        f"{binary[:i]}{flipped}{binary[i + 1:]}"
+                    )
+
+    def test_invalid(self):
+        for hex_string in ["FF74257BF7194E4000001A85", "3074257B", "30", ""]:
+            with self.subTest(hex_string=hex_string), self.assertRaises(
+                ConvertException
+            ):
+                hex_to_tag_fields(hex_string)
+
+    def test_invalid_components(self):
+        for hex_string in [
+            # SGTIN-198 serials A$B, A B and an empty serial
+            "3674257BF7194E60A48400000000000000000000000000000000",
+            "3674257BF7194E60A08400000000000000000000000000000000",
+            "3674257BF7194E40000000000000000000000000000000000000",
+        ]:
+            with self.subTest(hex_string=hex_string):
+                with self.assertRaises(ConvertException):
+                    hex_to_tag_fields(hex_string)
+
+                self.assertFieldsMatchScheme(hex_to_binary(hex_string))
+
+
+class TestBatchParsers(unittest.TestCase):
+    def test_batch(self):
+        data = [epc for epc in VALID_TEST_DATA if epc["tag_encodable"]]
+        expected = [epc["scheme"](epc["uri"]) for epc in data]
+
+        for parser, sources in [
+            (hex_to_tag_encodables, [epc["hex"] for epc in data]),
+            (binary_to_tag_encodables, [epc["binary"] for epc in data]),
+            (bytes_to_tag_encodables, [bytes.fromhex(epc["hex"]) for epc in data]),
+            (base64_to_tag_encodables, [hex_to_base64(epc["hex"]) for epc in data]),
+        ]:
+            self.assertEqual(expected, parser(sources))
+
+    def test_batch_errors(self):
+        results = hex_to_tag_encodables(
+            [
+                "3074257BF7194E4000001A85",
+                "FF74257BF7194E4000001A85",
+                "3074257BF7194E40",
+                "3074257BF7194E4000001A85",
+            ]
+        )
+
+        self.assertEqual(4, len(results))
+        self.assertEqual(hex_to_tag_encodable("3074257BF7194E4000001A85"), results[0])
+        self.assertIsInstance(results[1], ConvertException)
+        self.assertIsInstance(results[2], ConvertException)
+        self.assertIs(results[0], results[3])
+
+    def test_batch_invalid_bytes(self):
+        tag_bytes = bytes.fromhex("3074257BF7194E4000001A85")
+
+        results = bytes_to_tag_encodables(
+            [bytearray(tag_bytes), "3074257BF7194E4000001A85", memoryview(tag_bytes)]
+        )
+
+        self.assertEqual(hex_to_tag_encodable("3074257BF7194E4000001A85"), results[0])
+        self.assertIsInstance(results[1], ConvertException)
+        self.assertIs(results[0], results[2])
+
+    def test_batch_invalid_base64(self):
+        results = base64_to_tag_encodables(["MHQle/cZTkAAABqF", "MHQlB"])
+
+        self.assertEqual(hex_to_tag_encodable("3074257BF7194E4000001A85"), results[0])
+        self.assertIsInstance(results[1], ConvertException)
+
+    def test_batch_empty(self):
+        self.assertEqual([], hex_to_tag_encodables([]))
+
+
+class TestDecodeCache(unittest.TestCase):
+    def setUp(self):
+        configure_decode_cache(maxsize=2)
+
+    def tearDown(self):
+        configure_decode_cache(maxsize=0)
+
+    def test_repeated_reads(self):
+        for epc in VALID_TEST_DATA:
+            if not epc["tag_encodable"]:
+                continue
+
+            for parser, source in [
+                (hex_to_tag_encodable, epc["hex"]),
+                (binary_to_tag_encodable, epc["binary"]),
+                (base64_to_tag_encodable, hex_to_base64(epc["hex"])),
+                (bytes_to_tag_encodable, bytes.fromhex(epc["hex"])),
+                (tag_uri_to_tag_encodable, epc["tag_uri"]),
+            ]:
+                first = parser(source)
+
+                self.assertIs(first, parser(source))
+                self.assertEqual(epc["scheme"](epc["uri"]), first)
+
+    def test_statistics(self):
+        hex_to_tag_encodable("3074257BF7194E4000001A85")
+        hex_to_tag_encodable("3074257BF7194E4000001A85")
+        hex_to_tag_encodable("3074257BF7194E4000001A86")
+        hex_to_tag_encodable("3074257BF7194E4000001A87")
+
+        self.assertEqual((1, 3, 2, 2), decode_cache_info())
+
+        clear_decode_cache()
+
+        self.assertEqual((0, 0, 2, 0), decode_cache_info())
+
+    def test_bytes(self):
+        tag_bytes = bytes.fromhex("3074257BF7194E4000001A85")
+
+        first = bytes_to_tag_encodable(tag_bytes)
+
+        self.assertIs(first, bytes_to_tag_encodable(tag_bytes))
+        self.assertIs(first, bytes_to_tag_encodable(bytearray(tag_bytes)))
+        self.assertEqual((2, 1, 2, 1), decode_cache_info())
+
+    def test_bytes_batch(self):
+        tag_bytes = bytes.fromhex("3074257BF7194E4000001A85")
+
+        first, second = bytes_to_tag_encodables([tag_bytes, tag_bytes])
+        self.assertEqual((0, 1, 2, 1), decode_cache_info())
+
+        (third,) = bytes_to_tag_encodables([tag_bytes])
+        self.assertIs(first, second)
+        self.assertIs(first, third)
+        self.assertIs(first, bytes_to_tag_encodable(tag_bytes))
+        self.assertEqual((2, 1, 2, 1), decode_cache_info())
+
+    def test_bytearray_batch(self):
+        tag_bytes = bytes.fromhex("3074257BF7194E4000001A85")
+
+        first, second = bytes_to_tag_encodables(
+            [bytearray(tag_bytes), bytearray(tag_bytes)]
+        )
+        self.assertIs(first, second)
+        self.assertEqual((0, 1, 2, 1), decode_cache_info())
+
+        self.assertIs(first, bytes_to_tag_encodables([bytearray(tag_bytes)])[0])
+        self.assertEqual((1, 1, 2, 1), decode_cache_info())
+
+    def test_sources_do_not_collide(self):
+        binary = "001100000111010000100101011110111111011100011001010011100100000000000000000000000001101010000101"
+
+        self.assertEqual(
+            hex_to_tag_encodable("3074257BF7194E4000001A85"),
+            binary_to_tag_encodable(binary),
+        )
+        self.assertEqual(0, decode_cache_info().hits)
+
+    def test_invalid_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ConvertException):
+                hex_to_tag_encodable("FF74257BF7194E4000001A85")
+
+        self.assertEqual((0, 2, 2, 0), decode_cache_info())
+
+    def test_disabled(self):
+        configure_decode_cache(maxsize=0)
+
+        self.assertIsNot(
+            hex_to_tag_encodable("3074257BF7194E4000001A85"),
+            hex_to_tag_encodable("3074257BF7194E4000001A85"),
+        )
+        self.assertEqual((0, 0, 0, 0), decode_cache_info())
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            configure_decode_cache(maxsize=-1)
+
+
+class TestGS1ElementStringParser(unittest.TestCase):
+    def test_gs1_element_string_to_gs1_element(self):
+        for epc in VALID_TEST_DATA:
+            if epc.get("gs1_element_string"):
+                company_prefix_length = len(epc["uri"].split(":")[4].split(".")[0])
+                scheme = gs1_element_string_to_gs1_element(
+                    epc["gs1_element_string"], company_prefix_length
+                )
+
+                self.assertEqual(epc["scheme"], type(scheme))
+                self.assertEqual(epc["uri"], scheme.epc_uri)
+
+    def test_parentheses_in_serial(self):
+        self.assertEqual(
+            "urn:epc:id:sgtin:0614141.812345.(AB)",
+            gs1_element_string_to_gs1_element("(01)80614141123458(21)(AB)", 7).epc_uri,
+        )
+
+    def test_invalid(self):
+        for element_string in [
+            "(01)80614141123458(22)6789",
+            "(01)8061414112345(21)6789",
+            "(99)80614141123458",
+            "01",
+        ]:
+            with self.assertRaises(ConvertException):
+                gs1_element_string_to_gs1_element(element_string, 7)
+
+
 class TestGS1KeyParser(unittest.TestCase):
     def test_source_epc_uri(self):
         for epc in VALID_TEST_DATA:
@@ -140,7 +474,7 @@ class TestGS1KeyParser(unittest.TestCase):
                 actual_gs1_key = get_gs1_key(
                     epc["gs1_element_string"],
                     company_prefix_length=epc["company_prefix_length"],
-                    **epc["kwargs"] if "kwargs" in epc else {}
+                    **epc["kwargs"] if "kwargs" in epc else {},
                 )
 
                 self.assertEqual(epc["gs1_key"], actual_gs1_key)
@@ -184,3 +518,23 @@ class TestGS1KeyParser(unittest.TestCase):
         for epc in INVALID_ID_PATTERNS:
             with self.assertRaises(ConvertException):
                 get_gs1_key(epc["idpat"], **epc["kwargs"] if "kwargs" in epc else {})
+
+    def test_source_lgtin_class(self):
+        self.assertEqual(
+            "04012345123456", get_gs1_key("urn:epc:class:lgtin:4012345.012345.998877")
+        )
+
+    def test_source_invalid(self):
+        for source in [
+            "urn:epc:id:sgtin:0614141.812345.67 89",
+            "urn:epc:id:unknown:0614141.812345.6789",
+            "urn:epc:tag:sgtin-97:3.0614141.812345.6789",
+            "urn:epc:idpat:sgtin:0614141.*.6789",
+            "urn:epc:idpat:gid:95100000.12345.*",
+            "(01)80614141123458(21)6789",
+            "(99)80614141123458",
+            "FF74257BF7194E4000001A85",
+            "",
+        ]:
+            with self.assertRaises(ConvertException):
+                get_gs1_key(source)
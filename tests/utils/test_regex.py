@@ -0,0 +1,30 @@
+import re
+import unittest
+
+from epcpy.utils.regex import SGTIN_URI, LazyRegex
+
+
+class TestLazyRegex(unittest.TestCase):
+    def test_matches(self):
+        regex = LazyRegex(SGTIN_URI)
+        compiled = re.compile(SGTIN_URI)
+
+        for uri in [
+            "urn:epc:id:sgtin:0614141.812345.6789",
+            "urn:epc:id:sgtin:0614141.812345.67 89",
+            "urn:epc:id:sgtin:0614141.812345.6789 ",
+        ]:
+            with self.subTest(uri=uri):
+                self.assertEqual(
+                    bool(compiled.fullmatch(uri)), bool(regex.fullmatch(uri))
+                )
+                self.assertEqual(bool(compiled.match(uri)), bool(regex.match(uri)))
+                self.assertEqual(bool(compiled.search(uri)), bool(regex.search(uri)))
+
+    def test_compiled_once(self):
+        regex = LazyRegex(SGTIN_URI)
+        self.assertNotIn("fullmatch", vars(regex))
+
+        regex.match("urn:epc:id:sgtin:0614141.812345.6789")
+
+        self.assertEqual(re.compile(SGTIN_URI).fullmatch, vars(regex)["fullmatch"])
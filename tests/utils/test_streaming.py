@@ -0,0 +1,98 @@
+import asyncio
+import operator
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from epcpy.utils.common import ConvertException
+from epcpy.utils.parsers import hex_to_tag_encodables
+from epcpy.utils.streaming import decode_stream
+from tests.utils.test_data import VALID_TEST_DATA
+
+HEX_STRINGS = [epc["hex"] for epc in VALID_TEST_DATA if epc["tag_encodable"]] + ["FF"]
+
+
+async def stream(sources, delay=0):
+    for source in sources:
+        await asyncio.sleep(delay)
+        yield source
+
+
+async def collect(results):
+    return [result async for result in results]
+
+
+class TestDecodeStream(unittest.IsolatedAsyncioTestCase):
+    async def test_decode_stream(self):
+        expected = hex_to_tag_encodables(HEX_STRINGS)
+        results = await collect(decode_stream(stream(HEX_STRINGS), batch_size=3))
+
+        self.assertEqual(len(expected), len(results))
+        for e, r in zip(expected, results):
+            if isinstance(e, ConvertException):
+                self.assertIsInstance(r, ConvertException)
+            else:
+                self.assertEqual(e, r)
+
+    async def test_convert(self):
+        with ThreadPoolExecutor(2) as executor:
+            results = await collect(
+                decode_stream(
+                    stream(["3074257BF7194E4000001A85"] * 5),
+                    convert=operator.methodcaller("gs1_key"),
+                    batch_size=2,
+                    executor=executor,
+                )
+            )
+
+        self.assertEqual(["80614141123458"] * 5, results)
+
+    async def test_deadline(self):
+        received = asyncio.Event()
+
+        async def sources():
+            yield "3074257BF7194E4000001A85"
+            await received.wait()
+            yield "3074257BF7194E4000001A86"
+
+        results = decode_stream(sources(), batch_size=100, max_delay=0.01)
+
+        first = await asyncio.wait_for(results.__anext__(), 1)
+        received.set()
+        second = await asyncio.wait_for(results.__anext__(), 1)
+
+        self.assertEqual("urn:epc:id:sgtin:0614141.812345.6789", first.epc_uri)
+        self.assertEqual("urn:epc:id:sgtin:0614141.812345.6790", second.epc_uri)
+
+    async def test_backpressure(self):
+        produced = 0
+
+        async def sources():
+            nonlocal produced
+            while True:
+                produced += 1
+                yield "3074257BF7194E4000001A85"
+
+        results = decode_stream(sources(), batch_size=10, max_pending=2)
+        await results.__anext__()
+        await asyncio.sleep(0.1)
+
+        self.assertLessEqual(produced, 10 * 5)
+        await results.aclose()
+
+    async def test_source_exception(self):
+        async def sources():
+            yield "3074257BF7194E4000001A85"
+            raise RuntimeError("Reader disconnected")
+
+        with self.assertRaises(RuntimeError):
+            await collect(decode_stream(sources(), batch_size=1))
+
+    async def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            await collect(decode_stream(stream([]), source_format="uri"))
+        with self.assertRaises(ValueError):
+            await collect(decode_stream(stream([]), batch_size=0))
+        with self.assertRaises(ValueError):
+            await collect(decode_stream(stream([]), max_delay=-1))
+        with self.assertRaises(ValueError):
+            await collect(decode_stream(stream([]), max_pending=0))
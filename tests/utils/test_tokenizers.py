@@ -0,0 +1,157 @@
+import random
+import re
+import unittest
+
+from epcpy.utils import regex
+from epcpy.utils.regex import EPC_URIS
+from epcpy.utils.tokenizers import (
+    EPC_URI_TOKENIZERS,
+    GS1_ELEMENT_STRING_TOKENIZERS,
+    gs1_element_string_identifier,
+)
+from tests.utils.test_data import VALID_TEST_DATA
+
+EPC_URI_PATTERNS = {identifier: re.compile(uri) for identifier, uri in EPC_URIS.items()}
+
+GS1_ELEMENT_STRING_PATTERNS = {
+    identifier: re.compile(getattr(regex, f"{identifier.upper()}_GS1_ELEMENT_STRING"))
+    for identifier in GS1_ELEMENT_STRING_TOKENIZERS
+}
+
+SEED_URIS = [epc["uri"] for epc in VALID_TEST_DATA] + [
+    "urn:epc:id:adi:2S194..%23A%2F1",
+    "urn:epc:id:cpi:0614141.A%2F%23-.0",
+    "urn:epc:id:sgtin:0614141.812345.%4",
+    "urn:epc:id:sgtin:0614141.812345.6:7.8",
+    "urn:epc:id:giai:0614141.12:34",
+    "urn:epc:id:imovn:9176187",
+    "urn:epc:class:lgtin:0614141.812345.AB.C",
+]
+
+SEED_ELEMENT_STRINGS = [
+    epc["gs1_element_string"]
+    for epc in VALID_TEST_DATA
+    if epc.get("gs1_element_string")
+] + [
+    "(8010)0614141(8011)1",
+    "(8004)0614141٣000A",
+    "(01)80614141123458(21)(AB)",
+    "(8003)00614141123452AB",
+    "(401)061414112345A",
+]
+
+MUTATIONS = list("0123456789.:%aAfFgGzZ-,/#_IOJUS!*()?\n٣") + [
+    "%2F",
+    "%23",
+    "%2f",
+    "(21)",
+    "(10)",
+    "(235)",
+    "(8011)",
+    "",
+]
+
+
+def mutate(uri: str, rnd: random.Random) -> str:
+    for _ in range(rnd.randint(1, 3)):
+        i = rnd.randint(0, len(uri))
+        operation = rnd.random()
+        if operation < 0.4:
+            uri = f"{uri[:i]}{rnd.choice(MUTATIONS)}{uri[i:]}"
+        elif operation < 0.7:
+            uri = f"{uri[:i]}{uri[i + 1:]}"
+        else:
+            uri = f"{uri[:i]}{rnd.choice(MUTATIONS)}{uri[i + 1:]}"
+
+    return uri
+
+
+class TestEPCURITokenizers(unittest.TestCase):
+    def assertMatchesRegex(self, uri: str):
+        for identifier, pattern in EPC_URI_PATTERNS.items():
+            components = EPC_URI_TOKENIZERS[identifier].tokenize(uri)
+            if bool(pattern.fullmatch(uri)) != (components is not None):
+                self.fail(f"{identifier} tokenizer differs from regex for {uri!r}")
+
+    def test_identifiers(self):
+        self.assertEqual(EPC_URIS.keys(), EPC_URI_TOKENIZERS.keys())
+
+    def test_differential(self):
+        rnd = random.Random(0)
+
+        for uri in SEED_URIS:
+            self.assertMatchesRegex(uri)
+
+            for _ in range(200):
+                self.assertMatchesRegex(mutate(uri, rnd))
+
+    def test_quirks(self):
+        tokenizer = EPC_URI_TOKENIZERS["sgtin"]
+
+        # \d matches any unicode decimal digit
+        self.assertIsNotNone(tokenizer.tokenize("urn:epc:id:sgtin:٣.812345.1"))
+        # An escape only requires a single hexadecimal digit
+        self.assertIsNotNone(tokenizer.tokenize("urn:epc:id:sgtin:0614141.812345.%A"))
+        # ,-. is a range of characters, including the dot
+        self.assertIsNotNone(tokenizer.tokenize("urn:epc:id:sgtin:0614141.812345.,-."))
+        self.assertIsNone(tokenizer.tokenize("urn:epc:id:sgtin:0614141.812345.%G"))
+
+    def test_components(self):
+        self.assertEqual(
+            ["0614141", "812345", "6:7.8"],
+            EPC_URI_TOKENIZERS["sgtin"].tokenize(
+                "urn:epc:id:sgtin:0614141.812345.6:7.8"
+            ),
+        )
+        self.assertEqual(
+            ["2S194", "", "%23A%2F1"],
+            EPC_URI_TOKENIZERS["adi"].tokenize("urn:epc:id:adi:2S194..%23A%2F1"),
+        )
+        self.assertEqual(
+            ["CSQU3054383"],
+            EPC_URI_TOKENIZERS["bic"].tokenize("urn:epc:id:bic:CSQU3054383"),
+        )
+
+
+class TestGS1ElementStringTokenizers(unittest.TestCase):
+    def assertMatchesRegex(self, element_string: str):
+        for identifier, pattern in GS1_ELEMENT_STRING_PATTERNS.items():
+            matches = bool(pattern.fullmatch(element_string))
+            values = GS1_ELEMENT_STRING_TOKENIZERS[identifier].tokenize(element_string)
+
+            if matches != (values is not None):
+                self.fail(
+                    f"{identifier} tokenizer differs from regex for {element_string!r}"
+                )
+            if matches and gs1_element_string_identifier(element_string) != identifier:
+                self.fail(f"{element_string!r} not identified as {identifier}")
+
+    def test_differential(self):
+        rnd = random.Random(0)
+
+        for element_string in SEED_ELEMENT_STRINGS:
+            self.assertMatchesRegex(element_string)
+
+            for _ in range(200):
+                self.assertMatchesRegex(mutate(element_string, rnd))
+
+    def test_values(self):
+        self.assertEqual(
+            ("80614141123458", "(AB)"),
+            GS1_ELEMENT_STRING_TOKENIZERS["sgtin"].tokenize(
+                "(01)80614141123458(21)(AB)"
+            ),
+        )
+        self.assertEqual(
+            ("0614141ABC", "12"),
+            GS1_ELEMENT_STRING_TOKENIZERS["cpi"].tokenize("(8010)0614141ABC(8011)12"),
+        )
+
+    def test_identifier(self):
+        self.assertEqual(
+            "upui", gs1_element_string_identifier("(01)80614141123458(235)1")
+        )
+        self.assertEqual("sscc", gs1_element_string_identifier("(00)1"))
+        self.assertIsNone(gs1_element_string_identifier("(01)80614141123458(22)1"))
+        self.assertIsNone(gs1_element_string_identifier("(99)1"))
+        self.assertIsNone(gs1_element_string_identifier("01"))